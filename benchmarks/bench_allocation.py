@@ -0,0 +1,58 @@
+"""
+Supply allocation over 1k / 10k / 50k hubs and a few hundred disaster
+zones: full min-cost solve vs. incremental re-solve after a single hub's
+stock changes. Also checks the incremental plan costs exactly as much as
+solving the final state from scratch.
+
+Run from the repository root:
+    python benchmarks/bench_allocation.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from allocation import AllocationPlanner
+
+ITEMS = ["Water (Liters)", "Medical Kits", "Food Parcels"]
+UPDATES = 50
+
+
+def random_points(rng, n):
+    lats = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+    lons = rng.uniform(-180, 180, n)
+    return lats, lons
+
+
+def run(n_hubs, n_zones):
+    rng = np.random.default_rng(n_hubs)
+    hub_lats, hub_lons = random_points(rng, n_hubs)
+    zone_lats, zone_lons = random_points(rng, n_zones)
+    supply = rng.integers(0, 1000, (n_hubs, len(ITEMS)))
+    # Zones ask for roughly half of everything on the grid
+    demand = rng.dirichlet(np.ones(n_zones), len(ITEMS)).T * supply.sum(axis=0) * 0.5
+    demand = demand.astype(np.int64)
+
+    start = time.perf_counter()
+    planner = AllocationPlanner(hub_lats, hub_lons, zone_lats, zone_lons, supply, demand, ITEMS)
+    solve_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(UPDATES):
+        hub, col = int(rng.integers(n_hubs)), int(rng.integers(len(ITEMS)))
+        supply[hub, col] = max(0, supply[hub, col] + int(rng.integers(-800, 800)))
+        planner.update_supply(hub, ITEMS[col], supply[hub, col])
+    update_ms = (time.perf_counter() - start) / UPDATES * 1000
+
+    fresh = AllocationPlanner(hub_lats, hub_lons, zone_lats, zone_lons, supply, demand, ITEMS)
+    assert abs(fresh.total_cost() - planner.total_cost()) <= 1e-6 * fresh.total_cost()
+    print(f"{n_hubs:>7,} hubs x {n_zones} zones x {len(ITEMS)} items | full solve {solve_s:7.2f} s | "
+          f"incremental update {update_ms:8.2f} ms | {len(planner.shipments()):,} shipments")
+
+
+if __name__ == "__main__":
+    for hubs in (1_000, 10_000, 50_000):
+        run(hubs, 200)
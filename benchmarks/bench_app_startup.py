@@ -0,0 +1,50 @@
+"""
+Cold first paint of the Streamlit app, page by page. Each page is opened
+as the first page of a fresh interpreter (Streamlit's own import is
+excluded) and rendered once headless with streamlit.testing; the report
+shows how long that took and which heavy modules it had to import.
+
+Run from the repository root:
+    python benchmarks/bench_app_startup.py [repeat]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+PAGES = ["Home", "Precautionary", "Volunteer", "Contacts", "Awareness", "Dashboard"]
+HEAVY = ["pandas", "plotly.express", "plotly.graph_objects", "numpy", "models"]
+
+CHILD = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+before = set(sys.modules)
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state["page"] = {page!r}
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+assert not at.exception, at.exception
+loaded = [m for m in {heavy!r} if m in sys.modules and m not in before]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def first_paint(page):
+    code = CHILD.format(app=os.path.join(ROOT, "src", "app.py"), page=page, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(repeat=3):
+    print(f"{'page':<14} {'first paint':>12}  heavy imports")
+    for page in PAGES:
+        runs = [first_paint(page) for _ in range(repeat)]
+        median = statistics.median(r["seconds"] for r in runs)
+        print(f"{page:<14} {median * 1000:>9,.0f} ms  {', '.join(runs[0]['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
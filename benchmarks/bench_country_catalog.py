@@ -0,0 +1,84 @@
+"""
+Country identity through the catalog's integer IDs.
+
+1. Lookup: resolves a stream of country names in mixed spellings (catalog
+   names, aliases, other case and accents) through the precomputed tables,
+   against normalizing every name and probing the normalized table.
+2. Join: emergency numbers for every hub within reach of each disaster
+   zone, as one gather over the hubs' country IDs against one registry
+   dict probe per hub by country name.
+
+Run from the repository root:
+    python benchmarks/bench_country_catalog.py [hubs] [lookups]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from country_catalog import ALIASES, COUNTRIES, LOOKUP, country_id, country_key
+from emergency_registry import EmergencyRegistry
+from inventory_store import InventoryStore
+from spatial_index import GeoGridIndex
+
+RADIUS_KM = 500
+REPEAT = 5
+
+
+def best_of(fn):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def spellings(rng, n):
+    names = COUNTRIES + [a for aliases in ALIASES.values() for a in aliases]
+    names += [name.upper() for name in COUNTRIES] + ["Turkiye", "cote d'ivoire", "Sao Tome & Principe"]
+    return [names[i] for i in rng.integers(0, len(names), n)]
+
+
+def main(n_hubs=200_000, n_lookups=200_000):
+    rng = np.random.default_rng(0)
+
+    # 1. Name resolution
+    names = spellings(rng, n_lookups)
+    table_s, ids = best_of(lambda: [country_id(name) for name in names])
+    normalized_s, expected = best_of(lambda: [LOOKUP.get(country_key(name)) for name in names])
+    assert ids == expected and None not in ids, "lookup tables disagree"
+    print(f"Lookup: {n_lookups:,} names in mixed spellings | tables {n_lookups / table_s:12,.0f} /s | "
+          f"normalize every name {n_lookups / normalized_s:10,.0f} /s")
+
+    # 2. Hubs around disaster zones joined with their countries' hotlines
+    store = InventoryStore(row_capacity=n_hubs)
+    lats, lons = rng.uniform(-60, 70, n_hubs), rng.uniform(-180, 180, n_hubs)
+    for i, name in enumerate(rng.choice(names, n_hubs).tolist()):
+        store.add_center(f"Hub-{i}", name, lat=lats[i], lon=lons[i])
+    index = GeoGridIndex(lats, lons)
+    zones = [(36.2, 36.1), (35.6, 139.6), (-6.2, 106.8), (34.0, -118.2), (-33.4, -70.6), (27.7, 85.3)]
+    hits = [index.within(lat, lon, RADIUS_KM)[0] for lat, lon in zones]
+    rows = np.concatenate(hits)
+    registry = EmergencyRegistry()
+    contacts = registry.contacts
+
+    def gathered():
+        numbers, listed = registry.gather(store.country_ids[rows])
+        return int(listed.sum())
+
+    def probed():
+        return sum(1 for r in rows.tolist() if contacts.get(store.countries[store.country_ids[r]]))
+
+    gather_s, listed = best_of(gathered)
+    probe_s, expected = best_of(probed)
+    assert listed == expected, "gather and probe disagree"
+    print(f"Join: {len(rows):,} hubs within {RADIUS_KM} km of {len(zones)} zones ({listed:,} with hotlines) | "
+          f"gather {gather_s * 1000:6.2f} ms | dict probe per hub {probe_s * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
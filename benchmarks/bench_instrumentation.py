@@ -0,0 +1,71 @@
+"""
+Cost of the hot-path instrumentation: single inventory updates and
+specialty searches on a 10k-center grid, timed in two child processes,
+one with UNITYGRID_METRICS unset and one with it set. Disabled should be
+indistinguishable from uninstrumented code (the decorators return the
+bare function at import).
+
+Run from the repository root:
+    python benchmarks/bench_instrumentation.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+CENTERS = 10_000
+UPDATES = 200_000
+QUERIES = 20_000
+
+CHILD = """
+import os, random, sys, time
+sys.path.insert(0, os.path.join({root!r}, "src"))
+sys.path.insert(0, os.path.join({root!r}, "benchmarks"))
+import synthetic_grid
+from database_helper import DatabaseHelper
+from models import UnityGridEngine
+
+path = os.path.join({workdir!r}, "grid.json")
+if not os.path.exists(path):
+    DatabaseHelper.write_snapshot(synthetic_grid.generate({centers}), path)
+engine = UnityGridEngine(path)
+rng = random.Random(0)
+cities = [f"Hub-{{rng.randrange({centers})}}" for _ in range({updates})]
+start = time.perf_counter()
+for city in cities:
+    engine.update_inventory(city, "Medical Kits", 1)
+update_s = time.perf_counter() - start
+engine.volunteer_index
+start = time.perf_counter()
+for _ in range({queries}):
+    engine.search_volunteers("Medical")
+search_s = time.perf_counter() - start
+print({{"update_ns": update_s / {updates} * 1e9, "search_ns": search_s / {queries} * 1e9}})
+"""
+
+
+def measure(workdir, enabled):
+    env = dict(os.environ)
+    env.pop("UNITYGRID_METRICS", None)
+    if enabled:
+        env["UNITYGRID_METRICS"] = "1"
+        env["UNITYGRID_METRICS_FILE"] = os.path.join(workdir, "metrics.prom")
+    code = CHILD.format(root=ROOT, workdir=workdir, centers=CENTERS, updates=UPDATES, queries=QUERIES)
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1].replace("'", '"'))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        measure(workdir, False)    # builds the grid and warms the page cache
+        off = measure(workdir, False)
+        on = measure(workdir, True)
+    print(f"{'operation':<18} {'disabled':>12} {'enabled':>12} {'overhead':>10}")
+    for name, label in (("update_ns", "update_inventory"), ("search_ns", "search_volunteers")):
+        print(f"{label:<18} {off[name]:>9,.0f} ns {on[name]:>9,.0f} ns {on[name] - off[name]:>+7,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Supply-update throughput of the InventoryStore at 10k and 100k centers,
+compared against the old linear scan over a list of center objects.
+
+Run from the repository root:
+    python benchmarks/bench_inventory_store.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from inventory_store import InventoryStore
+
+ITEMS = ["Water (Liters)", "Medical Kits", "Food Parcels"]
+UPDATES = 200_000
+SCAN_UPDATES = 200
+
+
+class ScanCenter:
+    def __init__(self, city, country):
+        self.city = city
+        self.country = country
+        self.inventory = {item: 0 for item in ITEMS}
+
+
+def scan_update(centers, city, item, qty):
+    for c in centers:
+        if c.city.lower() == city.lower():
+            c.inventory[item] = c.inventory.get(item, 0) + qty
+            return True
+    return False
+
+
+def run(n_centers):
+    rng = random.Random(n_centers)
+    cities = [f"Hub-{i:06d}" for i in range(n_centers)]
+
+    store = InventoryStore()
+    for i, city in enumerate(cities):
+        store.add_center(city, f"Country-{i % 195}", {item: 0 for item in ITEMS})
+    scan = [ScanCenter(city, f"Country-{i % 195}") for i, city in enumerate(cities)]
+
+    ops = [(rng.choice(cities), rng.choice(ITEMS), rng.randint(1, 500)) for _ in range(UPDATES)]
+
+    # 1. Indexed store
+    start = time.perf_counter()
+    for city, item, qty in ops:
+        store.update(city, item, qty)
+    store_rate = UPDATES / (time.perf_counter() - start)
+
+    # 2. Linear scan baseline (sampled; it is too slow to run the full workload)
+    start = time.perf_counter()
+    for city, item, qty in ops[:SCAN_UPDATES]:
+        scan_update(scan, city, item, qty)
+    scan_rate = SCAN_UPDATES / (time.perf_counter() - start)
+
+    # 3. Vectorized rollups
+    start = time.perf_counter()
+    store.global_totals()
+    store.country_totals()
+    rollup_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{n_centers:>8,} centers | indexed: {store_rate:>12,.0f} updates/s | "
+          f"linear scan: {scan_rate:>10,.0f} updates/s | rollups: {rollup_ms:6.2f} ms")
+
+
+if __name__ == "__main__":
+    for n in (10_000, 100_000):
+        run(n)
@@ -0,0 +1,55 @@
+"""
+Per-update persistence cost: full JSON rewrite vs. one WAL append,
+as the grid grows.
+
+Run from the repository root:
+    python benchmarks/bench_journal.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from database_helper import DatabaseHelper
+from inventory_store import InventoryStore
+
+ITEMS = ["Water (Liters)", "Medical Kits", "Food Parcels"]
+APPENDS = 2_000
+
+
+def run(n_centers, workdir):
+    path = os.path.join(workdir, f"grid_{n_centers}.json")
+    store = InventoryStore()
+    for i in range(n_centers):
+        store.add_center(f"Hub-{i}", f"Country-{i % 195}", {item: 100 for item in ITEMS})
+
+    start = time.perf_counter()
+    DatabaseHelper.write_snapshot({"centers": [{"city": c.city, "country": c.country, "inventory": c.inventory}
+                                               for c in store.centers()], "volunteers": []}, path)
+    full_ms = (time.perf_counter() - start) * 1000
+
+    results = []
+    for fsync in (False, True):
+        journal = DatabaseHelper.open_journal(path, fsync=fsync, compact_interval=None)
+        start = time.perf_counter()
+        for i in range(APPENDS):
+            journal.log_inventory(f"Hub-{i % n_centers}", ITEMS[i % 3], 5)
+        results.append((time.perf_counter() - start) / APPENDS * 1e6)
+        journal.close(compact=False)
+
+    journal = DatabaseHelper.open_journal(path, compact_interval=None)
+    start = time.perf_counter()
+    journal.close()
+    compact_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{n_centers:>8,} centers | full save: {full_ms:9.1f} ms/update | "
+          f"WAL append: {results[0]:6.1f} us (flush) {results[1]:7.1f} us (fsync) | "
+          f"compaction of {2 * APPENDS:,} records: {compact_ms:7.1f} ms")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in (1_000, 10_000, 100_000):
+            run(n, workdir)
@@ -0,0 +1,93 @@
+"""
+Continent-sharded global report with 1..N pool workers, on a grid of the
+195 catalog countries with thousands of hubs each. Times the shared-memory
+load (the first one, which also sorts hubs into shards, and a refresh
+after a supply update) apart from the parallel aggregation, and a
+report() on an unchanged store, which skips the load. Reports the speedup
+over one worker and checks every worker count returns the same report.
+
+Run from the repository root:
+    python benchmarks/bench_sharded_aggregation.py [hubs_per_country] [max_workers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import binary_snapshot
+from country_catalog import all_countries
+from models import UnityGridEngine
+from sharded_aggregation import ShardedAggregator
+
+N_ITEMS = 10
+THRESHOLD = 5_000
+REPEAT = 3
+
+
+def build(path, hubs_per_country, seed=0):
+    rng = np.random.default_rng(seed)
+    countries = all_countries()
+    n = len(countries) * hubs_per_country
+    country_ids = rng.permutation(np.repeat(np.arange(len(countries)), hubs_per_country))
+    quantities = rng.integers(0, 10_000, (n, N_ITEMS))
+    stocked = rng.random((n, N_ITEMS)) < 0.9
+    quantities[~stocked] = 0
+    binary_snapshot.write_snapshot(path, [f"Hub-{i}" for i in range(n)], countries, country_ids,
+                                   [f"Supply {k}" for k in range(N_ITEMS)], quantities, stocked, [])
+    return n
+
+
+def best(fn):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main(hubs_per_country=5_000, max_workers=None):
+    max_workers = max_workers or max(os.cpu_count() or 1, 4)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "grid.ugrid")
+        n = build(path, hubs_per_country)
+        engine = UnityGridEngine(path)
+        store = engine.store
+        print(f"{n:,} hubs x {N_ITEMS} items over 195 countries | {os.cpu_count()} CPU(s)")
+
+        def first_load():
+            with ShardedAggregator(1) as fresh:
+                fresh.load(store)
+
+        def refresh():
+            store.update(store.cities[0], store.items[0], 0)
+            aggregator.load(store)
+
+        first_s, _ = best(first_load)
+        with ShardedAggregator(1) as aggregator:
+            aggregator.load(store)
+            refresh_s, _ = best(refresh)
+        print(f"load: first {first_s * 1000:,.0f} ms (sort + copy) | after a supply update "
+              f"{refresh_s * 1000:,.0f} ms (copy only) | unchanged store: skipped")
+        print(f"{'workers':>7} {'shards':>6} {'aggregate':>10} {'report':>9} {'speedup':>8}")
+
+        baseline = reference = None
+        for workers in range(1, max_workers + 1):
+            with ShardedAggregator(workers) as aggregator:
+                aggregator.report(store, THRESHOLD)    # loads and starts the pool outside the timing
+                aggregate_s, report = best(lambda: aggregator.aggregate(THRESHOLD))
+                report_s, _ = best(lambda: aggregator.report(store, THRESHOLD))
+                shards = len(aggregator.tasks)
+            baseline = baseline or aggregate_s
+            reference = reference or report
+            assert report == reference, f"{workers} workers disagree with 1 worker"
+            print(f"{workers:>7} {shards:>6} {aggregate_s * 1000:>7,.0f} ms {report_s * 1000:>6,.0f} ms "
+                  f"{baseline / aggregate_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
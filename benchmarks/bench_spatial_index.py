@@ -0,0 +1,64 @@
+"""
+k-nearest and radius queries over 100k hubs for thousands of disaster
+zones: GeoGridIndex vs. brute-force vectorized haversine. Also checks
+that both return the same answers.
+
+Run from the repository root:
+    python benchmarks/bench_spatial_index.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from spatial_index import GeoGridIndex, haversine_km
+
+K = 5
+RADIUS_KM = 250
+
+
+def random_points(rng, n):
+    # Uniform on the sphere, so polar and antimeridian cells are exercised too
+    lats = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+    lons = rng.uniform(-180, 180, n)
+    return lats, lons
+
+
+def run(n_hubs, n_zones):
+    rng = np.random.default_rng(n_hubs)
+    hub_lats, hub_lons = random_points(rng, n_hubs)
+    zone_lats, zone_lons = random_points(rng, n_zones)
+
+    start = time.perf_counter()
+    index = GeoGridIndex(hub_lats, hub_lons)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    knn = [index.nearest(lat, lon, K)[0] for lat, lon in zip(zone_lats, zone_lons)]
+    knn_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    radius = [index.within(lat, lon, RADIUS_KM)[0] for lat, lon in zip(zone_lats, zone_lons)]
+    radius_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    brute_knn, brute_radius = [], []
+    for lat, lon in zip(zone_lats, zone_lons):
+        dist = haversine_km(lat, lon, hub_lats, hub_lons)
+        brute_knn.append(np.argpartition(dist, K - 1)[:K])
+        brute_radius.append(np.flatnonzero(dist <= RADIUS_KM))
+    brute_s = time.perf_counter() - start
+
+    assert all(set(a) == set(b) for a, b in zip(knn, brute_knn))
+    assert all(set(a) == set(b) for a, b in zip(radius, brute_radius))
+    print(f"{n_hubs:>8,} hubs x {n_zones:>5,} zones | build {build_ms:6.1f} ms | "
+          f"{K}-NN {knn_s / n_zones * 1e6:7.1f} us/zone | {RADIUS_KM} km radius "
+          f"{radius_s / n_zones * 1e6:7.1f} us/zone | brute force (both) {brute_s / n_zones * 1e6:8.1f} us/zone")
+
+
+if __name__ == "__main__":
+    for hubs, zones in ((10_000, 2_000), (100_000, 2_000), (1_000_000, 200)):
+        run(hubs, zones)
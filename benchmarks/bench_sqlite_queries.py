@@ -0,0 +1,101 @@
+"""
+Targeted questions against a SQLite-backed engine, answered by the indexed
+backend queries, next to the same questions answered from the in-memory
+store of a JSON-backed engine holding the same grid:
+
+1. Specialty search (exact, prefix and misspelled queries).
+2. Hubs below a stock threshold for one item.
+3. A country's hubs and its per-item totals, asked for in alias spellings.
+
+Checks both engines agree, and that hubs registered under an alias are
+stored under the catalog name.
+
+Run from the repository root:
+    python benchmarks/bench_sqlite_queries.py [hubs] [volunteers]
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from country_catalog import COUNTRIES, canonical_country
+from database_helper import DatabaseHelper
+from models import UnityGridEngine
+
+ITEMS = ["Water (Liters)", "Medical Kits", "Food Parcels"]
+SPECIALTIES = ["Medical", "Rescue", "Search & Rescue", "Logistics", "Engineer", "Translator"]
+SEARCHES = ["Medical", "rescu", "logistcs", "Search & Rescue"]
+THRESHOLD = 50
+# Aliases and other spellings the hubs are registered and queried under
+SPELLINGS = {"Turkey": "Turkiye", "United States": "USA", "Côte d'Ivoire": "cote d'ivoire"}
+REPEAT = 5
+
+
+def best_of(fn):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def build(json_path, db_path, n_hubs, n_volunteers, seed=0):
+    rng = random.Random(seed)
+    spellings = list(COUNTRIES) + list(SPELLINGS.values())
+    centers = [
+        {"city": f"Hub-{i}", "country": rng.choice(spellings),
+         "inventory": {item: rng.randrange(10_000) for item in ITEMS if rng.random() < 0.9}}
+        for i in range(n_hubs)
+    ]
+    volunteers = [{"name": f"Volunteer {i}", "spec": rng.choice(SPECIALTIES), "contact": f"v{i}@grid.org"}
+                  for i in range(n_volunteers)]
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"centers": centers, "volunteers": volunteers}, f)
+    DatabaseHelper.migrate_json_to_sqlite(json_path, db_path)
+
+
+def compare(label, sqlite_fn, memory_fn, same=lambda a, b: a == b):
+    sqlite_s, answer = best_of(sqlite_fn)
+    memory_s, expected = best_of(memory_fn)
+    assert same(answer, expected), f"{label}: SQLite and in-memory answers differ"
+    print(f"{label:<34} SQLite {sqlite_s * 1000:8.2f} ms | in-memory {memory_s * 1000:8.2f} ms")
+
+
+def main(n_hubs=100_000, n_volunteers=200_000):
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()) as log:
+        json_path, db_path = os.path.join(workdir, "grid.json"), os.path.join(workdir, "grid.db")
+        build(json_path, db_path, n_hubs, n_volunteers)
+        sqlite, memory = UnityGridEngine(db_path), UnityGridEngine(json_path)
+    print(f"{n_hubs:,} hubs, {n_volunteers:,} volunteers")
+
+    for query in SEARCHES:
+        compare(f"Specialty search {query!r}",
+                lambda: sqlite.search_volunteers(query), lambda: memory.search_volunteers(query))
+    for item in ITEMS:
+        # Ties at one quantity may come back in either order
+        compare(f"Hubs below {THRESHOLD} {item}",
+                lambda: sqlite.hubs_below(item, THRESHOLD), lambda: memory.hubs_below(item, THRESHOLD),
+                lambda a, b: sorted(a) == sorted(b) and [q for *_, q in a] == [q for *_, q in b])
+    for country, alias in SPELLINGS.items():
+        compare(f"Hubs in {alias!r}", lambda: sqlite.centers_in(alias), lambda: memory.centers_in(alias))
+        compare(f"Totals of {alias!r}", lambda: sqlite.country_totals(alias),
+                lambda: {k: v for k, v in memory.country_totals(alias).items() if v})
+
+    # A hub registered under an alias is stored, and found, under the catalog name
+    with contextlib.redirect_stdout(log):
+        sqlite.add_center("Hub-new", " türkiye ", {"Medical Kits": 1})
+        sqlite.sqlite.flush()
+    assert "Hub-new" in sqlite.sqlite.centers_in(canonical_country("Turkey"))
+    assert "Hub-new" in sqlite.centers_in("Turkiye")
+    sqlite.sqlite.close()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,65 @@
+"""
+Engine cold-start time: JSON snapshot vs. memory-mapped binary snapshot,
+measured to the first successful hub lookup.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from database_helper import DatabaseHelper
+from models import UnityGridEngine
+
+ITEMS = ["Water (Liters)", "Medical Kits", "Food Parcels"]
+SPECIALTIES = ["Medical", "Rescue", "Logistics", "Engineer"]
+
+
+def build(n_centers, workdir):
+    rng = random.Random(n_centers)
+    data = {
+        "centers": [
+            {"city": f"Hub-{i}", "country": f"Country-{i % 195}",
+             "inventory": {item: rng.randint(0, 10_000) for item in ITEMS}}
+            for i in range(n_centers)
+        ],
+        "volunteers": [
+            {"name": f"Volunteer {i}", "spec": rng.choice(SPECIALTIES), "contact": f"v{i}@grid.org"}
+            for i in range(n_centers * 5)
+        ],
+    }
+    json_path = os.path.join(workdir, f"grid_{n_centers}.json")
+    binary_path = os.path.join(workdir, f"grid_{n_centers}.ugrid")
+    DatabaseHelper.write_snapshot(data, json_path)
+    DatabaseHelper.json_to_binary(json_path, binary_path)
+    assert DatabaseHelper.open_binary(binary_path).to_records() == data
+    return json_path, binary_path
+
+
+def cold_start(path, probe):
+    start = time.perf_counter()
+    engine = UnityGridEngine(path)
+    opened = time.perf_counter() - start
+    engine.store.center(probe).inventory
+    return opened * 1000, (time.perf_counter() - start) * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in (1_000, 10_000, 100_000):
+            json_path, binary_path = build(n, workdir)
+            probe = f"Hub-{n // 2}"
+            json_open, json_first = cold_start(json_path, probe)
+            bin_open, bin_first = cold_start(binary_path, probe)
+            print(f"{n:>8,} centers / {5 * n:>9,} volunteers | JSON: open {json_open:8.1f} ms, "
+                  f"first lookup {json_first:8.1f} ms | mmap: open {bin_open:6.2f} ms, "
+                  f"first lookup {bin_first:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
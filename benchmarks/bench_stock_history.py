@@ -0,0 +1,60 @@
+"""
+Stock history over a simulated year: every hub drains or refills its
+items at a steady seeded rate, sampled once an hour. Reports the cost of
+one sample, memory per hub, and the time to fit a trend and depletion
+forecast for every hub from each tier (a year of daily history for the
+day tier), and checks the fitted rates match the simulated ones.
+
+Run from the repository root:
+    python benchmarks/bench_stock_history.py [hubs] [items]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from inventory_store import InventoryStore
+from stock_history import StockHistory
+
+HOURS = 366 * 24
+REPEAT = 3
+
+
+def main(n_hubs=10_000, n_items=4):
+    rng = np.random.default_rng(0)
+    store = InventoryStore(row_capacity=n_hubs, item_capacity=n_items)
+    items = [f"Supply {k}" for k in range(n_items)]
+    for i in range(n_hubs):
+        store.add_center(f"Hub-{i}", f"Country-{i % 195}", dict.fromkeys(items, 0))
+    rates = rng.integers(-100, 20, (n_hubs, n_items))
+    start_levels = rng.integers(0, 2_000_000, (n_hubs, n_items))
+
+    history = StockHistory()
+    t0 = time.time() - HOURS * 3600
+    start = time.perf_counter()
+    for hour in range(HOURS):
+        store.quantities[:n_hubs, :n_items] = start_levels + rates * hour
+        history.record(store, t0 + hour * 3600)
+    record_ms = (time.perf_counter() - start) / HOURS * 1000
+    print(f"{n_hubs:,} hubs x {n_items} items, {HOURS:,} hourly samples | {record_ms:.2f} ms per sample | "
+          f"{history.nbytes / n_hubs / 1024:.1f} KiB per hub ({history.nbytes / 2**20:,.0f} MiB)")
+
+    for tier in ("minute", "hour", "day"):
+        times = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            hours_left, slopes, _ = history.depletion(tier)
+            times.append(time.perf_counter() - start)
+        samples = len(history.tiers[tier].order())
+        exact = samples < 2 or np.allclose(slopes, rates)
+        draining = int(np.count_nonzero(np.isfinite(hours_left)))
+        print(f"  {tier:>6} tier: {samples:>4} samples | trends + forecast {min(times) * 1000:8.1f} ms | "
+              f"{draining:,} lines draining | rates {'match' if exact else 'DIFFER'}")
+        assert exact, f"{tier} tier fitted the wrong rates"
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,46 @@
+"""
+Specialty-query latency of the VolunteerIndex at 1M volunteers.
+
+Run from the repository root:
+    python benchmarks/bench_volunteer_index.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from volunteer_index import VolunteerIndex
+
+SPECIALTIES = ["Medical", "Rescue", "Search & Rescue", "Logistics", "Engineer",
+               "IT Support", "Translator", "Psychosocial Support", "Water Sanitation"]
+QUERIES = ["Medical", "rescu", "Search & Rescue", "logistcs", "medcal", "support", "Enginer"]
+VOLUNTEERS = 1_000_000
+REPEAT = 1_000
+
+
+def main():
+    rng = random.Random(42)
+    volunteers = [{"name": f"Volunteer {i}", "spec": rng.choice(SPECIALTIES), "contact": f"v{i}@grid.org"}
+                  for i in range(VOLUNTEERS)]
+
+    start = time.perf_counter()
+    index = VolunteerIndex(volunteers)
+    print(f"Indexed {VOLUNTEERS:,} volunteers in {time.perf_counter() - start:.2f} s")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            specs = index.match(query)
+        match_us = (time.perf_counter() - start) / REPEAT * 1e6
+
+        start = time.perf_counter()
+        hits = index.search(query)
+        search_ms = (time.perf_counter() - start) * 1000
+        print(f"{query!r:>20} -> {specs} | match: {match_us:7.1f} us | "
+              f"{len(hits):>8,} hits materialized in {search_ms:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Volunteer roster at 1M volunteers: memory of the old list of dicts vs.
+the struct-of-arrays VolunteerRoster, and specialty filtering by a Python
+scan, by VolunteerIndex postings and by the roster's vectorized mask.
+
+Run from the repository root:
+    python benchmarks/bench_volunteer_roster.py [volunteers]
+"""
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from volunteer_index import VolunteerIndex, normalize_specialty
+from volunteer_roster import VolunteerRoster
+
+SPECIALTIES = ["Medical", "Rescue", "Search & Rescue", "Logistics", "Engineer",
+               "IT Support", "Translator", "Psychosocial Support", "Water Sanitation"]
+QUERIES = ["Medical", "rescue", "support"]
+
+
+def records(n):
+    rng = random.Random(42)
+    return [{"name": f"Volunteer {i}", "spec": rng.choice(SPECIALTIES), "contact": f"v{i}@grid.org"}
+            for i in range(n)]
+
+
+def traced(build):
+    """(result, bytes still allocated by build())."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def best_ms(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(n=1_000_000):
+    volunteers, list_bytes = traced(lambda: records(n))
+    roster, roster_bytes = traced(lambda: VolunteerRoster(volunteers))
+    print(f"{n:,} volunteers")
+    print(f"  list of dicts   {list_bytes / n:7.1f} bytes/volunteer")
+    print(f"  VolunteerRoster {roster_bytes / n:7.1f} bytes/volunteer ({list_bytes / roster_bytes:.1f}x smaller)")
+
+    index = VolunteerIndex(volunteers)
+    vocabulary = VolunteerIndex()
+    for spec in roster.specialties:
+        vocabulary.add_specialty(spec)
+    for query in QUERIES:
+        specs = set(index.match(query))
+        scan = best_ms(lambda: [i for i, v in enumerate(volunteers) if normalize_specialty(v["spec"]) in specs], 1)
+        postings = best_ms(lambda: index.search(query))
+        mask = best_ms(lambda: roster.specialty_mask(vocabulary.match(query)))
+        positions = best_ms(lambda: roster.with_specialties(vocabulary.match(query)))
+        assert roster.with_specialties(vocabulary.match(query)) == index.search(query)
+        print(f"  {query!r:>10}: scan {scan:8.1f} ms | postings {postings:6.1f} ms | "
+              f"mask {mask:5.1f} ms | mask -> positions {positions:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,164 @@
+"""
+Registration burst against the durable queue behind "Join the Grid".
+
+1. Burst: waves of 1, 4 and 16 concurrent submitters send registrations
+   (about a tenth re-sending an address already used, with different case
+   and spacing) while the background committer drains into a JSON
+   snapshot. Reports submit latency percentiles per wave, and the median
+   at the start and end of each wave, which should stay flat as the
+   backlog and roster grow.
+2. Checks: every duplicate rejected, a fresh load holds each accepted
+   volunteer exactly once, the drained queue file is empty.
+3. Crash recovery: registrations acknowledged but never committed (plus a
+   torn final line) are picked up by the next process and committed once.
+
+Run from the repository root:
+    python benchmarks/burst_registrations.py [per_wave] [existing_volunteers]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from models import UnityGridEngine
+from registration_queue import DUPLICATE, QUEUED, RegistrationQueue, normalize_email, queue_path
+from shared_engine import SharedEngine
+from synthetic_grid import SPECIALTIES, generate
+
+WAVES = (1, 4, 16)
+DUPLICATE_SHARE = 0.1
+
+
+def percentiles(latencies):
+    p50, p99, worst = np.percentile(np.array(latencies) * 1e6, [50, 99, 100])
+    return f"p50 {p50:6.0f} us | p99 {p99:6.0f} us | max {worst:7.0f} us"
+
+
+def drift(stamped):
+    """Median latency of the first and last tenth of a wave, by submission time."""
+    latencies = np.array([lat for _, lat in sorted(stamped)]) * 1e6
+    tenth = max(1, len(latencies) // 10)
+    return f"start {np.median(latencies[:tenth]):5.0f} us -> end {np.median(latencies[-tenth:]):5.0f} us"
+
+
+def make_wave(rng, wave, size, used):
+    """(name, spec, contact) tuples; a share of them repeat an address from `used` in another spelling."""
+    requests = []
+    for i in range(size):
+        if used and rng.random() < DUPLICATE_SHARE:
+            contact = "  " + used[rng.integers(0, len(used))].upper() + " "
+        else:
+            contact = f"burst{wave}.{i}@grid.org"
+        requests.append((f"Volunteer {wave}-{i}", SPECIALTIES[rng.integers(0, len(SPECIALTIES))], contact))
+    return requests
+
+
+def run_wave(queue, requests, n_threads):
+    latencies = [[] for _ in range(n_threads)]
+    statuses = Counter()
+    lock = threading.Lock()
+
+    def submitter(t):
+        counts = Counter()
+        for name, spec, contact in requests[t::n_threads]:
+            start = time.perf_counter()
+            counts[queue.submit(name, spec, contact)] += 1
+            latencies[t].append((start, time.perf_counter() - start))
+        with lock:
+            statuses.update(counts)
+
+    threads = [threading.Thread(target=submitter, args=(t,)) for t in range(n_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, [x for lat in latencies for x in lat], statuses
+
+
+def burst(workdir, per_wave, existing):
+    path = os.path.join(workdir, "relief_data.json")
+    with open(path, "w") as f:
+        json.dump(generate(1_000, n_volunteers=existing), f)
+    grid = SharedEngine(UnityGridEngine(path))
+    queue = RegistrationQueue(grid, queue_path(path, "app"))
+    rng = np.random.default_rng(0)
+
+    print(f"Burst: {len(WAVES)} waves x {per_wave:,} registrations on top of {existing:,} volunteers")
+    used = [f"v{i}@grid.org" for i in range(0, existing, max(1, existing // 1000))]
+    expected = Counter()
+    for wave, n_threads in enumerate(WAVES):
+        requests = make_wave(rng, wave, per_wave, used)
+        elapsed, stamped, statuses = run_wave(queue, requests, n_threads)
+        expected.update(statuses)
+        used += [contact for _, _, contact in requests[:200]]
+        print(f"  {n_threads:>2} submitters: {per_wave / elapsed:6,.0f} /s | {percentiles([lat for _, lat in stamped])} | "
+              f"{drift(stamped)} | queued {statuses[QUEUED]:,} dup {statuses[DUPLICATE]:,} | backlog {queue.pending:,}")
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        queue.close()
+    print(f"  drained in {time.perf_counter() - start:.2f} s after the burst | "
+          f"{queue.stats['batches']} batches, {queue.stats['committed']:,} committed")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reloaded = UnityGridEngine(path)
+    keys = [normalize_email(v["contact"]) for v in reloaded.volunteers]
+    doubled = len(keys) - len(set(keys))
+    stored_ok = len(keys) == existing + expected[QUEUED] and doubled == 0
+    queue_empty = os.path.getsize(queue_path(path, "app")) == 0
+    print(f"  stored {len(keys) - existing:,}/{expected[QUEUED]:,} accepted | duplicates stored: {doubled} | "
+          f"queue file empty: {queue_empty}")
+    return stored_ok and queue_empty
+
+
+def crash_recovery(workdir, n=1_000):
+    path = os.path.join(workdir, "recovery.json")
+    with open(path, "w") as f:
+        json.dump(generate(100, n_volunteers=100), f)
+    qpath = queue_path(path, "cli")
+
+    # Acknowledged, never committed; then the process dies mid-append
+    queue = RegistrationQueue(SharedEngine(UnityGridEngine(path)), qpath, background=False)
+    for i in range(n):
+        queue.submit(f"Late {i}", "Medical", f"late{i}@grid.org")
+    queue._file.close()
+    with open(qpath, "ab") as f:
+        f.write(b'{"name":"Torn","spec":"Med')
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = UnityGridEngine(path)
+        queue = RegistrationQueue(SharedEngine(engine), qpath, background=False)
+        recovered = queue.pending
+        queue.close()
+        # A second restart must not commit anything twice
+        again = RegistrationQueue(SharedEngine(UnityGridEngine(path)), qpath, background=False)
+        replayed = again.pending
+        again.close()
+        final = len(UnityGridEngine(path).volunteers)
+    ok = recovered == n and replayed == 0 and final == 100 + n
+    print(f"Crash recovery: {recovered:,}/{n:,} pending registrations recovered, "
+          f"{replayed} replayed on the next restart, roster {final:,}/{100 + n:,}")
+    return ok
+
+
+def main(per_wave=5_000, existing=20_000):
+    with tempfile.TemporaryDirectory() as workdir:
+        ok = burst(workdir, per_wave, existing)
+        ok &= crash_recovery(workdir)
+    print("ok" if ok else "FAILED")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,93 @@
+"""
+Consistency check for the engine's live aggregates: replays a seeded mix
+of random operations (new hubs in new and existing countries with new
+items, single updates including withdrawals, bulk update batches and
+volunteer registrations), compares the live rollups with a full
+recompute after every batch, then times a snapshot against that
+recompute. Exits non-zero on the first drift.
+
+Run from the repository root:
+    python benchmarks/check_live_aggregates.py [centers] [batches]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from live_aggregates import LiveAggregates
+from models import UnityGridEngine
+from synthetic_grid import SPECIALTIES, generate
+
+OPS_PER_BATCH = 500
+REPEAT = 5
+
+
+def random_op(engine, rng, step):
+    store = engine.store
+    kind = rng.random()
+    if kind < 0.05:
+        # Mostly existing countries; now and then a brand-new country or item
+        country = f"Country-{rng.integers(0, 250)}" if rng.random() < 0.9 else "France"
+        item = f"Supply New-{rng.integers(0, 3)}" if rng.random() < 0.3 else store.items[0]
+        engine.add_center(f"New Hub {step}", country, {item: int(rng.integers(0, 500))})
+    elif kind < 0.60:
+        item = store.items[rng.integers(0, len(store.items))]
+        qty = int(rng.integers(-300, 300))
+        engine.update_inventory(f"Hub-{rng.integers(0, store.size + 10)}", item, qty)
+    elif kind < 0.70:
+        n = int(rng.integers(1, 200))
+        rows = rng.integers(0, store.size, n)
+        cols = rng.integers(0, len(store.items), n)
+        engine.apply_updates(rows, cols, rng.integers(-200, 400, n))
+    else:
+        spec = SPECIALTIES[rng.integers(0, len(SPECIALTIES))] if rng.random() < 0.95 else f"Spec {step}"
+        engine.register_volunteer(f"Volunteer x{step}", spec, f"x{step}@grid.org")
+
+
+def best(fn):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(n_centers=20_000, batches=20):
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "relief_data.json")
+        with open(path, "w") as f:
+            json.dump(generate(n_centers), f)
+        engine = UnityGridEngine(path)
+        live = engine.live
+
+        step = 0
+        for batch in range(1, batches + 1):
+            for _ in range(OPS_PER_BATCH):
+                random_op(engine, rng, step)
+                step += 1
+            problems = live.verify(engine.volunteers)
+            if problems:
+                print(f"batch {batch}: live aggregates drifted after {step:,} operations")
+                for problem in problems:
+                    print(f"  {problem}")
+                sys.exit(1)
+        print(f"{step:,} operations in {batches} batches: live aggregates match a full recompute "
+              f"({engine.store.size:,} hubs, {len(engine.store.items)} items, {len(engine.volunteers):,} volunteers)")
+
+        snapshot_s = best(lambda: engine.live_snapshot(detail=False))
+        detail_s = best(lambda: engine.live_snapshot())
+        rebuild_s = best(lambda: LiveAggregates(engine.store, engine.volunteers))
+        print(f"snapshot {snapshot_s * 1e6:8.1f} us | with countries {detail_s * 1e3:6.2f} ms | "
+              f"full recompute {rebuild_s * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,93 @@
+"""
+Load generator for src/ingest_server.py: thousands of concurrent field
+clients on localhost, each sending updates one at a time and waiting for
+the durable ack. Reports throughput and ack latency percentiles, then
+stops the server and checks every acknowledged update reached the file.
+
+Run from the repository root (starts its own server on a copy of the data):
+    python benchmarks/load_ingest_server.py [clients] [requests_per_client]
+"""
+import asyncio
+import json
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+ITEMS = ["Water (Liters)", "Medical Kits", "Food Parcels"]
+VOLUNTEER_SHARE = 0.1
+
+
+async def client(port, cities, n_requests, seed, latencies, expected):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for i in range(n_requests):
+        if rng.random() < VOLUNTEER_SHARE:
+            request = {"id": i, "op": "volunteer", "name": f"Field {seed}-{i}", "spec": "Logistics", "contact": "radio"}
+        else:
+            city, item, qty = rng.choice(cities), rng.choice(ITEMS), rng.randint(1, 50)
+            request = {"id": i, "op": "inventory", "city": city, "item": item, "qty": qty}
+        start = time.perf_counter()
+        writer.write((json.dumps(request) + "\n").encode())
+        ack = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        assert ack["ok"] and ack["id"] == i, ack
+        if request["op"] == "inventory":
+            expected[(request["city"], request["item"])] += request["qty"]
+        else:
+            expected["volunteers"] += 1
+    writer.close()
+
+
+async def drive(port, cities, n_clients, n_requests):
+    latencies, expected = [], Counter()
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, cities, n_requests, seed, latencies, expected) for seed in range(n_clients)))
+    return time.perf_counter() - start, np.array(latencies), expected
+
+
+def main(n_clients=2000, n_requests=20):
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = os.path.join(directory, "relief_data.json")
+        shutil.copy(os.path.join(ROOT, "data", "relief_data.json"), data_file)
+        with open(data_file, encoding="utf-8") as f:
+            before = json.load(f)
+        cities = [c["city"] for c in before["centers"]]
+
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "src", "ingest_server.py"), data_file, "0"],
+            cwd=ROOT, stdout=subprocess.PIPE, text=True,
+        )
+        port = int(server.stdout.readline().rsplit(":", 1)[1])
+        elapsed, latencies, expected = asyncio.run(drive(port, cities, n_clients, n_requests))
+        server.send_signal(signal.SIGINT)
+        summary = server.stdout.read()
+        server.wait()
+
+        total = len(latencies)
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+        print(f"{n_clients:,} clients x {n_requests} requests | {total / elapsed:,.0f} acked req/s | "
+              f"ack latency p50 {p50:.1f} ms, p95 {p95:.1f} ms, p99 {p99:.1f} ms, max {latencies.max() * 1000:.1f} ms")
+        print(summary.strip())
+
+        with open(data_file, encoding="utf-8") as f:
+            after = json.load(f)
+        assert len(after["volunteers"]) - len(before["volunteers"]) == expected.pop("volunteers", 0)
+        old = {c["city"]: c["inventory"] for c in before["centers"]}
+        for c in after["centers"]:
+            for item in ITEMS:
+                gained = c["inventory"].get(item, 0) - old[c["city"]].get(item, 0)
+                assert gained == expected[(c["city"], item)], (c["city"], item)
+        print("Every acknowledged update is in the compacted snapshot.")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,81 @@
+"""
+Simulates 200 concurrent dashboard sessions against (a) one engine per
+session, as the app used to do, and (b) a single SharedEngine. Reports
+RSS growth and p95 rerun latency for each mode.
+
+Run from the repository root:
+    python benchmarks/load_shared_engine.py [sessions] [reruns]
+"""
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models import UnityGridEngine
+from shared_engine import SharedEngine
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "relief_data.json")
+WRITE_EVERY = 50  # one rerun in WRITE_EVERY logs a supply update
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def rerun(shared, rng, session):
+    """One Streamlit rerun of the Global Ops page, plus the occasional write."""
+    start = time.perf_counter()
+    session["stale"] = shared.changed_since(session.get("version"))
+    with shared.read() as engine:
+        engine.get_disaster_zones()
+        continent = rng.choice(list(engine.world_data))
+        engine.get_inventory(rng.choice(engine.world_data[continent]))
+    if rng.randrange(WRITE_EVERY) == 0:
+        shared.update_inventory("Tokyo", "Medical Kits", 1)
+    session["version"] = shared.version
+    return time.perf_counter() - start
+
+
+def run(mode, n_sessions, reruns):
+    base_rss = rss_mb()
+    latencies = []
+    lock = threading.Lock()
+
+    if mode == "shared":
+        engines = [SharedEngine(UnityGridEngine(DATA_FILE))] * n_sessions
+    else:
+        engines = [SharedEngine(UnityGridEngine(DATA_FILE)) for _ in range(n_sessions)]
+
+    def session_loop(i):
+        rng = random.Random(i)
+        session = {}
+        local = [rerun(engines[i], rng, session) for _ in range(reruns)]
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=session_loop, args=(i,)) for i in range(n_sessions)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    p95 = statistics.quantiles(latencies, n=100)[94] * 1000
+    print(f"{mode:>12} | sessions: {n_sessions} | RSS +{rss_mb() - base_rss:7.1f} MB | "
+          f"p95 rerun: {p95:6.2f} ms | {len(latencies) / elapsed:9,.0f} reruns/s")
+
+
+if __name__ == "__main__":
+    n_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    reruns = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    run("shared", n_sessions, reruns)
+    run("per-session", n_sessions, reruns)
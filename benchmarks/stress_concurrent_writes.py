@@ -0,0 +1,191 @@
+"""
+Concurrent writers on one relief_data.json.
+
+1. Threads: 1..N threads hammer supply updates (a tenth on one hot hub)
+   through a SharedEngine, once with the per-hub lock stripes and once
+   behind the global write lock. Reports updates/s and checks every hub
+   ends at exactly its initial stock plus all deltas (and that the live
+   aggregates agree).
+2. Processes: several engines in separate processes update overlapping
+   hubs, register volunteers and add hubs, committing after every round.
+   A fresh load must hold every delta from every process: none lost to a
+   concurrent commit.
+3. Journaled processes: the same workload through journaled engines (the
+   CLI and ingest default) sharing one WAL; each process also compacts
+   every other round, sealing the WAL under the others' appends, and
+   closes its journal at the end.
+
+Run from the repository root:
+    python benchmarks/stress_concurrent_writes.py [max_threads] [processes]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from models import UnityGridEngine
+from shared_engine import SharedEngine
+from synthetic_grid import generate
+
+N_HUBS = 2_000
+UPDATES_PER_THREAD = 20_000
+HOT_SHARE = 0.1
+ROUNDS = 10
+UPDATES_PER_ROUND = 300
+
+
+def random_updates(rng, n, n_hubs, n_items):
+    rows = rng.integers(0, n_hubs, n)
+    rows[rng.random(n) < HOT_SHARE] = 0
+    return rows, rng.integers(0, n_items, n), rng.integers(-50, 100, n)
+
+
+# ----------------------------------------------------------------------
+# 1. Threads sharing one engine
+# ----------------------------------------------------------------------
+def run_threads(shared, n_threads, striped, expected):
+    engine = shared._engine
+    items, cities = list(engine.store.items), list(engine.store.cities)
+    barrier = threading.Barrier(n_threads + 1)
+    partials = []
+
+    def worker(seed):
+        rows, cols, qtys = random_updates(np.random.default_rng(seed), UPDATES_PER_THREAD, len(cities), len(items))
+        barrier.wait()
+        for row, col, qty in zip(rows.tolist(), cols.tolist(), qtys.tolist()):
+            if striped:
+                shared.update_inventory(cities[row], items[col], qty)
+            else:
+                with shared.write() as e:
+                    e.update_inventory(cities[row], items[col], qty)
+        delta = np.zeros_like(expected)
+        np.add.at(delta, (rows, cols), qtys)
+        partials.append(delta)
+
+    threads = [threading.Thread(target=worker, args=(1000 * n_threads + i + striped,)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    expected += sum(partials)
+    actual = engine.store.quantities[:len(cities), :len(items)]
+    lost = int(np.count_nonzero(actual != expected))
+    drift = engine.live.verify(engine.volunteers)
+    return n_threads * UPDATES_PER_THREAD / elapsed, lost, drift
+
+
+def thread_stress(workdir, max_threads):
+    path = os.path.join(workdir, "threads.json")
+    with open(path, "w") as f:
+        json.dump(generate(N_HUBS), f)
+    engine = UnityGridEngine(path)
+    engine.live
+    shared = SharedEngine(engine)
+    n_items = len(engine.store.items)
+    expected = engine.store.quantities[:N_HUBS, :n_items].copy()
+
+    print(f"Threads: {N_HUBS:,} hubs x {n_items} items, {UPDATES_PER_THREAD:,} updates per thread | {os.cpu_count()} CPU(s)")
+    print(f"{'threads':>7} {'striped':>14} {'global lock':>14} {'cells wrong':>12}")
+    failed = False
+    threads = 1
+    while threads <= max_threads:
+        striped_rate, lost_s, drift_s = run_threads(shared, threads, True, expected)
+        global_rate, lost_g, drift_g = run_threads(shared, threads, False, expected)
+        failed |= bool(lost_s or lost_g or drift_s or drift_g)
+        print(f"{threads:>7} {striped_rate:>10,.0f} /s {global_rate:>10,.0f} /s {lost_s + lost_g:>12}")
+        for problem in drift_s + drift_g:
+            print(f"  live aggregates: {problem}")
+        threads *= 2
+    return not failed
+
+
+# ----------------------------------------------------------------------
+# 2. Processes sharing one file
+# ----------------------------------------------------------------------
+def process_writer(path, worker_id, journaled=False):
+    """One writer process; returns the deltas it applied to the original hubs and its merge count."""
+    rng = np.random.default_rng(worker_id)
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = UnityGridEngine(path, journaled=journaled)
+        items, cities = list(engine.store.items), list(engine.store.cities[:N_HUBS])
+        delta = np.zeros((N_HUBS, len(items)), dtype=np.int64)
+        merged = 0
+        for r in range(ROUNDS):
+            rows, cols, qtys = random_updates(rng, UPDATES_PER_ROUND, N_HUBS, len(items))
+            for row, col, qty in zip(rows.tolist(), cols.tolist(), qtys.tolist()):
+                engine.update_inventory(cities[row], items[col], qty)
+            np.add.at(delta, (rows, cols), qtys)
+            engine.register_volunteer(f"Writer {worker_id} #{r}", "Logistics", f"w{worker_id}.{r}@grid.org")
+            engine.add_center(f"Writer {worker_id} Hub {r}", "Türkiye", {items[0]: 10})
+            if journaled:
+                engine.commit()
+                if r % 2:
+                    merged += engine.journal.compact()
+            else:
+                merged += engine.commit()
+        if journaled:
+            engine.save_state()
+    return delta, merged
+
+
+def process_stress(workdir, processes, journaled=False):
+    path = os.path.join(workdir, "journaled.json" if journaled else "processes.json")
+    data = generate(N_HUBS)
+    with open(path, "w") as f:
+        json.dump(data, f)
+    initial = UnityGridEngine(path)
+    n_items = len(initial.store.items)
+    expected = initial.store.quantities[:N_HUBS, :n_items].copy()
+    n_volunteers = len(initial.volunteers)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(processes) as pool:
+        results = list(pool.map(process_writer, [path] * processes, range(processes), [journaled] * processes))
+    elapsed = time.perf_counter() - start
+
+    for delta, _ in results:
+        expected += delta
+    final = UnityGridEngine(path)
+    lost = int(np.count_nonzero(final.store.quantities[:N_HUBS, :n_items] != expected))
+    new_hubs = sum(
+        final.store.center(f"Writer {w} Hub {r}") is not None
+        for w in range(processes) for r in range(ROUNDS)
+    )
+    volunteers = len(final.volunteers) - n_volunteers
+    merged = sum(m for _, m in results)
+    if journaled:
+        print(f"Journaled processes: {processes} writers x {ROUNDS} commits of {UPDATES_PER_ROUND} updates "
+              f"in {elapsed:.2f} s | {merged} compactions under concurrent appends")
+    else:
+        print(f"Processes: {processes} writers x {ROUNDS} commits of {UPDATES_PER_ROUND} updates in {elapsed:.2f} s | "
+              f"{merged} hub merges with concurrent commits")
+    print(f"  cells wrong: {lost} | hubs added: {new_hubs}/{processes * ROUNDS} | "
+          f"volunteers added: {volunteers}/{processes * ROUNDS}")
+    return lost == 0 and new_hubs == volunteers == processes * ROUNDS
+
+
+def main(max_threads=8, processes=4):
+    with tempfile.TemporaryDirectory() as workdir:
+        ok = thread_stress(workdir, max_threads)
+        ok &= process_stress(workdir, processes)
+        ok &= process_stress(workdir, processes, journaled=True)
+    print("no lost updates" if ok else "LOST UPDATES")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
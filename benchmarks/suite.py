@@ -0,0 +1,247 @@
+"""
+Benchmark suite for the engine and persistence hot paths, on seeded
+synthetic grids of 10^3 .. 10^6 centers (see synthetic_grid.py).
+
+Each size times inventory updates (single and bulk), specialty search,
+full JSON / binary save and load, dashboard figure construction and the
+memory footprint of a loaded engine. Results go to a JSON file; `compare`
+flags metrics that got worse by more than a threshold (exit status 1).
+
+Run from the repository root:
+    python benchmarks/suite.py run --out results.json [--sizes 1000,10000] [--repeat 5]
+    python benchmarks/suite.py compare baseline.json results.json [--threshold 0.10]
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import synthetic_grid
+from database_helper import DatabaseHelper
+from models import UnityGridEngine
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+SINGLE_UPDATES = 20_000
+BULK_UPDATES = 200_000
+SEARCH_QUERIES = ["Medical", "medic", "rescue", "Search and", "Logistcs", "nurse", "Translator", "eng"]
+
+# Metric name -> (unit, which direction is better)
+METRICS = {
+    "update_single_ops": ("ops/s", "higher"),
+    "update_bulk_rows": ("rows/s", "higher"),
+    "search_index_build_s": ("s", "lower"),
+    "search_query_us": ("us", "lower"),
+    "save_json_s": ("s", "lower"),
+    "load_json_s": ("s", "lower"),
+    "save_binary_s": ("s", "lower"),
+    "load_binary_s": ("s", "lower"),
+    "figures_s": ("s", "lower"),
+    "engine_bytes": ("bytes", "lower"),
+    "load_peak_bytes": ("bytes", "lower"),
+    "snapshot_json_bytes": ("bytes", "lower"),
+}
+# Absolute differences below these are timer noise, whatever the percentage
+NOISE_FLOOR = {"s": 0.002, "us": 5.0}
+
+
+def timed(fn, repeat):
+    """Best wall time of `repeat` calls (least disturbed by other load), plus the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        # The save paths report to stdout; keep the benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+# ----------------------------------------------------------------------
+# Workloads
+# ----------------------------------------------------------------------
+def bench_updates(engine, items, repeat):
+    rng = random.Random(1)
+    n = engine.store.size
+    cities = [f"Hub-{rng.randrange(n)}" for _ in range(SINGLE_UPDATES)]
+    picks = [rng.choice(items) for _ in range(SINGLE_UPDATES)]
+
+    def single():
+        for city, item in zip(cities, picks):
+            engine.update_inventory(city, item, 5)
+
+    single_s, _ = timed(single, repeat)
+    rows = np.random.default_rng(2).integers(0, n, BULK_UPDATES)
+    cols = np.random.default_rng(3).integers(0, len(items), BULK_UPDATES)
+    bulk_s, _ = timed(lambda: engine.apply_updates(rows, cols, np.ones(BULK_UPDATES, dtype=np.int64)), repeat)
+    return {"update_single_ops": SINGLE_UPDATES / single_s, "update_bulk_rows": BULK_UPDATES / bulk_s}
+
+
+def bench_search(engine, repeat):
+    def build():
+        engine._volunteer_index = None
+        return engine.volunteer_index
+
+    build_s, _ = timed(build, repeat)
+    query_s, _ = timed(lambda: [engine.search_volunteers(q) for q in SEARCH_QUERIES], repeat)
+    return {"search_index_build_s": build_s, "search_query_us": query_s / len(SEARCH_QUERIES) * 1e6}
+
+
+def build_figures(engine):
+    """The dashboard's plotly figures, fed from the whole grid instead of the demo data."""
+    n = engine.store.size
+    hub_map = go.Figure(go.Scattergeo(
+        lat=engine.store.lats[:n], lon=engine.store.lons[:n], mode="markers", marker=dict(size=3),
+    ))
+    hub_map.update_geos(projection_type="natural earth", showland=True, showcountries=True)
+    totals = engine.country_totals()
+    df = pd.DataFrame.from_dict(totals, orient="index").reset_index(names="Country")
+    bars = px.bar(df.melt(id_vars="Country", var_name="Item", value_name="Stock"),
+                  x="Country", y="Stock", color="Item")
+    # Serialising is part of what a rerun pays to ship a figure to the browser
+    return len(hub_map.to_json()) + len(bars.to_json())
+
+
+def engine_bytes(engine):
+    store = engine.store
+    arrays = (store.quantities, store.stocked, store.country_ids, store.lats, store.lons)
+    return sum(a.nbytes for a in arrays)
+
+
+def bench_size(n_centers, workdir, repeat, seed):
+    data = synthetic_grid.generate(n_centers, seed=seed)
+    items = list(data["centers"][0]["inventory"])
+    json_path = os.path.join(workdir, f"grid_{n_centers}.json")
+    binary_path = os.path.join(workdir, f"grid_{n_centers}.ugrid")
+    DatabaseHelper.write_snapshot(data, json_path)
+    del data
+    results = {"snapshot_json_bytes": os.path.getsize(json_path)}
+
+    gc.collect()
+    tracemalloc.start()
+    engine = UnityGridEngine(json_path)
+    results["load_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    results["engine_bytes"] = engine_bytes(engine)
+
+    results["load_json_s"], engine = timed(lambda: UnityGridEngine(json_path), repeat)
+    results.update(bench_updates(engine, items, repeat))
+    results.update(bench_search(engine, repeat))
+    results["figures_s"], _ = timed(lambda: build_figures(engine), repeat)
+    results["save_json_s"], _ = timed(
+        lambda: DatabaseHelper.save_to_json(engine.centers, engine.volunteers, json_path), repeat)
+    results["save_binary_s"], _ = timed(
+        lambda: DatabaseHelper.save_to_binary(engine.store, engine.volunteers, binary_path), repeat)
+    # Mapped load, measured to the first hub lookup like bench_startup.py
+    results["load_binary_s"], _ = timed(
+        lambda: UnityGridEngine(binary_path).store.center("Hub-0").inventory, repeat)
+    return results
+
+
+# ----------------------------------------------------------------------
+# Modes
+# ----------------------------------------------------------------------
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(sizes, out, repeat, seed):
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "units": {name: {"unit": unit, "better": better} for name, (unit, better) in METRICS.items()},
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            start = time.perf_counter()
+            report["results"][str(n)] = bench_size(n, workdir, repeat, seed)
+            print(f"[Bench] {n:>9,} centers done in {time.perf_counter() - start:6.1f} s", flush=True)
+            for name, value in report["results"][str(n)].items():
+                print(f"    {name:<22} {value:>16,.3f} {METRICS[name][0]}")
+            # Written after every size, so a long run that is interrupted still leaves results
+            with open(out, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+    print(f"[Bench] results written to {out}")
+
+
+def compare(baseline_path, current_path, threshold):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(current_path, encoding="utf-8") as f:
+        current = json.load(f)
+
+    regressions = 0
+    print(f"{'size':>9} {'metric':<22} {'baseline':>14} {'current':>14} {'change':>8}")
+    for size, metrics in current["results"].items():
+        for name, value in metrics.items():
+            old = baseline["results"].get(size, {}).get(name)
+            if old is None or name not in METRICS:
+                continue
+            unit, better = METRICS[name]
+            change = (value - old) / old if old else 0.0
+            # Positive `worse` means the metric moved in its bad direction
+            worse = change if better == "lower" else -change
+            flag = ""
+            if abs(value - old) < NOISE_FLOOR.get(unit, 0):
+                pass
+            elif worse > threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            elif worse < -threshold:
+                flag = "  improved"
+            print(f"{int(size):>9,} {name:<22} {old:>14,.3f} {value:>14,.3f} {change:>+8.1%}{flag}")
+    print(f"\n{regressions} regression(s) beyond {threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    modes = parser.add_subparsers(dest="mode", required=True)
+    run_args = modes.add_parser("run")
+    run_args.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    run_args.add_argument("--out", default="benchmark_results.json")
+    run_args.add_argument("--repeat", type=int, default=5)
+    run_args.add_argument("--seed", type=int, default=0)
+    compare_args = modes.add_parser("compare")
+    compare_args.add_argument("baseline")
+    compare_args.add_argument("current")
+    compare_args.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    if args.mode == "run":
+        run([int(s) for s in args.sizes.split(",")], args.out, args.repeat, args.seed)
+        return 0
+    return compare(args.baseline, args.current, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
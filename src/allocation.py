@@ -0,0 +1,303 @@
+import numpy as np
+
+from spatial_index import haversine_km
+
+UNSERVED = -1  # pseudo-hub for demand left as shortfall
+
+
+def _hub_order(cost):
+    """Hub IDs sorted nearest-first, one column per zone (read-only, shared across items)."""
+    return np.argsort(cost, axis=0, kind="stable").astype(np.int32)
+
+
+class TransportSolver:
+    """
+    Min-cost flow for one item: hubs (supply) -> zones (demand), where any
+    unmet demand costs `shortfall_cost` per unit.
+
+    This is successive shortest paths specialised to the bipartite shape of
+    the problem. Hubs are never visited one by one: a zone is reached either
+    directly from its nearest hub with free stock (per-zone sorted cost
+    columns plus a pointer) or from another zone by re-routing a hub that
+    already ships there (a dense zone x zone transfer matrix kept up to date
+    as flows change). Shortest paths therefore run Bellman-Ford over zones
+    only, and each augmentation costs O(zones^2) vectorized work regardless
+    of the hub count.
+
+    The flow stays optimal between calls, so `set_supply` re-solves from the
+    current plan instead of starting over.
+    """
+
+    def __init__(self, cost, supply, demand, shortfall_cost, order=None):
+        self.cost = cost                        # (hubs x zones) km
+        self.n_hubs, self.n_zones = cost.shape
+        self.shortfall_cost = shortfall_cost
+        self.free = np.asarray(supply, dtype=np.int64).copy()   # unallocated stock per hub
+        self.used = np.zeros(self.n_hubs, dtype=np.int64)       # allocated stock per hub
+        self.deficit = np.asarray(demand, dtype=np.int64).copy()
+        self.shortfall = np.zeros(self.n_zones, dtype=np.int64)
+        self.flows = [{} for _ in range(self.n_zones)]          # zone -> {hub: qty}
+
+        # Re-routing a hub from zone a to zone b costs cost[h, b] - cost[h, a]
+        self.transfer = np.full((self.n_zones, self.n_zones), np.inf)
+        self.transfer_hub = np.full((self.n_zones, self.n_zones), -1, dtype=np.int64)
+
+        # Hubs sorted by distance for every zone; hubs before ptr[z] have no free stock
+        self.order = _hub_order(cost) if order is None else order
+        self.ptr = np.zeros(self.n_zones, dtype=np.int64)
+        self.direct = np.full(self.n_zones, -1, dtype=np.int64)
+        for z in range(self.n_zones):
+            self._advance(z)
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+    def _advance(self, z, chunk=256):
+        """Moves zone z's pointer to its nearest hub that still has free stock."""
+        column = self.order[:, z]
+        p = self.ptr[z]
+        while p < self.n_hubs:
+            window = column[p:p + chunk]
+            hits = np.flatnonzero(self.free[window] > 0)
+            if len(hits):
+                p += hits[0]
+                break
+            p += len(window)
+        self.ptr[z] = p
+        self.direct[z] = column[p] if p < self.n_hubs else -1
+
+    def _rewind(self, hub):
+        """A hub regained free stock: zones whose pointer already passed it look again."""
+        ranks = np.argmax(self.order == hub, axis=0)
+        stale = ranks < self.ptr
+        self.ptr[stale] = ranks[stale]
+        self.direct[stale] = hub
+
+    def _refresh_transfer(self, z):
+        hubs = np.fromiter(self.flows[z], dtype=np.int64, count=len(self.flows[z]))
+        if not len(hubs):
+            self.transfer[z] = np.inf
+            self.transfer_hub[z] = -1
+            return
+        deltas = self.cost[hubs] - self.cost[hubs, z][:, None]
+        best = np.argmin(deltas, axis=0)
+        self.transfer[z] = deltas[best, np.arange(self.n_zones)]
+        self.transfer_hub[z] = hubs[best]
+        self.transfer[z, z] = np.inf
+
+    def _add_flow(self, hub, z, qty):
+        flows = self.flows[z]
+        is_new = hub not in flows
+        flows[hub] = flows.get(hub, 0) + qty
+        self.used[hub] += qty
+        if is_new:
+            deltas = self.cost[hub] - self.cost[hub, z]
+            better = deltas < self.transfer[z]
+            better[z] = False
+            self.transfer[z, better] = deltas[better]
+            self.transfer_hub[z, better] = hub
+
+    def _remove_flow(self, hub, z, qty):
+        flows = self.flows[z]
+        flows[hub] -= qty
+        self.used[hub] -= qty
+        if not flows[hub]:
+            del flows[hub]
+            self._refresh_transfer(z)
+
+    def _take_free(self, hub, qty):
+        self.free[hub] -= qty
+        if not self.free[hub]:
+            for z in np.flatnonzero(self.direct == hub):
+                self._advance(z)
+
+    def _give_free(self, hub, qty):
+        was_empty = not self.free[hub]
+        self.free[hub] += qty
+        if was_empty and self.free[hub] > 0:
+            self._rewind(hub)
+
+    # ------------------------------------------------------------------
+    # Shortest paths over zones
+    # ------------------------------------------------------------------
+    def _relax(self, dist, reverse=False):
+        """Bellman-Ford over the transfer matrix; returns (dist, predecessor zone)."""
+        pred = np.full(self.n_zones, -1, dtype=np.int64)
+        transfer = self.transfer.T if reverse else self.transfer
+        hub_zones = self.transfer_hub.max(axis=0 if reverse else 1) >= 0
+        # Only zones whose distance just improved can improve anyone else
+        frontier = np.flatnonzero(hub_zones & np.isfinite(dist))
+        while len(frontier):
+            candidates = dist[frontier, None] + transfer[frontier]
+            via = np.argmin(candidates, axis=0)
+            best = candidates[via, np.arange(self.n_zones)]
+            improved = np.flatnonzero(best < dist - 1e-9)
+            dist[improved] = best[improved]
+            pred[improved] = frontier[via[improved]]
+            frontier = improved[hub_zones[improved]]
+        return dist, pred
+
+    def _augment(self):
+        """Routes one batch of stock to the cheapest-to-reach zone with unmet demand."""
+        reachable = self.direct >= 0
+        start = np.full(self.n_zones, np.inf)
+        start[reachable] = self.cost[self.direct[reachable], np.flatnonzero(reachable)]
+        from_shortfall = start > self.shortfall_cost
+        start[from_shortfall] = self.shortfall_cost
+        dist, pred = self._relax(start)
+
+        open_zones = np.flatnonzero(self.deficit > 0)
+        target = open_zones[np.argmin(dist[open_zones])]
+        path = [target]
+        while pred[path[-1]] >= 0:
+            path.append(pred[path[-1]])
+        path.reverse()
+
+        root = path[0]
+        root_hub = UNSERVED if from_shortfall[root] else self.direct[root]
+        qty = self.deficit[target]
+        if root_hub != UNSERVED:
+            qty = min(qty, self.free[root_hub])
+        hops = [(a, b, self.transfer_hub[a, b]) for a, b in zip(path, path[1:])]
+        for a, _, hub in hops:
+            qty = min(qty, self.flows[a][hub])
+
+        if root_hub == UNSERVED:
+            self.shortfall[root] += qty
+        else:
+            self._add_flow(root_hub, root, qty)
+            self._take_free(root_hub, qty)
+        for a, b, hub in hops:
+            self._remove_flow(hub, a, qty)
+            self._add_flow(hub, b, qty)
+        self.deficit[target] -= qty
+
+    def solve(self):
+        while (self.deficit > 0).any():
+            self._augment()
+        return self
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+    def set_supply(self, hub, qty):
+        """Changes one hub's stock and restores optimality from the current plan."""
+        delta = int(qty) - int(self.free[hub] + self.used[hub])
+        if delta < 0:
+            self._shrink(hub, -delta)
+        elif delta > 0:
+            self._grow(hub, delta)
+        return self.solve()
+
+    def _shrink(self, hub, qty):
+        spare = min(qty, int(self.free[hub]))
+        if spare:
+            self._take_free(hub, spare)
+            qty -= spare
+        # Pull the rest back from the hub's most distant zones; solve() refills them
+        zones = sorted((z for z in range(self.n_zones) if hub in self.flows[z]), key=lambda z: -self.cost[hub, z])
+        for z in zones:
+            if not qty:
+                break
+            take = min(qty, self.flows[z][hub])
+            self._remove_flow(hub, z, take)
+            self.deficit[z] += take
+            qty -= take
+
+    def _grow(self, hub, qty):
+        """New stock at `hub` displaces shortfall or farther hubs while that lowers the cost."""
+        while qty:
+            # Cheapest way for a zone to hand one unit back: drop shortfall or release its farthest hub
+            exit_cost = np.where(self.shortfall > 0, -self.shortfall_cost, np.inf)
+            exit_hub = np.full(self.n_zones, UNSERVED, dtype=np.int64)
+            for z, flows in enumerate(self.flows):
+                for h in flows:
+                    if -self.cost[h, z] < exit_cost[z]:
+                        exit_cost[z], exit_hub[z] = -self.cost[h, z], h
+            dist, succ = self._relax(exit_cost.copy(), reverse=True)
+            gain = self.cost[hub] + dist
+            first = int(np.argmin(gain))
+            if gain[first] >= -1e-9:
+                break
+
+            path = [first]
+            while succ[path[-1]] >= 0:
+                path.append(succ[path[-1]])
+            last = path[-1]
+            hops = [(a, b, self.transfer_hub[a, b]) for a, b in zip(path, path[1:])]
+            amount = qty
+            for a, _, h in hops:
+                amount = min(amount, self.flows[a][h])
+            released = exit_hub[last]
+            amount = min(amount, self.shortfall[last] if released == UNSERVED else self.flows[last][released])
+
+            self._add_flow(hub, first, amount)
+            for a, b, h in hops:
+                self._remove_flow(h, a, amount)
+                self._add_flow(h, b, amount)
+            if released == UNSERVED:
+                self.shortfall[last] -= amount
+            else:
+                self._remove_flow(released, last, amount)
+                self._give_free(released, amount)
+            qty -= amount
+        if qty:
+            self._give_free(hub, qty)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+    def shipments(self):
+        """[(hub, zone, qty)] of the current plan."""
+        return [(h, z, q) for z, flows in enumerate(self.flows) for h, q in flows.items()]
+
+    def total_cost(self):
+        distance = sum(self.cost[h, z] * q for h, z, q in self.shipments())
+        return float(distance + self.shortfall_cost * self.shortfall.sum())
+
+
+class AllocationPlanner:
+    """
+    Matches every hub's per-item stock to every disaster zone's demand,
+    minimising unit-km shipped plus a penalty per unit of unmet demand.
+
+    The hub x zone distance matrix is computed once with a vectorized
+    haversine and shared by one TransportSolver per item.
+    """
+
+    def __init__(self, hub_lats, hub_lons, zone_lats, zone_lons, supply, demand, items, shortfall_cost=None):
+        self.items = list(items)
+        self.cost = haversine_km(
+            np.asarray(hub_lats)[:, None], np.asarray(hub_lons)[:, None],
+            np.asarray(zone_lats)[None, :], np.asarray(zone_lons)[None, :],
+        )
+        # By default unmet demand costs more than shipping from the far side of the planet
+        if shortfall_cost is None:
+            shortfall_cost = 2 * float(self.cost.max(initial=0.0)) + 1.0
+        self.shortfall_cost = shortfall_cost
+        supply = np.asarray(supply, dtype=np.int64)
+        demand = self.demand = np.asarray(demand, dtype=np.int64)
+        order = _hub_order(self.cost)
+        self.solvers = [
+            TransportSolver(self.cost, np.maximum(supply[:, i], 0), demand[:, i], shortfall_cost, order).solve()
+            for i in range(len(self.items))
+        ]
+
+    def update_supply(self, hub, item, qty):
+        """Incremental re-solve after one hub's stock of one item changed to `qty`."""
+        self.solvers[self.items.index(item)].set_supply(hub, max(int(qty), 0))
+
+    def shipments(self):
+        """[(hub, zone, item, qty, km)] for every leg of the plan."""
+        return [
+            (h, z, item, int(q), float(self.cost[h, z]))
+            for item, solver in zip(self.items, self.solvers)
+            for h, z, q in solver.shipments()
+        ]
+
+    def shortfall(self):
+        """(zones x items) demand left unmet."""
+        return np.stack([s.shortfall for s in self.solvers], axis=1)
+
+    def total_cost(self):
+        return sum(s.total_cost() for s in self.solvers)
@@ -0,0 +1,356 @@
+import hashlib
+import itertools
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+
+import numpy as np
+
+from country_catalog import COUNTRIES, align_countries
+from instrumentation import add_bytes
+from inventory_store import InventoryStore, normalize_city
+from volunteer_roster import VolunteerRoster
+
+MAGIC = b"UGRIDSNP"
+VERSION = 2  # v2 appended hub coordinates; v1 files still open without them
+HEADER = struct.Struct("<8sII5Q")  # magic, version, n_sections, centers, items, countries, volunteers, wal_seq
+ENTRY = struct.Struct("<2Q")       # section offset, section size
+ALIGN = 8
+
+# Fixed section order. String columns are an offset table (n + 1 uint64)
+# into a UTF-8 heap; numeric columns are fixed-width and column-major.
+SECTIONS = (
+    "items.off", "items.heap",
+    "countries.off", "countries.heap",
+    "cities.off", "cities.heap",
+    "cities.hash",   # open-addressing table of row + 1, keyed by normalized city
+    "country_ids",   # uint32 per center
+    "quantities",    # int64, one contiguous column per item
+    "stocked",       # bool, one contiguous column per item
+    "names.off", "names.heap",
+    "specs.off", "specs.heap",
+    "contacts.off", "contacts.heap",
+    "lats", "lons",  # float64 per center, NaN when unknown
+)
+
+
+def city_hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _hash_table(cities):
+    """Linear-probing table (load factor <= 0.5) so lookups need no index build on open."""
+    size = 1
+    while size < 2 * len(cities):
+        size *= 2
+    table = np.zeros(size, dtype="<u4")
+    mask = size - 1
+    for row, city in enumerate(cities):
+        slot = city_hash(normalize_city(city)) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = row + 1
+    return table.tobytes()
+
+
+def _string_column(values):
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return offsets.tobytes(), b"".join(encoded)
+
+
+def write_snapshot(path, cities, countries, country_ids, items, quantities, stocked, volunteers, wal_seq=0,
+                   lats=None, lons=None):
+    """
+    Writes the binary snapshot format. `quantities` / `stocked` are
+    (centers x items) arrays; they are stored one item column at a time.
+    """
+    n_centers, n_items = len(cities), len(items)
+    packed = isinstance(volunteers, VolunteerRoster)
+    if not packed:
+        volunteers = list(volunteers)
+    sections = {}
+    sections["items.off"], sections["items.heap"] = _string_column(items)
+    sections["countries.off"], sections["countries.heap"] = _string_column(countries)
+    sections["cities.off"], sections["cities.heap"] = _string_column(cities)
+    sections["cities.hash"] = _hash_table(cities)
+    sections["country_ids"] = np.asarray(country_ids[:n_centers], dtype="<u4").tobytes()
+    sections["quantities"] = np.asarray(quantities[:n_centers, :n_items], dtype="<i8").tobytes(order="F")
+    sections["stocked"] = np.asarray(stocked[:n_centers, :n_items], dtype=bool).tobytes(order="F")
+    if packed:
+        # A roster already holds names and contacts in this layout
+        sections["names.off"], sections["names.heap"] = volunteers.names.column()
+        sections["contacts.off"], sections["contacts.heap"] = volunteers.contacts.column()
+        specialties = volunteers.specialties
+        sections["specs.off"], sections["specs.heap"] = _string_column(
+            specialties[code] for code in volunteers.codes[:len(volunteers)].tolist())
+    else:
+        for field, name in (("name", "names"), ("spec", "specs"), ("contact", "contacts")):
+            sections[f"{name}.off"], sections[f"{name}.heap"] = _string_column(v[field] for v in volunteers)
+    for name, column in (("lats", lats), ("lons", lons)):
+        column = np.full(n_centers, np.nan) if column is None else column[:n_centers]
+        sections[name] = np.asarray(column, dtype="<f8").tobytes()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        directory_at = HEADER.size
+        cursor = _aligned(directory_at + ENTRY.size * len(SECTIONS))
+        entries = []
+        for name in SECTIONS:
+            entries.append((cursor, len(sections[name])))
+            cursor = _aligned(cursor + len(sections[name]))
+
+        f.write(HEADER.pack(MAGIC, VERSION, len(SECTIONS), n_centers, n_items, len(countries), len(volunteers), wal_seq))
+        for entry in entries:
+            f.write(ENTRY.pack(*entry))
+        for name, (offset, _) in zip(SECTIONS, entries):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(sections[name])
+        f.flush()
+        os.fsync(f.fileno())
+        add_bytes("binary", f.tell())
+    os.replace(tmp_path, path)
+
+
+def write_store(path, store, volunteers, wal_seq=0):
+    """Snapshots an InventoryStore straight from its arrays."""
+    write_snapshot(path, list(store.cities), store.countries, store.country_ids, store.items,
+                   store.quantities, store.stocked, volunteers, wal_seq, store.lats, store.lons)
+
+
+def write_records(path, data):
+    """Converts a relief_data.json style dict into the binary format."""
+    store = InventoryStore()
+    for c in data["centers"]:
+        store.add_center(c["city"], c["country"], c.get("inventory"), c.get("lat"), c.get("lon"))
+    write_store(path, store, data["volunteers"], data.get("wal_seq", 0))
+
+
+def _aligned(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+class StringColumn(Sequence):
+    """Lazily decoded strings backed by an offset table and a heap in the mapping."""
+
+    def __init__(self, buffer, offsets, heap_start):
+        self._buffer = buffer
+        self._offsets = offsets
+        self._heap_start = heap_start
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        start = self._heap_start + int(self._offsets[i])
+        end = self._heap_start + int(self._offsets[i + 1])
+        return str(self._buffer[start:end], "utf-8")
+
+
+class MappedVolunteers(Sequence):
+    """
+    List-like volunteer roster: records in the snapshot are decoded on
+    access, and new registrations are appended in memory.
+    """
+
+    def __init__(self, names, specs, contacts):
+        self._names, self._specs, self._contacts = names, specs, contacts
+        self._mapped = len(names)
+        self._appended = []
+
+    def __len__(self):
+        return self._mapped + len(self._appended)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if i >= self._mapped:
+            return self._appended[i - self._mapped]
+        return {"name": self._names[i], "spec": self._specs[i], "contact": self._contacts[i]}
+
+    def append(self, volunteer):
+        self._appended.append(volunteer)
+
+
+class BinarySnapshot:
+    """
+    Read side of the binary format. The file is mapped copy-on-write, so
+    opening costs a header parse regardless of dataset size; numeric columns
+    are NumPy views and pages are read only when touched.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, n_sections, *counts = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or not 1 <= version <= VERSION:
+            raise ValueError(f"{path} is not a UnityGrid v{VERSION} snapshot.")
+        self.n_centers, self.n_items, self.n_countries, self.n_volunteers, self.wal_seq = counts
+        self._sections = {
+            name: ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size)
+            for i, name in enumerate(SECTIONS[:n_sections])
+        }
+
+    def _array(self, name, dtype, count, shape=None, order="C"):
+        offset, _ = self._sections[name]
+        array = np.frombuffer(self._mm, dtype=dtype, count=count, offset=offset)
+        return array if shape is None else array.reshape(shape, order=order)
+
+    def _strings(self, name, count):
+        offsets = self._array(f"{name}.off", "<u8", count + 1)
+        return StringColumn(self._mm, offsets, self._sections[f"{name}.heap"][0])
+
+    @property
+    def items(self):
+        return list(self._strings("items", self.n_items))
+
+    @property
+    def countries(self):
+        return list(self._strings("countries", self.n_countries))
+
+    @property
+    def cities(self):
+        return self._strings("cities", self.n_centers)
+
+    def find_city(self, key):
+        """Row of a normalized city name via the on-disk hash table, or None."""
+        offset, nbytes = self._sections["cities.hash"]
+        table = np.frombuffer(self._mm, dtype="<u4", count=nbytes // 4, offset=offset)
+        if not len(table):
+            return None
+        mask = len(table) - 1
+        slot = city_hash(key) & mask
+        cities = self.cities
+        while table[slot]:
+            row = int(table[slot]) - 1
+            if normalize_city(cities[row]) == key:
+                return row
+            slot = (slot + 1) & mask
+        return None
+
+    @property
+    def country_ids(self):
+        return self._array("country_ids", "<u4", self.n_centers)
+
+    @property
+    def quantities(self):
+        """(centers x items) int64 view; writes stay private to this process."""
+        return self._array("quantities", "<i8", self.n_centers * self.n_items, (self.n_centers, self.n_items), "F")
+
+    @property
+    def stocked(self):
+        return self._array("stocked", bool, self.n_centers * self.n_items, (self.n_centers, self.n_items), "F")
+
+    def coordinates(self):
+        """(lats, lons) views, or NaN-filled arrays for v1 snapshots that predate them."""
+        if "lats" not in self._sections:
+            missing = np.full(self.n_centers, np.nan)
+            return missing, missing.copy()
+        return self._array("lats", "<f8", self.n_centers), self._array("lons", "<f8", self.n_centers)
+
+    def volunteers(self):
+        return MappedVolunteers(
+            self._strings("names", self.n_volunteers),
+            self._strings("specs", self.n_volunteers),
+            self._strings("contacts", self.n_volunteers),
+        )
+
+    def to_records(self):
+        """Decodes everything into the relief_data.json layout (lossless)."""
+        items, countries = self.items, self.countries
+        quantities, stocked = self.quantities.tolist(), self.stocked.tolist()
+        country_ids = self.country_ids.tolist()
+        lats, lons = (column.tolist() for column in self.coordinates())
+        centers = []
+        for row, city in enumerate(self.cities):
+            center = {
+                "city": city,
+                "country": countries[country_ids[row]],
+                "inventory": {items[c]: quantities[row][c] for c in range(self.n_items) if stocked[row][c]},
+            }
+            if lats[row] == lats[row]:  # not NaN
+                center["lat"], center["lon"] = lats[row], lons[row]
+            centers.append(center)
+        data = {"centers": centers, "volunteers": list(self.volunteers())}
+        if self.wal_seq:
+            data["wal_seq"] = self.wal_seq
+        return data
+
+
+class MappedInventoryStore(InventoryStore):
+    """
+    An InventoryStore whose columns are views into a BinarySnapshot.
+    City lookups probe the snapshot's hash table directly; the in-memory
+    indexes are only built when a center is added or a country is queried,
+    so opening the engine does no per-center work.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.version = self.layout_version = 0
+        self._changes = itertools.count(1)
+        self.items = snapshot.items
+        self._item_index = {item: col for col, item in enumerate(self.items)}
+        self.countries = snapshot.countries
+        self.country_ids = snapshot.country_ids
+        if self.countries[:len(COUNTRIES)] != COUNTRIES:
+            # Written before country IDs followed the catalog: one gather re-numbers every hub
+            self.countries, remap = align_countries(self.countries)
+            self.country_ids = remap[self.country_ids]
+        self._country_index = {country: cid for cid, country in enumerate(self.countries)}
+        self.size = snapshot.n_centers
+        self.quantities = snapshot.quantities
+        self.stocked = snapshot.stocked
+        self.lats, self.lons = snapshot.coordinates()
+        self._cities = None
+        self._city_map = None
+        self._country_row_map = None
+        if self.size == 0 or not self.items:
+            # Give empty snapshots room to grow like a fresh store
+            rows = max(self.size, 64)
+            self.quantities = np.zeros((rows, 8), dtype=np.int64)
+            self.stocked = np.zeros((rows, 8), dtype=bool)
+            country_ids = self.country_ids
+            self.country_ids = np.zeros(rows, dtype=np.int32)
+            self.country_ids[:self.size] = country_ids
+            self.lats, self.lons = np.full(rows, np.nan), np.full(rows, np.nan)
+            self.lats[:self.size], self.lons[:self.size] = snapshot.coordinates()
+
+    @property
+    def cities(self):
+        return self._cities if self._cities is not None else self.snapshot.cities
+
+    @property
+    def _city_index(self):
+        if self._city_map is None:
+            self._cities = list(self.snapshot.cities)
+            self._city_map = {normalize_city(city): row for row, city in enumerate(self._cities)}
+        return self._city_map
+
+    def row_of(self, city):
+        if self._city_map is None:
+            return self.snapshot.find_city(normalize_city(city))
+        return self._city_map.get(normalize_city(city))
+
+    @property
+    def _country_rows(self):
+        if self._country_row_map is None:
+            ids = self.country_ids[:self.size]
+            order = np.argsort(ids, kind="stable")
+            bounds = np.searchsorted(ids[order], np.arange(len(self.countries) + 1))
+            self._country_row_map = {
+                cid: order[bounds[cid]:bounds[cid + 1]].tolist() for cid in range(len(self.countries))
+            }
+        return self._country_row_map
@@ -0,0 +1,124 @@
+import os
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:    # Windows
+    fcntl = None
+    import msvcrt
+
+
+class StripedLocks:
+    """
+    A fixed pool of locks shared out by hub row: updates to hubs on
+    different stripes run side by side, updates to the same hub queue.
+    """
+
+    def __init__(self, stripes=64):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self):
+        return len(self._locks)
+
+    def lock_for(self, row):
+        return self._locks[row % len(self._locks)]
+
+    @contextmanager
+    def hold(self, row):
+        with self.lock_for(row):
+            yield
+
+
+class FileLock:
+    """
+    Exclusive lock shared by every process that opens the same lock file
+    (flock on POSIX, a locked first byte on Windows). Threads of one
+    process queue on an ordinary lock first, so only one of them holds
+    the file at a time. The lock file stays open between acquisitions, so
+    taking the lock again costs one system call.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "a+b")
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        except BaseException:
+            self.close()
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._thread_lock.release()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class SyncPoint:
+    """
+    What the engine last read from, or wrote to, the shared snapshot: each
+    hub's record version, the hub count and roster lengths, and the synced
+    stock of every hub changed here since. A hub's row is copied the first
+    time it changes (touch()), so a commit costs O(changed hubs), not a
+    copy of the whole grid.
+    """
+
+    def __init__(self, versions, size, local_volunteers, disk_volunteers):
+        self.size = size
+        self.versions = np.asarray(versions, dtype=np.int64)
+        self.local_volunteers = local_volunteers
+        self.disk_volunteers = disk_volunteers
+        self._synced = {}   # row -> (quantities, stocked) as of the sync
+
+    def touch(self, store, rows):
+        """Call before changing `rows`: keeps their synced stock the first time each changes."""
+        n_items = len(store.items)
+        for row in rows:
+            if row < self.size and row not in self._synced:
+                self._synced[row] = (store.quantities[row, :n_items].copy(), store.stocked[row, :n_items].copy())
+
+    def changes(self, store):
+        """(rows, cols, deltas) of every cell of a synced hub changed since, new items included."""
+        n_items = len(store.items)
+        rows, cols, deltas = [], [], []
+        for row, (quantities, stocked) in self._synced.items():
+            delta = store.quantities[row, :n_items].copy()
+            delta[:len(quantities)] -= quantities
+            newly_stocked = store.stocked[row, :n_items].copy()
+            newly_stocked[:len(stocked)] &= ~stocked
+            changed = np.flatnonzero((delta != 0) | newly_stocked)
+            rows.extend([row] * len(changed))
+            cols.extend(changed.tolist())
+            deltas.extend(delta[changed].tolist())
+        return rows, cols, deltas
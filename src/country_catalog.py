@@ -0,0 +1,167 @@
+import re
+import unicodedata
+
+import numpy as np
+
+# The complete global database (195 countries), grouped by continent.
+# Imported once per process and shared by the engine and the app.
+WORLD_DATA = {
+    "Africa": [
+        "Algeria", "Angola", "Benin", "Botswana", "Burkina Faso", "Burundi", "Cabo Verde", "Cameroon", 
+        "Central African Republic", "Chad", "Comoros", "Congo (Brazzaville)", "DR Congo", "Côte d'Ivoire", 
+        "Djibouti", "Egypt", "Equatorial Guinea", "Eritrea", "Eswatini", "Ethiopia", "Gabon", "Gambia", 
+        "Ghana", "Guinea", "Guinea-Bissau", "Kenya", "Lesotho", "Liberia", "Libya", "Madagascar", "Malawi", 
+        "Mali", "Mauritania", "Mauritius", "Morocco", "Mozambique", "Namibia", "Niger", "Nigeria", "Rwanda", 
+        "São Tomé and Príncipe", "Senegal", "Seychelles", "Sierra Leone", "Somalia", "South Africa", 
+        "South Sudan", "Sudan", "Tanzania", "Togo", "Tunisia", "Uganda", "Zambia", "Zimbabwe"
+    ],
+    "Asia": [
+        "Afghanistan", "Armenia", "Azerbaijan", "Bahrain", "Bangladesh", "Bhutan", "Brunei", "Cambodia", 
+        "China", "Cyprus", "Georgia", "India", "Indonesia", "Iran", "Iraq", "Israel", "Japan", "Jordan", 
+        "Kazakhstan", "Kuwait", "Kyrgyzstan", "Laos", "Lebanon", "Malaysia", "Maldives", "Mongolia", 
+        "Myanmar", "Nepal", "North Korea", "Oman", "Pakistan", "Palestine", "Philippines", "Qatar", 
+        "Saudi Arabia", "Singapore", "South Korea", "Sri Lanka", "Syria", "Tajikistan", "Thailand", 
+        "Timor-Leste", "Türkiye", "Turkmenistan", "United Arab Emirates", "Uzbekistan", "Vietnam", "Yemen"
+    ],
+    "Europe": [
+        "Albania", "Andorra", "Austria", "Belarus", "Belgium", "Bosnia and Herzegovina", "Bulgaria", 
+        "Croatia", "Czechia", "Denmark", "Estonia", "Finland", "France", "Germany", "Greece", "Hungary", 
+        "Iceland", "Ireland", "Italy", "Latvia", "Liechtenstein", "Lithuania", "Luxembourg", "Malta", 
+        "Moldova", "Monaco", "Montenegro", "Netherlands", "North Macedonia", "Norway", "Poland", "Portugal", 
+        "Romania", "Russia", "San Marino", "Serbia", "Slovakia", "Slovenia", "Spain", "Sweden", "Switzerland", 
+        "Ukraine", "United Kingdom", "Vatican City"
+    ],
+    "North America": [
+        "Antigua and Barbuda", "Bahamas", "Barbados", "Belize", "Canada", "Costa Rica", "Cuba", "Dominica", 
+        "Dominican Republic", "El Salvador", "Grenada", "Guatemala", "Haiti", "Honduras", "Jamaica", "Mexico", 
+        "Nicaragua", "Panama", "Saint Kitts and Nevis", "Saint Lucia", "Saint Vincent and the Grenadines", 
+        "Trinidad and Tobago", "United States"
+    ],
+    "South America": [
+        "Argentina", "Bolivia", "Brazil", "Chile", "Colombia", "Ecuador", "Guyana", "Paraguay", "Peru", 
+        "Suriname", "Uruguay", "Venezuela"
+    ],
+    "Oceania": [
+        "Australia", "Fiji", "Kiribati", "Marshall Islands", "Micronesia", "Nauru", "New Zealand", "Palau", 
+        "Papua New Guinea", "Samoa", "Solomon Islands", "Tonga", "Tuvalu", "Vanuatu"
+    ]
+}
+
+
+# Other spellings in use for catalog countries (older names, abbreviations,
+# official long forms). Lookups are also case, accent and punctuation
+# insensitive, so "cote d'ivoire" or "TURKIYE" need no entry here.
+ALIASES = {
+    "Türkiye": ["Turkey", "Republic of Türkiye"],
+    "United States": ["USA", "US", "U.S.A.", "United States of America"],
+    "United Kingdom": ["UK", "U.K.", "Great Britain", "Britain"],
+    "United Arab Emirates": ["UAE", "U.A.E.", "Emirates"],
+    "Côte d'Ivoire": ["Ivory Coast"],
+    "DR Congo": ["Democratic Republic of the Congo", "DRC", "Congo-Kinshasa"],
+    "Congo (Brazzaville)": ["Republic of the Congo", "Congo-Brazzaville"],
+    "Cabo Verde": ["Cape Verde"],
+    "Eswatini": ["Swaziland"],
+    "Czechia": ["Czech Republic"],
+    "North Macedonia": ["Macedonia"],
+    "Vatican City": ["Holy See", "Vatican"],
+    "Russia": ["Russian Federation"],
+    "Moldova": ["Republic of Moldova"],
+    "Netherlands": ["Holland"],
+    "Myanmar": ["Burma"],
+    "Timor-Leste": ["East Timor"],
+    "South Korea": ["Republic of Korea"],
+    "North Korea": ["DPRK"],
+    "Iran": ["Islamic Republic of Iran"],
+    "Syria": ["Syrian Arab Republic"],
+    "Laos": ["Lao PDR"],
+    "Vietnam": ["Viet Nam"],
+    "Brunei": ["Brunei Darussalam"],
+    "Palestine": ["State of Palestine"],
+    "Tanzania": ["United Republic of Tanzania"],
+    "Micronesia": ["Federated States of Micronesia"],
+}
+
+# Catalog entries renamed since earlier releases -> the name they had then.
+# Mock data is still seeded with the old name, so its numbers do not change.
+LEGACY_NAMES = {"Türkiye": "Turkey"}
+
+
+def country_key(name):
+    """Lookup key for a country name: accents and punctuation dropped, case folded, "&" read as "and"."""
+    text = unicodedata.normalize("NFKD", name.replace("&", " and "))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    words = re.sub(r"[^\w]+", " ", text).split()
+    if words[:1] == ["the"]:
+        words = words[1:]
+    return " ".join(words)
+
+
+# 1. Dense integer IDs: a country's ID is its position in catalog order
+#    (continent by continent), so per-country data can live in arrays
+#    of len(COUNTRIES) indexed by ID.
+COUNTRIES = [country for group in WORLD_DATA.values() for country in group]
+
+# 2. Precomputed lookup tables: exact spellings first (the hot path; no
+#    normalization), then normalized keys of every name and alias
+LOOKUP = {}
+for _cid, _name in enumerate(COUNTRIES):
+    for _spelling in [_name] + ALIASES.get(_name, []):
+        LOOKUP[country_key(_spelling)] = _cid
+_EXACT = {_spelling: _cid for _cid, _name in enumerate(COUNTRIES) for _spelling in [_name] + ALIASES.get(_name, [])}
+
+
+def all_countries():
+    """Every country in catalog order (continent by continent)."""
+    return list(COUNTRIES)
+
+
+def country_id(name):
+    """Catalog ID of a country name or alias, or None when it is not in the catalog."""
+    cid = _EXACT.get(name)
+    if cid is None and name:
+        cid = LOOKUP.get(country_key(name))
+        if cid is not None:
+            _EXACT[name] = cid
+    return cid
+
+
+def canonical_country(name):
+    """The catalog spelling of `name`; names outside the catalog come back whitespace-trimmed."""
+    cid = country_id(name)
+    return COUNTRIES[cid] if cid is not None else " ".join(name.split())
+
+
+def align_countries(names):
+    """
+    Maps a country list with its own IDs (e.g. an older snapshot's) onto
+    catalog IDs. Returns (countries, remap): `countries` is the catalog
+    followed by the names it does not hold, and remap[old_id] is the new ID.
+    """
+    countries = list(COUNTRIES)
+    index = {}
+    remap = np.empty(len(names), dtype=np.int32)
+    for old, name in enumerate(names):
+        cid = country_id(name)
+        if cid is None:
+            key = country_key(name)
+            if key not in index:
+                index[key] = len(countries)
+                countries.append(name)
+            cid = index[key]
+        remap[old] = cid
+    return countries, remap
+
+
+# Country -> continent, for grouping per-country data along WORLD_DATA's groups;
+# countries missing from the catalog fall under OTHER
+CONTINENT_OF = {country: continent for continent, group in WORLD_DATA.items() for country in group}
+OTHER = "Other"
+CONTINENTS = list(WORLD_DATA) + [OTHER]
+# Continent index of every catalog ID
+CONTINENT_IDS = np.array([CONTINENTS.index(CONTINENT_OF[c]) for c in COUNTRIES], dtype=np.intp)
+
+
+def continent_id(country):
+    """Index into CONTINENTS of the continent holding `country` (any catalog spelling)."""
+    cid = country_id(country)
+    return len(CONTINENTS) - 1 if cid is None else int(CONTINENT_IDS[cid])
@@ -1,33 +1,192 @@
 import json
 import os
 
+import binary_snapshot
+from concurrent_writes import FileLock
+from instrumentation import add_bytes, timed
+from journal import Journal, replay, wal_lock_path, wal_paths
+from sqlite_backend import SQLiteBackend
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+BINARY_SUFFIX = ".ugrid"
+
+def center_record(c):
+    """The relief_data.json layout of one AidCenter; coordinates only when known."""
+    record = {"city": c.city, "country": c.country, "inventory": c.inventory}
+    if getattr(c, "lat", None) is not None:
+        record["lat"], record["lon"] = c.lat, c.lon
+    return record
+
 class DatabaseHelper:
-    """Handles saving and loading the UnityGrid state to JSON."""
-    
+    """Handles saving and loading the UnityGrid state to JSON or SQLite."""
+
     @staticmethod
-    def save_to_json(centers, volunteers, file_path="data/relief_data.json"):
-        # Ensure the data directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
+    def is_sqlite(file_path):
+        return file_path.lower().endswith(SQLITE_SUFFIXES)
+
+    @staticmethod
+    def is_binary(file_path):
+        return file_path.lower().endswith(BINARY_SUFFIX)
+
+    @staticmethod
+    @timed
+    def save_to_json(centers, volunteers, file_path="data/relief_data.json", wal_seq=None):
         # Convert objects to a format JSON understands (dictionaries)
         data = {
-            "centers": [
-                {
-                    "city": c.city,
-                    "country": c.country,
-                    "inventory": c.inventory
-                } for c in centers
-            ],
-            "volunteers": volunteers
+            "centers": [center_record(c) for c in centers],
+            "volunteers": list(volunteers)
         }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        if wal_seq is not None:
+            data["wal_seq"] = wal_seq
+
+        DatabaseHelper.write_snapshot(data, file_path, indent=4)
         print(f"\n[System] Data successfully backed up to {file_path}")
 
     @staticmethod
+    @timed
     def load_from_json(file_path="data/relief_data.json"):
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
+        """Loads the snapshot and replays any journaled updates recorded after it."""
+        has_wal = any(os.path.exists(p) for p in wal_paths(file_path))
+        if not os.path.exists(file_path) and not has_wal:
+            return None
+        if not has_wal:
+            return DatabaseHelper.read_snapshot(file_path)
+        # Neither a compaction nor a seal can move records between the snapshot and the WAL mid-read
+        with FileLock(DatabaseHelper.lock_path(file_path)), FileLock(wal_lock_path(file_path)):
+            return replay(DatabaseHelper.read_snapshot(file_path), file_path)
+
+    @staticmethod
+    def read_snapshot(file_path):
+        if not os.path.exists(file_path):
+            return {"centers": [], "volunteers": []}
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    @timed
+    def write_snapshot(data, file_path, indent=None):
+        """Writes to a temp file and renames it over the target, so a crash never truncates it."""
+        # Ensure the data directory exists
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+            add_bytes("json", f.tell())
+        os.replace(tmp_path, file_path)
+
+    @staticmethod
+    def lock_path(file_path):
+        return file_path + ".lock"
+
+    @staticmethod
+    @timed
+    def merge_into_json(file_path, merge):
+        """
+        Read-modify-write of the JSON snapshot under its file lock, so writers
+        in other processes never overwrite each other. `merge(data)` edits the
+        freshly read snapshot in place; its result is returned.
+        """
+        with FileLock(DatabaseHelper.lock_path(file_path)):
+            data = DatabaseHelper.read_snapshot(file_path)
+            result = merge(data)
+            DatabaseHelper.write_snapshot(data, file_path, indent=4)
+        return result
+
+    @staticmethod
+    def open_journal(file_path="data/relief_data.json", start_seq=0, fsync=True, compact_interval=30.0):
+        """Journaled persistence mode: constant-cost appends plus background snapshot compaction."""
+        return Journal(file_path, start_seq=start_seq, fsync=fsync, compact_interval=compact_interval)
+
+    # ------------------------------------------------------------------
+    # SQLite storage engine
+    # ------------------------------------------------------------------
+    @staticmethod
+    def open_sqlite(db_path="data/relief_data.db", pool_size=4, batch_size=500):
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        return SQLiteBackend(db_path, pool_size=pool_size, batch_size=batch_size)
+
+    @staticmethod
+    @timed
+    def save_to_sqlite(centers, volunteers, db_path="data/relief_data.db"):
+        backend = DatabaseHelper.open_sqlite(db_path, pool_size=1)
+        try:
+            backend.save_state(centers, volunteers)
+        finally:
+            backend.close()
+        print(f"\n[System] Data successfully backed up to {db_path}")
+
+    @staticmethod
+    @timed
+    def load_from_sqlite(db_path="data/relief_data.db"):
+        if not os.path.exists(db_path):
+            return None
+        backend = DatabaseHelper.open_sqlite(db_path, pool_size=1)
+        try:
+            return backend.load_state()
+        finally:
+            backend.close()
+
+    @staticmethod
+    def migrate_json_to_sqlite(json_path="data/relief_data.json", db_path="data/relief_data.db"):
+        """One-shot copy of an existing relief_data.json (plus any WAL tail) into SQLite."""
+        data = DatabaseHelper.load_from_json(json_path)
+        if data is None:
+            raise FileNotFoundError(json_path)
+        backend = DatabaseHelper.open_sqlite(db_path, pool_size=1)
+        try:
+            backend.import_records(data["centers"], data["volunteers"])
+        finally:
+            backend.close()
+        return len(data["centers"]), len(data["volunteers"])
+
+    # ------------------------------------------------------------------
+    # Memory-mapped binary snapshots
+    # ------------------------------------------------------------------
+    @staticmethod
+    @timed
+    def open_binary(file_path="data/relief_data.ugrid"):
+        """Maps a binary snapshot; nothing beyond the header is read until it is touched."""
+        if not os.path.exists(file_path):
+            return None
+        return binary_snapshot.BinarySnapshot(file_path)
+
+    @staticmethod
+    @timed
+    def save_to_binary(store, volunteers, file_path="data/relief_data.ugrid", wal_seq=0):
+        binary_snapshot.write_store(file_path, store, volunteers, wal_seq)
+        print(f"\n[System] Data successfully backed up to {file_path}")
+
+    @staticmethod
+    def json_to_binary(json_path="data/relief_data.json", binary_path="data/relief_data.ugrid"):
+        data = DatabaseHelper.load_from_json(json_path)
+        if data is None:
+            raise FileNotFoundError(json_path)
+        binary_snapshot.write_records(binary_path, data)
+
+    @staticmethod
+    def binary_to_json(binary_path="data/relief_data.ugrid", json_path="data/relief_data.json"):
+        snapshot = DatabaseHelper.open_binary(binary_path)
+        if snapshot is None:
+            raise FileNotFoundError(binary_path)
+        DatabaseHelper.write_snapshot(snapshot.to_records(), json_path, indent=4)
+
+
+if __name__ == "__main__":
+    # Usage: python src/database_helper.py [source] [target]
+    #   relief_data.json -> relief_data.db      one-shot SQLite migration
+    #   relief_data.json <-> relief_data.ugrid  binary snapshot conversion
+    import sys
+
+    source = sys.argv[1] if len(sys.argv) > 1 else "data/relief_data.json"
+    target = sys.argv[2] if len(sys.argv) > 2 else "data/relief_data.db"
+    if DatabaseHelper.is_binary(source):
+        DatabaseHelper.binary_to_json(source, target)
+        print(f"[System] Converted {source} into {target}")
+    elif DatabaseHelper.is_binary(target):
+        DatabaseHelper.json_to_binary(source, target)
+        print(f"[System] Converted {source} into {target}")
+    else:
+        n_centers, n_volunteers = DatabaseHelper.migrate_json_to_sqlite(source, target)
+        print(f"[System] Migrated {n_centers} centers and {n_volunteers} volunteers into {target}")
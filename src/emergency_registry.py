@@ -0,0 +1,71 @@
+import numpy as np
+
+from country_catalog import COUNTRIES, country_id
+
+# Emergency numbers by country (any catalog spelling). Numbers are strings
+# to keep their formatting ("000", "10111").
+CONTACTS = {
+    "Afghanistan": {"Police": "119", "Ambulance": "102", "Fire": "119"},
+    "Australia": {"Police": "000", "Ambulance": "000", "Fire": "000"},
+    "Brazil": {"Police": "190", "Ambulance": "192", "Fire": "193"},
+    "Canada": {"Police": "911", "Ambulance": "911", "Fire": "911"},
+    "China": {"Police": "110", "Ambulance": "120", "Fire": "119"},
+    "France": {"Police": "17", "Ambulance": "15", "Fire": "18"},
+    "Germany": {"Police": "110", "Ambulance": "112", "Fire": "112"},
+    "India": {"Police": "112", "Ambulance": "112", "Fire": "112"},
+    "Japan": {"Police": "110", "Ambulance": "119", "Fire": "119"},
+    "Mexico": {"Police": "911", "Ambulance": "911", "Fire": "911"},
+    "Pakistan": {"Police": "15", "Ambulance": "115", "Fire": "16"},
+    "South Africa": {"Police": "10111", "Ambulance": "10177", "Fire": "10177"},
+    "Türkiye": {"Police": "155", "Ambulance": "112", "Fire": "110", "AFAD": "122"},
+    "UAE": {"Police": "999", "Ambulance": "998", "Fire": "997"},
+    "UK": {"Police": "999", "Ambulance": "999", "Fire": "999"},
+    "USA": {"Police": "911", "Ambulance": "911", "Fire": "911"},
+}
+
+
+class EmergencyRegistry:
+    """
+    Global emergency contact numbers, shared by the engine and the app.
+
+    Numbers sit in one (countries x services) array indexed by catalog
+    country ID, so the numbers for many hubs at once are a single gather
+    over their country IDs; "" marks a service a country does not list.
+    """
+
+    def __init__(self, contacts=CONTACTS):
+        self.services = list(dict.fromkeys(service for numbers in contacts.values() for service in numbers))
+        self.numbers = np.full((len(COUNTRIES), len(self.services)), "", dtype=object)
+        self.listed = np.zeros(len(COUNTRIES), dtype=bool)
+        for country, numbers in contacts.items():
+            cid = country_id(country)
+            if cid is None:
+                raise ValueError(f"'{country}' is not in the country catalog.")
+            for service, number in numbers.items():
+                self.numbers[cid, self.services.index(service)] = number
+            self.listed[cid] = True
+
+    @property
+    def contacts(self):
+        """{country: {service: number}} for every listed country, in catalog order."""
+        return {COUNTRIES[cid]: self.lookup(cid) for cid in np.flatnonzero(self.listed).tolist()}
+
+    def lookup(self, country):
+        """Numbers for one country, by name, alias or catalog ID; {} when none are listed."""
+        cid = country if isinstance(country, (int, np.integer)) else country_id(country)
+        if cid is None or cid >= len(COUNTRIES) or not self.listed[cid]:
+            return {}
+        return {service: n for service, n in zip(self.services, self.numbers[cid].tolist()) if n}
+
+    def gather(self, country_ids):
+        """
+        (numbers, listed) for an array of country IDs: numbers is
+        len(ids) x services. IDs outside the catalog come back unlisted.
+        """
+        ids = np.asarray(country_ids, dtype=np.intp)
+        known = ids < len(COUNTRIES)
+        safe = np.where(known, ids, 0)
+        numbers = self.numbers[safe]
+        listed = self.listed[safe] & known
+        numbers[~listed] = ""
+        return numbers, listed
@@ -0,0 +1,252 @@
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+from collections import Counter
+
+DEFAULT_AGGREGATES = "data/event_aggregates.json"
+CHUNK_BYTES = 4 * 1024 * 1024
+FINGERPRINT_BYTES = 4096
+
+# Column names accepted for each field (EM-DAT style exports and plain snake_case)
+FIELD_ALIASES = {
+    "year": ("year", "start year", "start_year", "event year", "date", "start date", "start_date"),
+    "type": ("type", "disaster type", "disaster_type", "event type", "event_type", "hazard"),
+    "region": ("region", "continent", "subregion", "area"),
+    "affected": ("affected", "total affected", "total_affected", "people affected"),
+}
+
+
+def _field_map(columns):
+    """Maps our field names to the matching column of a CSV header / JSON record."""
+    lowered = {c.strip().lower(): c for c in columns}
+    mapping = {}
+    for field, aliases in FIELD_ALIASES.items():
+        for alias in aliases:
+            if alias in lowered:
+                mapping[field] = lowered[alias]
+                break
+    return mapping
+
+
+def _year(value):
+    text = str(value).strip()
+    return int(text[:4]) if text[:4].isdigit() else None
+
+
+def _affected(value):
+    try:
+        return int(float(value)) if value not in (None, "") else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _fingerprint(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read(FINGERPRINT_BYTES)).hexdigest()
+
+
+def records_end(data, is_jsonl):
+    """Length of the whole records at the start of `data`: up to its last newline outside CSV quotes."""
+    end = data.rfind(b"\n") + 1
+    if is_jsonl:
+        return end
+    # A newline inside a quoted field has an odd number of quotes before it
+    quotes = data.count(b'"', 0, end)
+    while end and quotes % 2:
+        previous = data.rfind(b"\n", 0, end - 1) + 1
+        quotes -= data.count(b'"', previous, end)
+        end = previous
+    return end
+
+
+def _is_json_object(text):
+    """Whether a JSONL file's last line, with no newline after it, already holds a whole object."""
+    try:
+        return isinstance(json.loads(text), dict)
+    except json.JSONDecodeError:
+        return False
+
+
+class FileAggregate:
+    """Rolled-up counts contributed by one source file, plus how far it was read."""
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.offset = state.get("offset", 0)
+        self.fingerprint = state.get("fingerprint")
+        self.header = state.get("header")
+        self.rows = state.get("rows", 0)
+        self.rejected = state.get("rejected", 0)
+        self.by_year_type = Counter({tuple(k.split("|", 1)): v for k, v in state.get("by_year_type", {}).items()})
+        self.by_region = Counter(state.get("by_region", {}))
+        self.affected_by_region = Counter(state.get("affected_by_region", {}))
+
+    def add(self, year, event_type, region, affected):
+        self.rows += 1
+        self.by_year_type[(str(year), event_type)] += 1
+        self.by_region[region] += 1
+        self.affected_by_region[region] += affected
+
+    def to_state(self):
+        return {
+            "offset": self.offset,
+            "fingerprint": self.fingerprint,
+            "header": self.header,
+            "rows": self.rows,
+            "rejected": self.rejected,
+            "by_year_type": {f"{y}|{t}": n for (y, t), n in self.by_year_type.items()},
+            "by_region": dict(self.by_region),
+            "affected_by_region": dict(self.affected_by_region),
+        }
+
+
+class EventAggregates:
+    """
+    Incrementally maintained rollups of large disaster-event catalogs.
+
+    `ingest` streams a CSV or JSONL file in fixed-size chunks, so memory use
+    is bounded by the chunk size, never the file size. Chunks are cut at
+    record boundaries (CSV fields may hold quoted newlines). A final JSONL
+    object without a trailing newline is read once it parses; a final CSV
+    row waits for its newline, since it may still be being written. The byte
+    offset of the last record read is persisted per file; re-ingesting an
+    appended file resumes from there, while a rewritten file (its first
+    bytes changed) is re-read from the start.
+    """
+
+    def __init__(self, path=DEFAULT_AGGREGATES):
+        self.path = path
+        self.files = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.files = {name: FileAggregate(s) for name, s in state.get("files", {}).items()}
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+    def ingest(self, source, chunk_bytes=CHUNK_BYTES, progress=None):
+        """Processes the unread tail of `source`; returns the number of new rows."""
+        key = os.path.abspath(source)
+        agg = self.files.get(key)
+        fingerprint = _fingerprint(source)
+        size = os.path.getsize(source)
+        if agg is None or agg.fingerprint != fingerprint or size < agg.offset:
+            agg = self.files[key] = FileAggregate({"fingerprint": fingerprint})
+
+        is_jsonl = source.lower().endswith((".jsonl", ".ndjson"))
+        rows_before = agg.rows
+        with open(source, "rb") as f:
+            f.seek(agg.offset)
+            carry = b""
+            while True:
+                chunk = f.read(chunk_bytes)
+                if not chunk:
+                    # An unterminated JSON object is whole once it parses; a CSV row
+                    # may still be mid-write (`...,12` of `...,120000`), so it waits for its newline
+                    text = carry.decode("utf-8-sig" if agg.offset == 0 else "utf-8", errors="replace")
+                    if is_jsonl and carry.strip() and _is_json_object(text):
+                        self._consume(agg, text, is_jsonl)
+                        agg.offset += len(carry)
+                    break
+                data = carry + chunk
+                cut = records_end(data, is_jsonl)
+                # Only whole records are consumed; a partial one waits for more data
+                lines, carry = data[:cut], data[cut:]
+                if lines:
+                    # Exports often start with a byte order mark
+                    text = lines.decode("utf-8-sig" if agg.offset == 0 else "utf-8", errors="replace")
+                    self._consume(agg, text, is_jsonl)
+                    agg.offset += len(lines)
+                if progress:
+                    progress(agg.offset, size)
+        return agg.rows - rows_before
+
+    def _consume(self, agg, text, is_jsonl):
+        if is_jsonl:
+            records = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    agg.rejected += 1
+        else:
+            reader = csv.reader(io.StringIO(text))
+            if agg.header is None:
+                agg.header = next(reader, None)
+            header = agg.header
+            records = (dict(zip(header, row)) for row in reader if row)
+            # From the header, not a record: a short first row would drop columns
+            mapping = _field_map(header or [])
+
+        for record in records:
+            if is_jsonl:
+                mapping = _field_map(record.keys())
+            year = _year(record.get(mapping.get("year"), ""))
+            event_type = str(record.get(mapping.get("type"), "")).strip()
+            if year is None or not event_type:
+                agg.rejected += 1
+                continue
+            region = str(record.get(mapping.get("region"), "") or "Unknown").strip()
+            agg.add(year, event_type, region, _affected(record.get(mapping.get("affected"))))
+
+    def save(self):
+        state = {"files": {name: agg.to_state() for name, agg in self.files.items()}}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    # ------------------------------------------------------------------
+    # Rollups for the Awareness page
+    # ------------------------------------------------------------------
+    def _merged(self, attribute):
+        total = Counter()
+        for agg in self.files.values():
+            total.update(getattr(agg, attribute))
+        return total
+
+    @property
+    def rows(self):
+        return sum(agg.rows for agg in self.files.values())
+
+    def trends(self, top_types=3):
+        """[(year, type, count)] for the `top_types` most frequent disaster types."""
+        by_year_type = self._merged("by_year_type")
+        per_type = Counter()
+        for (_, event_type), n in by_year_type.items():
+            per_type[event_type] += n
+        keep = {t for t, _ in per_type.most_common(top_types)}
+        return sorted((int(y), t, n) for (y, t), n in by_year_type.items() if t in keep)
+
+    def regional_impact(self):
+        """{region: people affected}, falling back to event counts when no impact column exists."""
+        affected = self._merged("affected_by_region")
+        if sum(affected.values()):
+            return dict(affected)
+        return dict(self._merged("by_region"))
+
+
+def load_aggregates(path=DEFAULT_AGGREGATES):
+    """The persisted rollups, or None if nothing has been ingested yet."""
+    if not os.path.exists(path):
+        return None
+    return EventAggregates(path)
+
+
+if __name__ == "__main__":
+    # Usage: python src/event_ingest.py events.csv [more.jsonl ...]
+    aggregates = EventAggregates()
+    for source in sys.argv[1:]:
+        def report(done, total, source=source):
+            print(f"\r[Ingest] {source}: {done / max(total, 1):6.1%} ({done:,} / {total:,} bytes)", end="")
+        added = aggregates.ingest(source, progress=report)
+        print(f"\n[Ingest] {source}: {added:,} new events")
+    aggregates.save()
+    print(f"[System] {aggregates.rows:,} events rolled up into {aggregates.path}")
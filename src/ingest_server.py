@@ -0,0 +1,249 @@
+import asyncio
+import json
+import signal
+import sys
+from functools import partial
+
+from instrumentation import start_exporter
+from models import UnityGridEngine
+
+MAX_LINE_BYTES = 64 * 1024
+
+
+def _error(message):
+    return {"ok": False, "error": message}
+
+
+def _pending(error):
+    """Applied in memory but not yet on disk; later commits persist it, so it must not be resent."""
+    return {"ok": True, "warning": f"applied, persistence pending: {error}"}
+
+
+def _text(value):
+    return isinstance(value, str) and bool(value.strip())
+
+
+class IngestServer:
+    """
+    Asyncio front door for field teams: newline-delimited JSON over TCP.
+
+    Requests look like
+        {"id": 7, "op": "inventory", "city": "Antakya", "item": "Medical Kits", "qty": 40}
+        {"id": 8, "op": "volunteer", "name": "...", "spec": "Medical", "contact": "..."}
+    and each gets one {"id": ..., "ok": true} / {"id": ..., "ok": false, "error": ...}
+    line back, sent once the change is durable. When the commit fails the
+    change is still applied, and the reply says so: {"ok": true, "warning":
+    "applied, persistence pending: ..."} (resending it would apply it twice).
+
+    - Connections only enqueue; one writer task owns the engine, so there is
+      no locking on the write path.
+    - The writer drains the queue into micro-batches of up to `batch_size`
+      requests, waiting at most `flush_interval` seconds to fill one, applies
+      each batch with one apply_updates and one register_volunteers, and
+      makes it durable with one engine.commit() (one fsync / one SQLite
+      transaction).
+    - The queue holds at most `max_pending` requests. When it is full,
+      connections stop reading, and TCP pushes back on the clients.
+    """
+
+    def __init__(self, engine, host="127.0.0.1", port=8765, batch_size=1024, flush_interval=0.005, max_pending=8192):
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.stats = {"requests": 0, "rejected": 0, "batches": 0}
+        self._server = None
+        self._queue = None
+        self._writer_task = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self):
+        self._queue = asyncio.Queue(self.max_pending)
+        self._writer_task = asyncio.create_task(self._run_writer())
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_LINE_BYTES, backlog=4096
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        """Stops accepting, acknowledges everything already queued, then returns."""
+        self._server.close()
+        await self._server.wait_closed()
+        await self._queue.put(None)
+        await self._writer_task
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+    async def _handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        outstanding = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                if not isinstance(request, dict):
+                    writer.write(_encode(None, _error("expected one JSON object per line")))
+                    continue
+                future = loop.create_future()
+                future.add_done_callback(partial(_respond, writer, request.get("id")))
+                future.add_done_callback(outstanding.discard)
+                outstanding.add(future)
+                # Blocks while the queue is full: this connection stops being read
+                await self._queue.put((request, future))
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # ValueError: a line longer than MAX_LINE_BYTES
+            pass
+        finally:
+            # A client may stop sending before its requests are durable: ack them first
+            try:
+                if outstanding:
+                    await asyncio.gather(*outstanding, return_exceptions=True)
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    # ------------------------------------------------------------------
+    # Single writer
+    # ------------------------------------------------------------------
+    async def _next_batch(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size and batch[-1] is not None:
+            if self._queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(remaining)
+                continue
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run_writer(self):
+        while True:
+            batch = await self._next_batch()
+            stopping = batch[-1] is None
+            batch = [entry for entry in batch if entry is not None]
+            if batch:
+                # Only this batch can fail; the writer keeps serving the queue
+                results = await self._process([request for request, _ in batch])
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+                self.stats["batches"] += 1
+            if stopping:
+                return
+
+    async def _process(self, requests):
+        """Validates, applies and commits one micro-batch; returns one result per request."""
+        loop = asyncio.get_running_loop()
+        try:
+            results, updates, volunteers = self._validate(requests)
+        except Exception as e:
+            # Nothing was applied: clients may retry
+            return [_error(f"not applied: {e}") for _ in requests]
+        # Both steps change memory before they write anything, so once one has started
+        # its requests count as applied: a client retrying them would apply them twice
+        applied = set()
+        try:
+            applied.add("volunteer")
+            if volunteers:
+                self.engine.register_volunteers(volunteers)
+            applied.add("inventory")
+            self.engine.apply_updates(*updates)
+            # The loop keeps queueing requests while the disk flush runs
+            await loop.run_in_executor(None, self.engine.commit)
+        except Exception as e:
+            return [
+                result if not result["ok"]
+                else _pending(e) if request.get("op") in applied
+                else _error(f"not applied: {e}")
+                for request, result in zip(requests, results)
+            ]
+        return results
+
+    def _validate(self, requests):
+        """
+        Checks one micro-batch without applying it: one result per request,
+        plus the accepted (rows, cols, qtys) and volunteer records.
+        """
+        store = self.engine.store
+        results = []
+        rows, cols, qtys = [], [], []
+        volunteers = []
+        for request in requests:
+            op = request.get("op")
+            if op == "inventory":
+                row = store.row_of(request["city"]) if _text(request.get("city")) else None
+                item, qty = request.get("item"), request.get("qty")
+                if row is None:
+                    result = _error(f"unknown city {request.get('city')!r}")
+                elif not _text(item):
+                    result = _error("missing item")
+                elif not isinstance(qty, int) or isinstance(qty, bool):
+                    result = _error(f"invalid quantity {qty!r}")
+                else:
+                    rows.append(row)
+                    cols.append(store.item_id(item, create=True))
+                    qtys.append(qty)
+                    result = {"ok": True}
+            elif op == "volunteer":
+                fields = [request.get(k) for k in ("name", "spec", "contact")]
+                if all(_text(f) for f in fields):
+                    volunteers.append(dict(zip(("name", "spec", "contact"), fields)))
+                    result = {"ok": True}
+                else:
+                    result = _error("name, spec and contact are required")
+            else:
+                result = _error(f"unknown op {op!r}")
+            results.append(result)
+        self.stats["requests"] += len(requests)
+        self.stats["rejected"] += sum(not r["ok"] for r in results)
+        return results, (rows, cols, qtys), volunteers
+
+
+def _encode(request_id, result):
+    return (json.dumps({"id": request_id, **result}, separators=(",", ":")) + "\n").encode()
+
+
+def _respond(writer, request_id, future):
+    if future.cancelled() or writer.is_closing():
+        return
+    writer.write(_encode(request_id, future.result()))
+
+
+async def serve(data_file, port):
+    engine = UnityGridEngine(data_file, journaled=data_file.lower().endswith(".json"), group_commit=True)
+    server = await IngestServer(engine, port=port).start()
+    start_exporter()
+    print(f"[Server] listening on {server.host}:{server.port}", flush=True)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    await server.close()
+    engine.save_state()
+    stats = server.stats
+    print(f"[Server] {stats['requests']:,} requests in {stats['batches']:,} batches, "
+          f"{stats['rejected']:,} rejected", flush=True)
+
+
+if __name__ == "__main__":
+    # Usage: python src/ingest_server.py [data/relief_data.json] [port]
+    data_file = sys.argv[1] if len(sys.argv) > 1 else "data/relief_data.json"
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+    asyncio.run(serve(data_file, port))
@@ -0,0 +1,219 @@
+import atexit
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+# Set UNITYGRID_METRICS=1 before starting the CLI, server or `streamlit run`.
+# Decorators are bound at import: in a process started without it, @timed
+# returns the undecorated function, so disabled instrumentation costs nothing.
+ENABLED = os.environ.get("UNITYGRID_METRICS", "").lower() in ("1", "true", "yes", "on")
+DEFAULT_EXPORT_PATH = os.environ.get("UNITYGRID_METRICS_FILE", "data/metrics.prom")
+EXPORT_INTERVAL = 15.0
+
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus-style
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram for one operation."""
+    __slots__ = ("counts", "count", "total", "max", "errors")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)    # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """Estimated q-quantile, interpolating linearly inside the bucket that holds it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                if i == len(BUCKETS):
+                    return self.max
+                lower = BUCKETS[i - 1] if i else 0.0
+                upper = min(BUCKETS[i], self.max)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+
+class Registry:
+    """Process-wide store of operation latencies, bytes written and collected gauges."""
+
+    def __init__(self):
+        self.histograms = {}
+        self.bytes_written = Counter()
+        self.collectors = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, failed=False):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+            if failed:
+                histogram.errors += 1
+
+    def add_bytes(self, target, n):
+        with self._lock:
+            self.bytes_written[target] += n
+
+    def register_collector(self, name, collect):
+        """`collect()` returns {gauge: value}; it is polled at every dump (e.g. render cache stats)."""
+        self.collectors[name] = collect
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.bytes_written.clear()
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def operations(self):
+        """One summary dict per operation, slowest total time first."""
+        with self._lock:
+            items = list(self.histograms.items())
+        rows = [
+            {
+                "operation": name,
+                "calls": h.count,
+                "errors": h.errors,
+                "total_s": h.total,
+                "mean_ms": h.total / h.count * 1000,
+                "p50_ms": h.quantile(0.50) * 1000,
+                "p95_ms": h.quantile(0.95) * 1000,
+                "p99_ms": h.quantile(0.99) * 1000,
+                "max_ms": h.max * 1000,
+            }
+            for name, h in items if h.count
+        ]
+        return sorted(rows, key=lambda r: -r["total_s"])
+
+    def prometheus_text(self):
+        lines = [
+            "# HELP unitygrid_operation_seconds Latency of instrumented engine, persistence and page operations.",
+            "# TYPE unitygrid_operation_seconds histogram",
+        ]
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            written = sorted(self.bytes_written.items())
+        for name, h in histograms:
+            cumulative = 0
+            for bound, n in zip(BUCKETS + ("+Inf",), h.counts):
+                cumulative += n
+                lines.append(f'unitygrid_operation_seconds_bucket{{op="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'unitygrid_operation_seconds_sum{{op="{name}"}} {h.total:.9f}')
+            lines.append(f'unitygrid_operation_seconds_count{{op="{name}"}} {h.count}')
+        lines += ["# HELP unitygrid_operation_errors_total Instrumented calls that raised.",
+                  "# TYPE unitygrid_operation_errors_total counter"]
+        lines += [f'unitygrid_operation_errors_total{{op="{name}"}} {h.errors}' for name, h in histograms]
+        lines += ["# HELP unitygrid_bytes_written_total Bytes written by persistence paths.",
+                  "# TYPE unitygrid_bytes_written_total counter"]
+        lines += [f'unitygrid_bytes_written_total{{target="{target}"}} {n}' for target, n in written]
+        for collector, collect in sorted(self.collectors.items()):
+            for gauge, value in sorted(collect().items()):
+                lines.append(f"# TYPE unitygrid_{collector}_{gauge} gauge")
+                lines.append(f"unitygrid_{collector}_{gauge} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path=DEFAULT_EXPORT_PATH):
+        """Atomically replaces `path` with the current text-format dump (node_exporter textfile style)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+        return path
+
+
+REGISTRY = Registry()
+
+
+# ----------------------------------------------------------------------
+# Hooks for instrumented code
+# ----------------------------------------------------------------------
+def timed(fn):
+    """Records every call's latency under the function's qualified name."""
+    if not ENABLED:
+        return fn
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            REGISTRY.observe(name, time.perf_counter() - start, failed)
+    return wrapper
+
+
+@contextmanager
+def _span(name):
+    start = time.perf_counter()
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        REGISTRY.observe(name, time.perf_counter() - start, failed)
+
+
+_NO_SPAN = nullcontext()
+
+
+def span(name):
+    """Context manager timing a block (e.g. one page render) under `name`."""
+    return _span(name) if ENABLED else _NO_SPAN
+
+
+def observe(name, seconds):
+    if ENABLED:
+        REGISTRY.observe(name, seconds)
+
+
+def add_bytes(target, n):
+    if ENABLED:
+        REGISTRY.add_bytes(target, n)
+
+
+# ----------------------------------------------------------------------
+# Periodic export
+# ----------------------------------------------------------------------
+_exporter = None
+
+
+def start_exporter(path=DEFAULT_EXPORT_PATH, interval=EXPORT_INTERVAL):
+    """Dumps the registry to `path` every `interval` seconds and at exit. Idempotent."""
+    global _exporter
+    if not ENABLED or _exporter is not None:
+        return
+    def run():
+        while True:
+            time.sleep(interval)
+            REGISTRY.write_prometheus(path)
+
+    _exporter = threading.Thread(target=run, name="unitygrid-metrics", daemon=True)
+    _exporter.start()
+    atexit.register(REGISTRY.write_prometheus, path)
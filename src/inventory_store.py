@@ -0,0 +1,252 @@
+import itertools
+
+import numpy as np
+
+from country_catalog import COUNTRIES, canonical_country, country_id, country_key
+
+
+def normalize_city(city):
+    """Canonical lookup key for a city name (case and whitespace insensitive)."""
+    return " ".join(city.split()).casefold()
+
+
+class AidCenter:
+    """
+    A lightweight view over one row of the InventoryStore.
+    Exposes the same city / country / inventory attributes the CLI and
+    DatabaseHelper expect, without copying the underlying quantities.
+    """
+    __slots__ = ("_store", "row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self.row = row
+
+    @property
+    def city(self):
+        return self._store.cities[self.row]
+
+    @property
+    def country(self):
+        return self._store.countries[self._store.country_ids[self.row]]
+
+    @property
+    def inventory(self):
+        return self._store.inventory(self.row)
+
+    @property
+    def lat(self):
+        return _coordinate(self._store.lats[self.row])
+
+    @property
+    def lon(self):
+        return _coordinate(self._store.lons[self.row])
+
+    def __repr__(self):
+        return f"AidCenter({self.city!r}, {self.country!r})"
+
+
+class InventoryStore:
+    """
+    Array-backed inventory for every aid center in the grid.
+
+    - Cities and countries are hash-indexed, so locating a hub is O(1).
+    - Country IDs are the catalog's (see country_catalog), so per-country
+      arrays line up across subsystems; countries outside the catalog get
+      IDs after it. Any catalog spelling or alias finds the same country.
+    - Item names are mapped to integer column IDs.
+    - Quantities live in one contiguous int64 matrix (centers x items), so
+      global and per-country totals are single vectorized reductions.
+    """
+
+    def __init__(self, row_capacity=64, item_capacity=8):
+        # 1. Row metadata and hash indexes
+        self.cities = []
+        self.countries = list(COUNTRIES)
+        self._city_index = {}
+        self._country_index = {country: cid for cid, country in enumerate(COUNTRIES)}
+        self._country_rows = {}
+        self.size = 0
+
+        # 2. Item columns
+        self.items = []
+        self._item_index = {}
+
+        # 3. Change tracking for derived copies (see mark_changed)
+        self.version = 0
+        self.layout_version = 0
+        self._changes = itertools.count(1)
+
+        # 4. Contiguous storage; `stocked` tracks which items a hub actually carries
+        self.quantities = np.zeros((row_capacity, item_capacity), dtype=np.int64)
+        self.stocked = np.zeros((row_capacity, item_capacity), dtype=bool)
+        self.country_ids = np.zeros(row_capacity, dtype=np.int32)
+        # Hub coordinates in degrees; NaN when a hub has not been geolocated
+        self.lats = np.full(row_capacity, np.nan)
+        self.lons = np.full(row_capacity, np.nan)
+
+    def mark_changed(self, layout=False):
+        """
+        Gives `version` a new, never reused value; `layout_version` too when
+        rows or item columns were added. Values come from a shared counter,
+        so concurrent updaters can never leave `version` at a value a reader
+        has already seen.
+        """
+        self.version = next(self._changes)
+        if layout:
+            self.layout_version = self.version
+
+    # ------------------------------------------------------------------
+    # Index management
+    # ------------------------------------------------------------------
+    def _grow_rows(self):
+        capacity = self.quantities.shape[0] * 2
+        self.quantities = _resized(self.quantities, (capacity, self.quantities.shape[1]))
+        self.stocked = _resized(self.stocked, (capacity, self.stocked.shape[1]))
+        self.country_ids = _resized(self.country_ids, (capacity,))
+        self.lats = _resized(self.lats, (capacity,), np.nan)
+        self.lons = _resized(self.lons, (capacity,), np.nan)
+
+    def _grow_items(self):
+        capacity = self.quantities.shape[1] * 2
+        self.quantities = _resized(self.quantities, (self.quantities.shape[0], capacity))
+        self.stocked = _resized(self.stocked, (self.stocked.shape[0], capacity))
+
+    def item_id(self, item, create=False):
+        """Returns the column ID for an item, registering it when `create` is set."""
+        col = self._item_index.get(item)
+        if col is None and create:
+            if len(self.items) == self.quantities.shape[1]:
+                self._grow_items()
+            col = len(self.items)
+            self.items.append(item)
+            self._item_index[item] = col
+            self.mark_changed(layout=True)
+        return col
+
+    def country_id(self, country, create=False):
+        cid = self._country_index.get(country)
+        if cid is None:
+            # Aliases and other spellings resolve to the catalog ID once, then hit the index
+            cid = country_id(country)
+            if cid is None:
+                cid = self._country_index.get(country_key(country))
+            if cid is None and create:
+                cid = len(self.countries)
+                self.countries.append(canonical_country(country))
+                self._country_index[country_key(country)] = cid
+            if cid is not None:
+                self._country_index[country] = cid
+        return cid
+
+    def row_of(self, city):
+        """Returns the row index for a city, or None if it is not in the grid."""
+        return self._city_index.get(normalize_city(city))
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+    def add_center(self, city, country, inventory=None, lat=None, lon=None):
+        key = normalize_city(city)
+        if key in self._city_index:
+            raise ValueError(f"Aid center '{city}' is already registered.")
+        if self.size == self.quantities.shape[0]:
+            self._grow_rows()
+
+        row = self.size
+        cid = self.country_id(country, create=True)
+        self.cities.append(city)
+        self.country_ids[row] = cid
+        self.lats[row] = np.nan if lat is None else lat
+        self.lons[row] = np.nan if lon is None else lon
+        self._city_index[key] = row
+        self._country_rows.setdefault(cid, []).append(row)
+        self.size += 1
+
+        for item, qty in (inventory or {}).items():
+            col = self.item_id(item, create=True)
+            self.quantities[row, col] = qty
+            self.stocked[row, col] = True
+        self.mark_changed(layout=True)
+        return row
+
+    def update(self, city, item, qty):
+        """Adds `qty` of `item` to the hub in `city`. Returns False for unknown hubs."""
+        row = self.row_of(city)
+        if row is None or not item:
+            return False
+        self.add(row, self.item_id(item, create=True), qty)
+        return True
+
+    def add(self, row, col, qty):
+        """update() by row and column ID."""
+        self.quantities[row, col] += qty
+        self.stocked[row, col] = True
+        self.mark_changed()
+
+    def add_many(self, rows, cols, qtys):
+        """Vectorized update(): adds qtys[i] to (rows[i], cols[i]); repeated cells accumulate."""
+        np.add.at(self.quantities, (rows, cols), qtys)
+        self.stocked[rows, cols] = True
+        self.mark_changed()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def inventory(self, row):
+        """Per-item quantities for one hub, as a plain dict."""
+        n_items = len(self.items)
+        quantities = self.quantities[row, :n_items].tolist()
+        stocked = self.stocked[row, :n_items].tolist()
+        return {self.items[col]: quantities[col] for col in range(n_items) if stocked[col]}
+
+    def centers(self):
+        return [AidCenter(self, row) for row in range(self.size)]
+
+    def center(self, city):
+        row = self.row_of(city)
+        return None if row is None else AidCenter(self, row)
+
+    def centers_in(self, country):
+        cid = self.country_id(country)
+        return [AidCenter(self, row) for row in self._country_rows.get(cid, [])]
+
+    def global_totals(self):
+        """Total stock of every item across the whole grid."""
+        totals = self.quantities[:self.size, :len(self.items)].sum(axis=0)
+        return dict(zip(self.items, totals.tolist()))
+
+    def country_totals(self, country=None):
+        """
+        Total stock per item for one country, or for every country with
+        hubs (as {country: {item: qty}}) when no country is given.
+        """
+        n_items = len(self.items)
+        if country is not None:
+            cid = self.country_id(country)
+            if not self._country_rows.get(cid):
+                return {}
+            rows = np.asarray(self._country_rows[cid], dtype=np.intp)
+            totals = self.quantities[rows, :n_items].sum(axis=0)
+            return dict(zip(self.items, totals.tolist()))
+
+        country_ids = self.country_ids[:self.size]
+        totals = np.zeros((len(self.countries), n_items), dtype=np.int64)
+        np.add.at(totals, country_ids, self.quantities[:self.size, :n_items])
+        hubs = np.bincount(country_ids, minlength=len(self.countries))
+        return {
+            name: dict(zip(self.items, row))
+            for name, row, n in zip(self.countries, totals.tolist(), hubs.tolist())
+            if n
+        }
+
+
+def _coordinate(value):
+    return None if np.isnan(value) else float(value)
+
+
+def _resized(array, shape, fill=0):
+    """Copies `array` into a `fill`-initialized array of the (larger) `shape`."""
+    grown = np.full(shape, fill, dtype=array.dtype)
+    grown[tuple(slice(0, n) for n in array.shape)] = array
+    return grown
@@ -0,0 +1,257 @@
+import json
+import os
+import threading
+
+from concurrent_writes import FileLock
+from instrumentation import add_bytes
+from inventory_store import normalize_city
+
+SEQ_WIDTH = 20
+
+
+def wal_paths(file_path):
+    """The live WAL and the sealed segment a compaction is folding, for a snapshot path."""
+    return file_path + ".wal", file_path + ".wal.sealed"
+
+
+def wal_lock_path(file_path):
+    """Lock file every process takes to append to, or seal, a snapshot's WAL."""
+    return file_path + ".wal.lock"
+
+
+def seq_path(file_path):
+    """Last sequence number handed out for a snapshot's WAL, shared by every writer process."""
+    return file_path + ".wal.seq"
+
+
+def _open_counter(path):
+    """Unbuffered read/write handle on the sequence file, created when missing."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    return os.fdopen(fd, "r+b", buffering=0)
+
+
+def last_seq(path):
+    seq = 0
+    for record in read_records(path):
+        seq = record["seq"]
+    return seq
+
+
+def encode_record(record):
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def read_records(path, after_seq=0):
+    """
+    Yields WAL records with seq > after_seq. A torn final line (crash
+    mid-append) is ignored; everything before it is still replayed.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            if record["seq"] > after_seq:
+                yield record
+
+
+def apply_record(data, record, city_index=None):
+    """Folds one WAL record into a snapshot dict (as returned by load_from_json)."""
+    if city_index is None:
+        city_index = {normalize_city(c["city"]): c for c in data["centers"]}
+    op = record["op"]
+    if op == "center":
+        center = record["center"]
+        data["centers"].append(center)
+        city_index[normalize_city(center["city"])] = center
+    elif op == "inventory":
+        _add_stock(city_index, record["city"], record["item"], record["qty"])
+    elif op == "batch":
+        for city, item, qty in record["updates"]:
+            _add_stock(city_index, city, item, qty)
+    elif op == "volunteer":
+        data["volunteers"].append(record["volunteer"])
+    elif op == "volunteers":
+        data["volunteers"].extend(record["volunteers"])
+    data["wal_seq"] = record["seq"]
+
+
+def _add_stock(city_index, city, item, qty):
+    center = city_index.get(normalize_city(city))
+    if center is not None:
+        inventory = center.setdefault("inventory", {})
+        inventory[item] = inventory.get(item, 0) + qty
+
+
+def replay(data, file_path):
+    """Applies the sealed segment and live WAL on top of a snapshot, in place."""
+    city_index = {normalize_city(c["city"]): c for c in data["centers"]}
+    for path in reversed(wal_paths(file_path)):
+        for record in read_records(path, data.get("wal_seq", 0)):
+            apply_record(data, record, city_index)
+    return data
+
+
+class Journal:
+    """
+    Append-only write-ahead log in front of a JSON snapshot.
+
+    Every inventory update or volunteer registration costs one compact line
+    appended to `<snapshot>.wal`, independent of the grid size. A background
+    compactor periodically seals the WAL, folds it into a fresh snapshot
+    (written to a temp file and renamed over the old one), then drops the
+    sealed segment. The snapshot records the last folded sequence number, so
+    a crash at any point replays each record exactly once.
+
+    Several processes may journal the same snapshot. Appends and sealing
+    happen under the WAL's file lock: a writer whose WAL was sealed by
+    another process reopens the new one before appending, and sequence
+    numbers come from `<snapshot>.wal.seq`, so they never collide. Folding
+    into the snapshot happens under the snapshot's own lock, so appends
+    keep flowing while a compaction rewrites it.
+    """
+
+    def __init__(self, file_path, start_seq=0, fsync=True, compact_interval=30.0):
+        self.file_path = file_path
+        self.wal_path, self.sealed_path = wal_paths(file_path)
+        self.fsync = fsync
+        self.seq = start_seq
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._wal_lock = FileLock(wal_lock_path(file_path))
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with self._wal_lock:
+            self._wal = open(self.wal_path, "a", encoding="utf-8")
+            self._seq_file = _open_counter(seq_path(file_path))
+            # After a machine crash the counter can trail the WAL it numbers
+            self._store_seq(max(start_seq, self._stored_seq(), last_seq(self.sealed_path), last_seq(self.wal_path)))
+
+        self._stop = threading.Event()
+        self._compactor = None
+        if compact_interval:
+            self._compactor = threading.Thread(
+                target=self._run_compactor, args=(compact_interval,), name="unitygrid-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    # ------------------------------------------------------------------
+    # Appends
+    # ------------------------------------------------------------------
+    def append(self, record, sync=None):
+        """Appends one record and returns its sequence number."""
+        with self._lock, self._wal_lock:
+            self._follow_seal()
+            self._store_seq(self._stored_seq() + 1)
+            record["seq"] = self.seq
+            line = encode_record(record)
+            self._wal.write(line)
+            add_bytes("wal", len(line))
+            self._wal.flush()
+            if self.fsync if sync is None else sync:
+                os.fsync(self._wal.fileno())
+            self.pending += 1
+            return self.seq
+
+    def log_inventory(self, city, item, qty):
+        return self.append({"op": "inventory", "city": city, "item": item, "qty": qty})
+
+    def log_batch(self, updates):
+        """One record for many (city, item, qty) deltas, e.g. a whole supply manifest."""
+        return self.append({"op": "batch", "updates": [list(u) for u in updates]})
+
+    def log_center(self, center):
+        return self.append({"op": "center", "center": center})
+
+    def log_volunteer(self, volunteer):
+        return self.append({"op": "volunteer", "volunteer": volunteer})
+
+    def log_volunteers(self, volunteers):
+        """One record for a batch of registrations."""
+        return self.append({"op": "volunteers", "volunteers": list(volunteers)})
+
+    def _stored_seq(self):
+        self._seq_file.seek(0)
+        return int(self._seq_file.read(SEQ_WIDTH) or 0)
+
+    def _store_seq(self, seq):
+        # Fixed width, so the number is overwritten in place with one write
+        self._seq_file.seek(0)
+        self._seq_file.write(b"%0*d" % (SEQ_WIDTH, seq))
+        self.seq = seq
+
+    def _follow_seal(self):
+        """Reopens the WAL when another process has sealed the file this one was appending to."""
+        try:
+            current = os.stat(self.wal_path)
+        except FileNotFoundError:
+            current = None
+        if current is None or not os.path.samestat(current, os.fstat(self._wal.fileno())):
+            self._wal.close()
+            self._wal = open(self.wal_path, "a", encoding="utf-8")
+
+    def sync(self):
+        """Forces everything appended so far to stable storage (group commit)."""
+        with self._lock:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+    def _seal(self):
+        """
+        Moves the live WAL aside for folding. Returns False when there is
+        nothing to seal. A sealed segment still on disk (another process is
+        folding it, or a compaction was interrupted) is never overwritten.
+        """
+        with self._lock, self._wal_lock:
+            self._follow_seal()
+            self.pending = 0
+            if os.path.exists(self.sealed_path):
+                return True
+            if os.path.getsize(self.wal_path) == 0:
+                return False
+            self._wal.close()
+            os.replace(self.wal_path, self.sealed_path)
+            self._wal = open(self.wal_path, "a", encoding="utf-8")
+            return True
+
+    def compact(self):
+        """Folds the WAL into a new snapshot. Safe to call while appends continue, from any process."""
+        from database_helper import DatabaseHelper
+
+        with self._compact_lock:
+            if not self._seal():
+                return False
+            # Under the snapshot's file lock, so commits from plain-JSON writers are not overwritten;
+            # another process may have folded the segment first
+            with FileLock(DatabaseHelper.lock_path(self.file_path)):
+                if not os.path.exists(self.sealed_path):
+                    return False
+                data = DatabaseHelper.read_snapshot(self.file_path)
+                city_index = {normalize_city(c["city"]): c for c in data["centers"]}
+                for record in read_records(self.sealed_path, data.get("wal_seq", 0)):
+                    apply_record(data, record, city_index)
+                DatabaseHelper.write_snapshot(data, self.file_path, indent=4)
+                os.remove(self.sealed_path)
+            return True
+
+    def _run_compactor(self, interval):
+        while not self._stop.wait(interval):
+            if self.pending:
+                self.compact()
+
+    def close(self, compact=True):
+        self._stop.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        if compact:
+            self.compact()
+        with self._lock:
+            self._wal.close()
+            self._seq_file.close()
+        self._wal_lock.close()
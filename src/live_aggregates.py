@@ -0,0 +1,177 @@
+import threading
+from collections import Counter
+
+import numpy as np
+
+from country_catalog import CONTINENTS, continent_id
+from volunteer_roster import VolunteerRoster
+
+# A stocked (hub, item) line below this many units counts as low stock
+LOW_STOCK_THRESHOLD = 100
+
+
+def _padded(array, shape):
+    grown = np.zeros(shape, dtype=array.dtype)
+    grown[tuple(slice(0, n) for n in array.shape)] = array
+    return grown
+
+
+class LiveAggregates:
+    """
+    Running rollups of the grid, kept in step by the engine on every
+    inventory change, new center and volunteer registration, so reading
+    them never re-scans centers or volunteers:
+
+    - per-item totals per country, per continent and grid-wide
+    - hub counts per country
+    - low-stock lines (stocked hub x item below LOW_STOCK_THRESHOLD) per item
+    - volunteer counts per specialty
+
+    Each record_* hook is O(1) per changed cell. verify() recomputes
+    everything from scratch and reports any drift.
+    """
+
+    def __init__(self, store, volunteers, low_stock=LOW_STOCK_THRESHOLD):
+        self.store = store
+        self.low_stock = low_stock
+        # record_update() may run for different hubs at once (SharedEngine.update_inventory)
+        self._lock = threading.Lock()
+        self.rebuild(volunteers)
+
+    def rebuild(self, volunteers):
+        """Full recompute from the store and the roster."""
+        store = self.store
+        n, n_items = store.size, len(store.items)
+        country_ids = np.asarray(store.country_ids[:n], dtype=np.intp)
+        quantities, stocked = store.quantities[:n, :n_items], store.stocked[:n, :n_items]
+
+        self.country_totals = np.zeros((len(store.countries), n_items), dtype=np.int64)
+        np.add.at(self.country_totals, country_ids, quantities)
+        self._continent_of = np.array([continent_id(c) for c in store.countries], dtype=np.intp)
+        self.continent_totals = np.zeros((len(CONTINENTS), n_items), dtype=np.int64)
+        np.add.at(self.continent_totals, self._continent_of, self.country_totals)
+        self.item_totals = self.country_totals.sum(axis=0)
+        self.hub_counts = np.bincount(country_ids, minlength=len(store.countries)).astype(np.int64)
+        self.low_counts = np.count_nonzero(stocked & (quantities < self.low_stock), axis=0).astype(np.int64)
+
+        if isinstance(volunteers, VolunteerRoster):
+            counts = np.bincount(volunteers.codes[:len(volunteers)], minlength=len(volunteers.specialties))
+            self.specialties = Counter({s: n for s, n in zip(volunteers.specialties, counts.tolist()) if n})
+        else:
+            self.specialties = Counter(v["spec"] for v in volunteers)
+        self.volunteers = len(volunteers)
+        self.received = 0    # units logged through updates since the last rebuild
+        self.version = 0
+
+    def _fit(self):
+        """Grows the matrices when the store has gained countries or items."""
+        n_countries, n_items = len(self.store.countries), len(self.store.items)
+        if self.country_totals.shape != (n_countries, n_items):
+            added = self.store.countries[len(self._continent_of):]
+            self._continent_of = np.r_[self._continent_of, [continent_id(c) for c in added]].astype(np.intp)
+            self.country_totals = _padded(self.country_totals, (n_countries, n_items))
+            self.continent_totals = _padded(self.continent_totals, (len(CONTINENTS), n_items))
+            self.item_totals = _padded(self.item_totals, (n_items,))
+            self.hub_counts = _padded(self.hub_counts, (n_countries,))
+            self.low_counts = _padded(self.low_counts, (n_items,))
+
+    # ------------------------------------------------------------------
+    # Engine hooks (called after the store has changed)
+    # ------------------------------------------------------------------
+    def record_center(self, row):
+        self._fit()
+        n_items = len(self.store.items)
+        cid = self.store.country_ids[row]
+        quantities, stocked = self.store.quantities[row, :n_items], self.store.stocked[row, :n_items]
+        self.country_totals[cid] += quantities
+        self.continent_totals[self._continent_of[cid]] += quantities
+        self.item_totals += quantities
+        self.hub_counts[cid] += 1
+        self.low_counts += stocked & (quantities < self.low_stock)
+        self.version += 1
+
+    def record_update(self, row, col, qty, was_stocked):
+        """`qty` units were added to (row, col); `was_stocked` is the cell's flag before."""
+        with self._lock:
+            self._fit()
+            cid = self.store.country_ids[row]
+            new = int(self.store.quantities[row, col])
+            old = new - qty
+            self.country_totals[cid, col] += qty
+            self.continent_totals[self._continent_of[cid], col] += qty
+            self.item_totals[col] += qty
+            self.low_counts[col] += (new < self.low_stock) - (was_stocked and old < self.low_stock)
+            if qty > 0:
+                self.received += qty
+            self.version += 1
+
+    def record_many(self, rows, cols, qtys, was_stocked):
+        """Vectorized record_update over distinct cells."""
+        self._fit()
+        cids = self.store.country_ids[rows]
+        new = self.store.quantities[rows, cols]
+        old = new - qtys
+        np.add.at(self.country_totals, (cids, cols), qtys)
+        np.add.at(self.continent_totals, (self._continent_of[cids], cols), qtys)
+        np.add.at(self.item_totals, cols, qtys)
+        np.add.at(self.low_counts, cols, (new < self.low_stock).astype(np.int64) - (was_stocked & (old < self.low_stock)))
+        self.received += int(qtys[qtys > 0].sum())
+        self.version += 1
+
+    def record_volunteer(self, spec):
+        self.specialties[spec] += 1
+        self.volunteers += 1
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def snapshot(self, detail=True):
+        """
+        Plain-Python copy of the current aggregates. Cost depends on the
+        number of countries and items only; `detail=False` also skips the
+        per-country and per-continent tables.
+        """
+        items = self.store.items
+        snapshot = {
+            "version": self.version,
+            "hubs": int(self.hub_counts.sum()),
+            "active_countries": int(np.count_nonzero(self.hub_counts)),
+            "volunteers": self.volunteers,
+            "specialties": dict(self.specialties),
+            "total_units": int(self.item_totals.sum()),
+            "received": self.received,
+            "items": dict(zip(items, self.item_totals.tolist())),
+            "low_stock_threshold": self.low_stock,
+            "low_stock": dict(zip(items, self.low_counts.tolist())),
+        }
+        if detail:
+            snapshot["countries"] = {
+                country: dict(zip(items, totals))
+                for country, totals, hubs in zip(self.store.countries, self.country_totals.tolist(), self.hub_counts.tolist())
+                if hubs
+            }
+            snapshot["continents"] = {
+                continent: dict(zip(items, totals))
+                for continent, totals in zip(CONTINENTS, self.continent_totals.tolist())
+                if any(totals)
+            }
+        return snapshot
+
+    def verify(self, volunteers):
+        """Differences from a full recompute, as readable strings; empty when consistent."""
+        fresh = LiveAggregates(self.store, volunteers, self.low_stock)
+        self._fit()
+        problems = []
+        for name in ("country_totals", "continent_totals", "item_totals", "hub_counts", "low_counts"):
+            live, expected = getattr(self, name), getattr(fresh, name)
+            if live.shape != expected.shape:
+                problems.append(f"{name}: shape {live.shape} != {expected.shape}")
+            elif not np.array_equal(live, expected):
+                cells = np.argwhere(live != expected)[:5].tolist()
+                problems.append(f"{name}: {len(np.argwhere(live != expected))} cells differ, e.g. {cells}")
+        if self.volunteers != fresh.volunteers:
+            problems.append(f"volunteers: {self.volunteers} != {fresh.volunteers}")
+        if +self.specialties != fresh.specialties:
+            problems.append(f"specialties: {dict(self.specialties)} != {dict(fresh.specialties)}")
+        return problems
@@ -1,9 +1,21 @@
 from models import UnityGridEngine
+from country_catalog import canonical_country
+from manifest_ingest import ingest_manifest, print_progress, print_report
+from instrumentation import start_exporter
+from registration_queue import DUPLICATE, INVALID, RegistrationQueue, queue_path
+from shared_engine import SharedEngine
+import os
 import sys
 
 def main():
-    # This now loads existing data from your JSON file automatically
-    engine = UnityGridEngine()
+    # This now loads existing data from your JSON file (or a SQLite .db /
+    # binary .ugrid snapshot passed on the command line) automatically; JSON
+    # updates are journaled immediately and SQLite writes are committed in batches
+    data_file = sys.argv[1] if len(sys.argv) > 1 else "data/relief_data.json"
+    engine = UnityGridEngine(data_file, journaled=data_file.lower().endswith(".json"))
+    start_exporter()
+    # Registrations go through the same durable, deduplicating queue as the app's form
+    registrations = RegistrationQueue(SharedEngine(engine), queue_path(data_file, "cli"), background=False)
     
     while True:
         print("\n" + "◈" * 45)
@@ -14,6 +26,11 @@ def main():
         print("3. Register Humanitarian Volunteer")
         print("4. Emergency Specialist Search")
         print("5. Save and Exit System") # Updated label
+        print("6. Nearest Stocked Hubs per Disaster Zone")
+        print("7. Supply Allocation Plan")
+        print("8. Bulk Supply Ingest (CSV/JSONL Manifest)")
+        print("9. Global Supply Report (by Continent)")
+        print("10. Stock Trends & Depletion Forecast")
         
         choice = input("\n[Admin Selection] > ")
 
@@ -38,22 +55,97 @@ def main():
             name = input("Volunteer Name: ")
             spec = input("Specialty (Medical/Logistics/Rescue): ")
             contact = input("Contact/Email: ")
-            # Using the engine to handle adding to maintain clean architecture
-            engine.volunteers.append({"name": name, "spec": spec, "contact": contact})
-            print(f"✅ {name} added to Global Response Team.")
+            status = registrations.submit(name, spec, contact)
+            if status == DUPLICATE:
+                print(f"⚠️  {contact.strip()} is already registered.")
+            elif status == INVALID:
+                print("❌ Name, specialty and contact are all required.")
+            else:
+                registrations.drain()
+                print(f"✅ {name} added to Global Response Team.")
 
         elif choice == '4':
             search_spec = input("Search for specialty: ").lower()
-            results = [v for v in engine.volunteers if v['spec'].lower() == search_spec]
+            results = engine.search_volunteers(search_spec)
             print(f"\n--- Results for {search_spec.capitalize()} ---")
             if not results:
                 print("No specialists found for that category.")
             for r in results:
                 print(f"👤 {r['name']} | 📞 {r['contact']}")
 
+        elif choice == '6':
+            item = input("Required item (blank = any stock): ").strip() or None
+            print("\n--- NEAREST STOCKED HUBS ---")
+            for zone in engine.get_disaster_zones():
+                print(f"⚠️  {zone['type']} @ ({zone['lat']}, {zone['lon']})")
+                hubs = engine.nearest_hubs(zone['lat'], zone['lon'], k=3, item=item)
+                if not hubs:
+                    print("    No stocked hubs on the Grid.")
+                for hub, km in hubs:
+                    print(f"    📍 {hub.city}, {hub.country} | {km:,.0f} km")
+                # Hotlines of every country with hubs around the zone, once each
+                hotlines = {c["hub"].country: c["numbers"] for c in engine.contacts_within(zone['lat'], zone['lon'])}
+                for country, numbers in hotlines.items():
+                    print(f"    ☎️  {country}: " + " · ".join(f"{s} {n}" for s, n in numbers.items()))
+
+        elif choice == '7':
+            plan = engine.plan_allocation()
+            print("\n--- SUPPLY ALLOCATION PLAN ---")
+            for s in sorted(plan["shipments"], key=lambda s: (s["zone"]["lat"], s["zone"]["lon"], s["item"])):
+                zone = s["zone"]
+                print(f"🚚 {s['hub'].city} → {zone['type']} @ ({zone['lat']}, {zone['lon']}) | "
+                      f"{s['qty']:,} {s['item']} | {s['km']:,.0f} km")
+            for s in plan["shortfall"]:
+                zone = s["zone"]
+                print(f"⚠️  Unmet: {s['qty']:,} {s['item']} for {zone['type']} @ ({zone['lat']}, {zone['lon']})")
+            print(f"Total haul: {plan['unit_km']:,.0f} unit-km")
+
+        elif choice == '8':
+            path = input("Manifest file (city, item, qty): ").strip()
+            try:
+                print_report(ingest_manifest(engine, path, progress=print_progress))
+            except OSError as e:
+                print(f"❌ Could not read manifest: {e}")
+
+        elif choice == '9':
+            threshold = int(input("Low-stock threshold per country: ") or 0)
+            report = engine.global_report(threshold, workers=os.cpu_count())
+            print("\n--- GLOBAL SUPPLY REPORT ---")
+            for item, total in report["totals"].items():
+                low = report["countries_below"][item]
+                print(f"📦 {item}: {total:,} total | smallest hub {report['minimums'][item] or 0:,} | "
+                      f"{report['hubs_below'][item]:,} hubs below {threshold:,}")
+                if low:
+                    print(f"    ⚠️  Countries below threshold: {', '.join(low)}")
+                lowest = engine.hubs_below(item, threshold)[:3]
+                if lowest:
+                    print("    🔻 Lowest hubs: " + ", ".join(f"{city}, {country} ({qty:,})" for city, country, qty in lowest))
+            for continent, totals in report["continents"].items():
+                print(f"🌍 {continent}: " + " | ".join(f"{item} {qty:,}" for item, qty in totals.items()))
+            country = input("\nCountry detail (blank = skip): ").strip()
+            if country:
+                cities = engine.centers_in(country)
+                print(f"🏳️  {canonical_country(country)}: {len(cities):,} hubs ({', '.join(cities[:10])}{' ...' if len(cities) > 10 else ''})")
+                for item, qty in engine.country_totals(country).items():
+                    print(f"    📦 {item}: {qty:,}")
+
+        elif choice == '10':
+            # Each visit adds a sample, so the forecast sharpens over a session
+            engine.record_history()
+            forecast = engine.depletion_forecast("hour", limit=10)
+            print("\n--- DEPLETION FORECAST (hourly trend) ---")
+            if not forecast:
+                print("No hub is trending towards empty yet (needs two or more samples an hour apart).")
+            for f in forecast:
+                print(f"⏳ {f['city']}, {f['country']} | {f['item']}: {f['level']:,} left, "
+                      f"{f['per_hour']:,.1f}/h -> empty in {f['hours_left']:,.1f} h")
+
         elif choice == '5':
             # IMPORTANT: This saves your work to data/relief_data.json
             print("Saving data...")
+            registrations.close()
+            engine.record_history()
+            engine.save_history()
             engine.save_state() 
             print("Terminating UnityGrid Secure Session. Goodbye!")
             break
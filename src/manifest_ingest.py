@@ -0,0 +1,225 @@
+import csv
+import io
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from event_ingest import records_end
+
+CHUNK_BYTES = 4 * 1024 * 1024
+MAX_REPORTED_REJECTS = 1000
+
+# Column names accepted for each manifest field
+FIELD_ALIASES = {
+    "city": ("city", "center", "hub", "destination"),
+    "item": ("item", "supply", "product", "item name"),
+    "qty": ("qty", "quantity", "amount", "units"),
+}
+
+
+def _field_map(columns):
+    lowered = {str(c).strip().lower(): c for c in columns}
+    mapping = {}
+    for field, aliases in FIELD_ALIASES.items():
+        for alias in aliases:
+            if alias in lowered:
+                mapping[field] = lowered[alias]
+                break
+    return mapping
+
+
+class ManifestReport:
+    """Outcome of one manifest ingest: counts, timings and the first rejected lines."""
+
+    def __init__(self, path):
+        self.path = path
+        self.accepted = 0
+        self.rejected = 0
+        self.rejects = []          # [(line number, reason)], capped at MAX_REPORTED_REJECTS
+        self.cells = 0             # distinct (hub, item) pairs updated
+        self.seconds = 0.0
+
+    def reject(self, line_no, reason):
+        self.rejected += 1
+        if len(self.rejects) < MAX_REPORTED_REJECTS:
+            self.rejects.append((line_no, reason))
+
+    @property
+    def rows_per_second(self):
+        return (self.accepted + self.rejected) / self.seconds if self.seconds else 0.0
+
+
+class ManifestReader:
+    """
+    Streams a CSV or JSONL convoy manifest of (city, item, qty) rows and
+    validates every row against the engine's known hubs and items.
+
+    The file is read in fixed-size chunks and each chunk's valid rows are
+    folded into a (hubs x items) delta matrix with one scatter-add, so
+    memory is bounded by the grid size, not the manifest size. Item names
+    match case-insensitively; city names go through the store's index.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.deltas = np.zeros((store.size, len(store.items)), dtype=np.int64)
+        self._items = {item.casefold(): col for col, item in enumerate(store.items)}
+        # Raw (city, item) text -> flat delta cell, or the reason it is rejected;
+        # manifests repeat the same few hub/item pairs, so each is validated once
+        self._cells = {}
+
+    def _cell(self, city, item):
+        row = self.store.row_of(city.strip()) if isinstance(city, str) and city.strip() else None
+        if row is None:
+            return f"unknown city {city!r}"
+        col = self._items.get(item.strip().casefold()) if isinstance(item, str) else None
+        if col is None:
+            return f"unknown item {item!r}"
+        return row * self.deltas.shape[1] + col
+
+    def read(self, path, report, chunk_bytes=CHUNK_BYTES, progress=None):
+        is_jsonl = path.lower().endswith((".jsonl", ".ndjson"))
+        size = os.path.getsize(path)
+        state = {"line": 0, "columns": None}
+        with open(path, "rb") as f:
+            done, carry = 0, b""
+            while True:
+                chunk = f.read(chunk_bytes)
+                if not chunk and not carry:
+                    break
+                data = carry + chunk
+                # Only whole records are parsed (a quoted CSV field may span lines);
+                # the final one may lack a newline
+                cut = records_end(data, is_jsonl) if chunk else len(data)
+                lines, carry = data[:cut], data[cut:]
+                text = lines.decode("utf-8-sig" if not done else "utf-8", errors="replace")
+                if is_jsonl:
+                    self._consume_jsonl(text, state, report)
+                else:
+                    self._consume_csv(text, state, report)
+                done += len(lines)
+                if progress:
+                    progress(done, size, report)
+        return report
+
+    def _consume_csv(self, text, state, report):
+        base = state["line"]
+        rows = csv.reader(io.StringIO(text))
+        if state["columns"] is None:
+            first = next(rows, None)
+            if first is None:
+                return
+            mapping = _field_map(first)
+            if len(mapping) == 3:
+                state["columns"] = [first.index(mapping[f]) for f in ("city", "item", "qty")]
+            else:
+                # Headerless manifest: positional city, item, qty
+                state["columns"] = [0, 1, 2]
+                self._collect([(base + 1, first)], state["columns"], report)
+        # line_num counts physical lines, so quoted newlines keep the numbering right
+        self._collect(((base + rows.line_num, row) for row in rows), state["columns"], report)
+        state["line"] = base + rows.line_num
+
+    def _consume_jsonl(self, text, state, report):
+        numbered = [(n, line) for n, line in enumerate(text.split("\n"), state["line"] + 1) if line.strip()]
+        state["line"] += text.count("\n") + (not text.endswith("\n") and bool(text))
+        try:
+            # One C-level decode per chunk; a bad line sends the chunk down the per-line path
+            records = json.loads("[" + ",".join(line for _, line in numbered) + "]")
+        except json.JSONDecodeError:
+            records = None
+        if records is None or len(records) != len(numbered):
+            # Also taken when a line held several comma-separated values: records no longer line up with lines
+            records = []
+            for line_no, line in numbered:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    records.append(None)
+                    report.reject(line_no, "malformed JSON")
+
+        fields, mappings = [], {}
+        for (line_no, _), record in zip(numbered, records):
+            if record is None:
+                continue
+            if not isinstance(record, dict):
+                report.reject(line_no, "expected a JSON object")
+                continue
+            keys = tuple(record)
+            mapping = mappings.get(keys)
+            if mapping is None:
+                mapping = mappings[keys] = [_field_map(keys).get(f) for f in ("city", "item", "qty")]
+            fields.append((line_no, [record.get(k) for k in mapping]))
+        self._collect(fields, [0, 1, 2], report)
+
+    def _collect(self, numbered, columns, report):
+        c_city, c_item, c_qty = columns
+        width = max(columns) + 1
+        cache = self._cells
+        cells, qtys = [], []
+        for line_no, fields in numbered:
+            if len(fields) < width:
+                if fields:
+                    report.reject(line_no, "missing fields")
+                continue
+            key = (fields[c_city], fields[c_item])
+            cell = cache.get(key)
+            if cell is None:
+                cell = cache[key] = self._cell(*key)
+            if cell.__class__ is str:
+                report.reject(line_no, cell)
+                continue
+            try:
+                qtys.append(int(fields[c_qty]))
+            except (TypeError, ValueError):
+                report.reject(line_no, f"invalid quantity {fields[c_qty]!r}")
+                continue
+            cells.append(cell)
+        if cells:
+            np.add.at(self.deltas.reshape(-1), cells, qtys)
+            report.accepted += len(cells)
+
+
+def ingest_manifest(engine, path, chunk_bytes=CHUNK_BYTES, progress=None):
+    """
+    Validates a whole manifest, then applies it through the engine in one
+    batch, i.e. one journal record / SQLite transaction. A manifest is
+    applied all at once or, if reading fails part-way, not at all.
+    """
+    report = ManifestReport(path)
+    start = time.perf_counter()
+    reader = ManifestReader(engine.store)
+    reader.read(path, report, chunk_bytes, progress)
+    rows, cols = np.nonzero(reader.deltas)
+    report.cells = engine.apply_updates(rows, cols, reader.deltas[rows, cols])
+    if engine.journal is not None:
+        engine.journal.sync()
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def print_progress(done, total, report):
+    print(f"\r[Ingest] {done / max(total, 1):6.1%} | {report.accepted:,} rows accepted, "
+          f"{report.rejected:,} rejected", end="", flush=True)
+
+
+def print_report(report, limit=20):
+    print(f"\n[Ingest] {report.path}: {report.accepted:,} rows applied to {report.cells:,} hub/item "
+          f"totals, {report.rejected:,} rejected ({report.rows_per_second:,.0f} rows/s)")
+    for line_no, reason in report.rejects[:limit]:
+        print(f"    ❌ line {line_no}: {reason}")
+    if report.rejected > limit:
+        print(f"    ... and {report.rejected - limit:,} more")
+
+
+if __name__ == "__main__":
+    # Usage: python src/manifest_ingest.py manifest.csv [data/relief_data.json]
+    from models import UnityGridEngine
+
+    data_file = sys.argv[2] if len(sys.argv) > 2 else "data/relief_data.json"
+    engine = UnityGridEngine(data_file, journaled=data_file.lower().endswith(".json"))
+    print_report(ingest_manifest(engine, sys.argv[1], progress=print_progress))
+    engine.save_state()
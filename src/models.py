@@ -1,84 +1,515 @@
-import random
-
-class EmergencyRegistry:
-    """
-    A collection of global emergency contact numbers.
-    Numbers are stored as strings to maintain formatting.
-    """
-    contacts = {
-        "Afghanistan": {"Police": "119", "Ambulance": "102", "Fire": "119"},
-        "Australia": {"Police": "000", "Ambulance": "000", "Fire": "000"},
-        "Brazil": {"Police": "190", "Ambulance": "192", "Fire": "193"},
-        "Canada": {"Police": "911", "Ambulance": "911", "Fire": "911"},
-        "China": {"Police": "110", "Ambulance": "120", "Fire": "119"},
-        "France": {"Police": "17", "Ambulance": "15", "Fire": "18"},
-        "Germany": {"Police": "110", "Ambulance": "112", "Fire": "112"},
-        "India": {"Police": "112", "Ambulance": "112", "Fire": "112"},
-        "Japan": {"Police": "110", "Ambulance": "119", "Fire": "119"},
-        "Mexico": {"Police": "911", "Ambulance": "911", "Fire": "911"},
-        "Pakistan": {"Police": "15", "Ambulance": "115", "Fire": "16"},
-        "South Africa": {"Police": "10111", "Ambulance": "10177", "Fire": "10177"},
-        "UAE": {"Police": "999", "Ambulance": "998", "Fire": "997"},
-        "UK": {"Police": "999", "Ambulance": "999", "Fire": "999"},
-        "USA": {"Police": "911", "Ambulance": "911", "Fire": "911"}
-    }
+import os
+from functools import partial
+
+import numpy as np
+
+from allocation import AllocationPlanner
+from database_helper import DatabaseHelper, center_record
+from binary_snapshot import MappedInventoryStore
+from concurrent_writes import StripedLocks, SyncPoint
+from country_catalog import WORLD_DATA, all_countries, canonical_country
+from emergency_registry import EmergencyRegistry
+from instrumentation import timed
+from inventory_store import AidCenter, InventoryStore, normalize_city
+from live_aggregates import LiveAggregates
+from sharded_aggregation import ShardedAggregator
+from spatial_index import GeoGridIndex
+from stock_history import StockHistory
+from synthetic_inventory import SyntheticInventory
+from volunteer_index import VolunteerIndex
+from volunteer_roster import VolunteerRoster
+
+# Default demand: units of every item a disaster zone asks for per unit of its map radius
+ZONE_DEMAND_PER_RADIUS = 100
+# How far from a disaster zone hubs count as inside it when listing their hotlines
+ZONE_CONTACT_RADIUS_KM = 500
+
 class UnityGridEngine:
-    def __init__(self):
-        # 1. THE COMPLETE GLOBAL DATABASE (195 Countries)
-        self.world_data = {
-            "Africa": [
-                "Algeria", "Angola", "Benin", "Botswana", "Burkina Faso", "Burundi", "Cabo Verde", "Cameroon", 
-                "Central African Republic", "Chad", "Comoros", "Congo (Brazzaville)", "DR Congo", "Côte d'Ivoire", 
-                "Djibouti", "Egypt", "Equatorial Guinea", "Eritrea", "Eswatini", "Ethiopia", "Gabon", "Gambia", 
-                "Ghana", "Guinea", "Guinea-Bissau", "Kenya", "Lesotho", "Liberia", "Libya", "Madagascar", "Malawi", 
-                "Mali", "Mauritania", "Mauritius", "Morocco", "Mozambique", "Namibia", "Niger", "Nigeria", "Rwanda", 
-                "São Tomé and Príncipe", "Senegal", "Seychelles", "Sierra Leone", "Somalia", "South Africa", 
-                "South Sudan", "Sudan", "Tanzania", "Togo", "Tunisia", "Uganda", "Zambia", "Zimbabwe"
-            ],
-            "Asia": [
-                "Afghanistan", "Armenia", "Azerbaijan", "Bahrain", "Bangladesh", "Bhutan", "Brunei", "Cambodia", 
-                "China", "Cyprus", "Georgia", "India", "Indonesia", "Iran", "Iraq", "Israel", "Japan", "Jordan", 
-                "Kazakhstan", "Kuwait", "Kyrgyzstan", "Laos", "Lebanon", "Malaysia", "Maldives", "Mongolia", 
-                "Myanmar", "Nepal", "North Korea", "Oman", "Pakistan", "Palestine", "Philippines", "Qatar", 
-                "Saudi Arabia", "Singapore", "South Korea", "Sri Lanka", "Syria", "Tajikistan", "Thailand", 
-                "Timor-Leste", "Turkey", "Turkmenistan", "United Arab Emirates", "Uzbekistan", "Vietnam", "Yemen"
-            ],
-            "Europe": [
-                "Albania", "Andorra", "Austria", "Belarus", "Belgium", "Bosnia and Herzegovina", "Bulgaria", 
-                "Croatia", "Czechia", "Denmark", "Estonia", "Finland", "France", "Germany", "Greece", "Hungary", 
-                "Iceland", "Ireland", "Italy", "Latvia", "Liechtenstein", "Lithuania", "Luxembourg", "Malta", 
-                "Moldova", "Monaco", "Montenegro", "Netherlands", "North Macedonia", "Norway", "Poland", "Portugal", 
-                "Romania", "Russia", "San Marino", "Serbia", "Slovakia", "Slovenia", "Spain", "Sweden", "Switzerland", 
-                "Ukraine", "United Kingdom", "Vatican City"
-            ],
-            "North America": [
-                "Antigua and Barbuda", "Bahamas", "Barbados", "Belize", "Canada", "Costa Rica", "Cuba", "Dominica", 
-                "Dominican Republic", "El Salvador", "Grenada", "Guatemala", "Haiti", "Honduras", "Jamaica", "Mexico", 
-                "Nicaragua", "Panama", "Saint Kitts and Nevis", "Saint Lucia", "Saint Vincent and the Grenadines", 
-                "Trinidad and Tobago", "United States"
-            ],
-            "South America": [
-                "Argentina", "Bolivia", "Brazil", "Chile", "Colombia", "Ecuador", "Guyana", "Paraguay", "Peru", 
-                "Suriname", "Uruguay", "Venezuela"
-            ],
-            "Oceania": [
-                "Australia", "Fiji", "Kiribati", "Marshall Islands", "Micronesia", "Nauru", "New Zealand", "Palau", 
-                "Papua New Guinea", "Samoa", "Solomon Islands", "Tonga", "Tuvalu", "Vanuatu"
-            ]
-        }
-        self.volunteers = []
+    def __init__(self, data_file="data/relief_data.json", journaled=False, group_commit=False):
+        # 1. THE COMPLETE GLOBAL DATABASE (195 Countries), shared with the app
+        self.world_data = WORLD_DATA
+        self.emergency = EmergencyRegistry()
+        self.data_file = data_file
+        self.store = InventoryStore()
+        self.volunteers = VolunteerRoster()
+        self._volunteer_index = None
+        self._synthetic = None
+        self._hub_index = None
+        self._zone_index = None
+        self._allocation = None
+        self._allocation_demand = None   # the caller's demand for the plan, None for the default
+        self._aggregator = None
+        self._live = None
+        self._history = None
+        self.history_file = os.path.splitext(data_file)[0] + ".history.npz"
+        self._sync = None
+        # Per-hub lock stripes: concurrent updates to different hubs do not wait on each other
+        self.center_locks = StripedLocks()
+        self.journal = None
+        self.sqlite = None
+        if journaled and not data_file.lower().endswith(".json"):
+            raise ValueError("Journaled mode applies to the JSON backend only.")
+        if DatabaseHelper.is_sqlite(data_file):
+            self.sqlite = DatabaseHelper.open_sqlite(data_file)
+        self.load_state()
+        if journaled:
+            # With group_commit the caller fsyncs many appends at once through commit()
+            self.journal = DatabaseHelper.open_journal(data_file, start_seq=self.wal_seq, fsync=not group_commit)
+            self._sync = None
+
+    # ------------------------------------------------------------------
+    # Aid centers & persistence
+    # ------------------------------------------------------------------
+    @timed
+    def load_state(self):
+        """Populates the inventory store and volunteer roster from disk."""
+        self._live = None
+        self._history = None
+        if DatabaseHelper.is_binary(self.data_file):
+            # Mapped lazily: startup cost does not depend on the dataset size
+            snapshot = DatabaseHelper.open_binary(self.data_file)
+            self.wal_seq = 0
+            if snapshot is not None:
+                self.store = MappedInventoryStore(snapshot)
+                self.volunteers = snapshot.volunteers()
+                self._volunteer_index = None
+            return
+        if self.sqlite is not None:
+            data = self.sqlite.load_state()
+        else:
+            data = DatabaseHelper.load_from_json(self.data_file)
+        self.wal_seq = data.get("wal_seq", 0) if data else 0
+        centers = data.get("centers", []) if data else []
+        for c in centers:
+            self.store.add_center(c["city"], c["country"], c.get("inventory"), c.get("lat"), c.get("lon"))
+        if data:
+            self.volunteers = VolunteerRoster(data.get("volunteers", []))
+            self._volunteer_index = None
+        if self.sqlite is None:
+            # Baseline for merging this engine's changes into the shared snapshot on commit
+            versions = [c.get("version", 0) for c in centers]
+            self._sync = SyncPoint(versions, self.store.size, len(self.volunteers), len(self.volunteers))
+
+    @property
+    def centers(self):
+        return self.store.centers()
+
+    @timed
+    def add_center(self, city, country, inventory=None, lat=None, lon=None):
+        row = self.store.add_center(city, country, inventory, lat, lon)
+        if self._live is not None:
+            self._live.record_center(row)
+        if self.journal is not None:
+            self.journal.log_center(center_record(self.store.center(city)))
+        elif self.sqlite is not None:
+            self.sqlite.add_center(city, country, inventory, lat, lon)
+        return row
+
+    @timed
+    def update_inventory(self, city, item, qty):
+        """O(1) supply update. Returns False if the city is not a known hub."""
+        row = self.store.row_of(city)
+        if row is None or not item:
+            return False
+        with self.center_locks.hold(row):
+            col = self.store.item_id(item, create=True)
+            was_stocked = bool(self.store.stocked[row, col])
+            if self._sync is not None:
+                self._sync.touch(self.store, (row,))
+            self.store.add(row, col, qty)
+            if self._live is not None:
+                self._live.record_update(row, col, qty, was_stocked)
+        if self.journal is not None:
+            self.journal.log_inventory(city, item, qty)
+        elif self.sqlite is not None:
+            self.sqlite.queue_update(self.store.center(city).city, item, qty)
+        if self._allocation is not None:
+            self._reallocate(row, item)
+        return True
+
+    def can_update_concurrently(self, item):
+        """
+        True when update_inventory() for `item` only touches its own hub's
+        row, so callers holding different hub stripes can run it together:
+        the item column already exists and no allocation plan is re-solved.
+        """
+        return self.store.item_id(item) is not None and self._allocation is None
+
+    @timed
+    def apply_updates(self, rows, cols, qtys):
+        """
+        Bulk update_inventory over store row / item column IDs. Deltas are
+        summed per (hub, item), applied with one scatter-add and persisted as
+        one journal record or one SQLite transaction.
+        """
+        rows, cols, qtys = (np.asarray(a, dtype=np.int64) for a in (rows, cols, qtys))
+        if not len(rows):
+            return 0
+        cells, inverse = np.unique(rows * len(self.store.items) + cols, return_inverse=True)
+        totals = np.zeros(len(cells), dtype=np.int64)
+        np.add.at(totals, inverse, qtys)
+        rows, cols = np.divmod(cells, len(self.store.items))
+        was_stocked = self.store.stocked[rows, cols] if self._live is not None else None
+        if self._sync is not None:
+            self._sync.touch(self.store, set(rows.tolist()))
+        self.store.add_many(rows, cols, totals)
+        if self._live is not None:
+            self._live.record_many(rows, cols, totals, was_stocked)
+
+        updates = [
+            (self.store.cities[r], self.store.items[c], q)
+            for r, c, q in zip(rows.tolist(), cols.tolist(), totals.tolist())
+        ]
+        if self.journal is not None:
+            self.journal.log_batch(updates)
+        elif self.sqlite is not None:
+            self.sqlite.apply_inventory_updates(updates)
+
+        if self._allocation is not None:
+            if len(updates) > 64:
+                # Cheaper to plan from scratch than to re-solve hub by hub
+                self.plan_allocation(self._allocation_demand)
+            else:
+                for r, (_, item, _) in zip(rows.tolist(), updates):
+                    self._reallocate(r, item)
+        return len(updates)
+
+    @timed
+    def global_totals(self):
+        return self.store.global_totals()
+
+    @timed
+    def country_totals(self, country=None):
+        if self.sqlite is not None and country is not None:
+            # Indexed by country in SQLite; queued writes are committed first
+            self.sqlite.flush()
+            return self.sqlite.item_totals(country)
+        return self.store.country_totals(country)
 
+    @timed
+    def centers_in(self, country):
+        """Cities of the hubs in `country`, in the order they joined the grid."""
+        if self.sqlite is not None:
+            self.sqlite.flush()
+            return self.sqlite.centers_in(country)
+        return [c.city for c in self.store.centers_in(country)]
+
+    @timed
+    def hubs_below(self, item, threshold):
+        """Hubs stocking less than `threshold` of `item`, lowest first, as (city, country, qty)."""
+        if self.sqlite is not None:
+            self.sqlite.flush()
+            return self.sqlite.centers_below(item, threshold)
+        col = self.store.item_id(item)
+        if col is None:
+            return []
+        n = self.store.size
+        quantities = self.store.quantities[:n, col]
+        rows = np.flatnonzero(self.store.stocked[:n, col] & (quantities < threshold))
+        rows = rows[np.argsort(quantities[rows], kind="stable")]
+        countries = self.store.countries
+        return [
+            (self.store.cities[r], countries[cid], qty)
+            for r, cid, qty in zip(rows.tolist(), self.store.country_ids[rows].tolist(), quantities[rows].tolist())
+        ]
+
+    @timed
+    def global_report(self, threshold=0, workers=1):
+        """
+        Grid-wide rollups (see ShardedAggregator.aggregate), computed per
+        continent shard; workers > 1 spreads the shards over a process pool.
+        """
+        if self._aggregator is None or self._aggregator.workers != workers:
+            if self._aggregator is not None:
+                self._aggregator.close()
+            self._aggregator = ShardedAggregator(workers)
+        return self._aggregator.report(self.store, threshold)
+
+    @property
+    def live(self):
+        """LiveAggregates built on first use, then kept in step by every mutation."""
+        if self._live is None:
+            self._live = LiveAggregates(self.store, self.volunteers)
+        return self._live
+
+    @timed
+    def live_snapshot(self, detail=True):
+        """Dashboard KPIs without re-scanning centers or volunteers (see LiveAggregates.snapshot)."""
+        return self.live.snapshot(detail)
+
+    # ------------------------------------------------------------------
+    # Stock history and depletion forecasts
+    # ------------------------------------------------------------------
+    @property
+    def history(self):
+        """StockHistory loaded from history_file on first use."""
+        if self._history is None:
+            self._history = StockHistory.load(self.history_file, self.store)
+        return self._history
+
+    @timed
+    def record_history(self, now=None):
+        self.history.record(self.store, now)
+
+    @timed
+    def save_history(self):
+        self.history.save(self.history_file, list(self.store.cities))
+
+    @timed
+    def stock_series(self, city, tier="hour"):
+        """(times, {item: levels}) of one hub in time order; empty when the hub is unknown."""
+        row = self.store.row_of(city)
+        if row is None or row >= self.history.size:
+            return np.zeros(0), {}
+        times, levels = self.history.series(tier, rows=row)
+        return times, dict(zip(self.history.items, levels.T.tolist()))
+
+    @timed
+    def depletion_forecast(self, tier="hour", limit=10):
+        """
+        The `limit` hub x item lines projected to run out soonest on their
+        `tier` trend, as [{city, country, item, level, per_hour, hours_left}].
+        """
+        hours_left, slopes, levels = self.history.depletion(tier)
+        finite = np.flatnonzero(np.isfinite(hours_left))
+        if limit is not None and len(finite) > limit:
+            finite = finite[np.argpartition(hours_left.ravel()[finite], limit)[:limit]]
+        finite = finite[np.argsort(hours_left.ravel()[finite], kind="stable")]
+        rows, cols = np.unravel_index(finite, hours_left.shape)
+        return [
+            {
+                "city": self.store.cities[r],
+                "country": self.store.countries[self.store.country_ids[r]],
+                "item": self.history.items[c],
+                "level": int(levels[r, c]),
+                "per_hour": float(slopes[r, c]),
+                "hours_left": float(hours_left[r, c]),
+            }
+            for r, c in zip(rows.tolist(), cols.tolist())
+        ]
+
+    # ------------------------------------------------------------------
+    # Volunteers
+    # ------------------------------------------------------------------
+    @property
+    def volunteer_index(self):
+        """Built on the first search, then kept in step by register_volunteer."""
+        if self._volunteer_index is None:
+            if isinstance(self.volunteers, VolunteerRoster):
+                # Vocabulary only: the roster filters its own specialty codes
+                self._volunteer_index = VolunteerIndex()
+                for spec in self.volunteers.specialties:
+                    self._volunteer_index.add_specialty(spec)
+            else:
+                self._volunteer_index = VolunteerIndex(self.volunteers)
+        return self._volunteer_index
+
+    @timed
+    def register_volunteer(self, name, spec, contact):
+        volunteer = {"name": name, "spec": spec, "contact": contact}
+        self.volunteers.append(volunteer)
+        if self._live is not None:
+            self._live.record_volunteer(spec)
+        if self._volunteer_index is not None:
+            if isinstance(self.volunteers, VolunteerRoster):
+                self._volunteer_index.add_specialty(spec)
+            else:
+                self._volunteer_index.add(volunteer, len(self.volunteers) - 1)
+        if self.journal is not None:
+            self.journal.log_volunteer(volunteer)
+        elif self.sqlite is not None:
+            self.sqlite.queue_volunteer(volunteer)
+        return volunteer
+
+    @timed
+    def register_volunteers(self, volunteers):
+        """
+        Bulk register_volunteer, e.g. a batch from the RegistrationQueue: one
+        roster extend and one journal record for the whole batch.
+        """
+        volunteers = [{"name": v["name"], "spec": v["spec"], "contact": v["contact"]} for v in volunteers]
+        first = len(self.volunteers)
+        if isinstance(self.volunteers, VolunteerRoster):
+            self.volunteers.extend(volunteers)
+        else:
+            for volunteer in volunteers:
+                self.volunteers.append(volunteer)
+        for position, volunteer in enumerate(volunteers, first):
+            if self._live is not None:
+                self._live.record_volunteer(volunteer["spec"])
+            if self._volunteer_index is not None:
+                if isinstance(self.volunteers, VolunteerRoster):
+                    self._volunteer_index.add_specialty(volunteer["spec"])
+                else:
+                    self._volunteer_index.add(volunteer, position)
+        if self.journal is not None:
+            self.journal.log_volunteers(volunteers)
+        elif self.sqlite is not None:
+            for volunteer in volunteers:
+                self.sqlite.queue_volunteer(volunteer)
+        return len(volunteers)
+
+    @timed
+    def search_volunteers(self, query, fuzzy=True):
+        """Prefix and typo-tolerant specialty search backed by the VolunteerIndex."""
+        if self.sqlite is not None:
+            # The index resolves the query to stored spellings; SQLite fetches them by its spec index
+            self.sqlite.flush()
+            specs = self.volunteers.specialties_for(self.volunteer_index.match(query, fuzzy))
+            return self.sqlite.volunteers_by_specialty(*specs)
+        if isinstance(self.volunteers, VolunteerRoster):
+            positions = self.volunteers.with_specialties(self.volunteer_index.match(query, fuzzy))
+        else:
+            positions = self.volunteer_index.search(query, fuzzy)
+        return [self.volunteers[i] for i in positions]
+
+    @timed
+    def save_state(self):
+        if self.journal is not None:
+            # Every change is already in the WAL; fold it into the snapshot
+            self.journal.close()
+            self.journal = None
+            print(f"\n[System] Journal compacted into {self.data_file}")
+            return
+        if self.sqlite is not None:
+            # Queued writes are committed as one transaction
+            self.sqlite.flush()
+            print(f"\n[System] Data successfully committed to {self.data_file}")
+            return
+        self.commit()
+        if not DatabaseHelper.is_binary(self.data_file):
+            # Reported here, on the explicit save; commit() also runs once per queued batch
+            print(f"\n[System] Data successfully backed up to {self.data_file}")
+
+    @timed
+    def commit(self):
+        """
+        Makes every change so far durable: fsyncs the journal, commits queued
+        SQLite writes, or rewrites the snapshot file (a JSON snapshot is
+        merged with other writers' commits; see _merge_into).
+        """
+        if self.journal is not None:
+            self.journal.sync()
+        elif self.sqlite is not None:
+            self.sqlite.flush()
+        elif DatabaseHelper.is_binary(self.data_file):
+            DatabaseHelper.save_to_binary(self.store, self.volunteers, self.data_file)
+        else:
+            merged, pull = DatabaseHelper.merge_into_json(self.data_file, self._merge_into)
+            # Only once the snapshot is written: a failed write leaves every local change pending
+            pull()
+            return merged
+
+    def _merge_into(self, data):
+        """
+        Folds this engine's changes since its last sync into `data`, the JSON
+        snapshot as another writer may just have left it. Stock changes
+        travel as additive deltas and each hub record carries a version, so a
+        hub changed by both sides is merged, never overwritten. Returns the
+        number of such merged hubs, and a callable that pulls the other
+        writers' changes in here and advances the sync point; it must only
+        run once `data` is safely on disk.
+        """
+        store, base = self.store, self._sync
+        centers = data.setdefault("centers", [])
+        volunteers = data.setdefault("volunteers", [])
+        by_city = {normalize_city(c["city"]): c for c in centers}
+        merged = 0
+
+        # 1. Stock deltas on hubs known at the last sync
+        rows, cols, deltas = base.changes(store)
+        changed = {}
+        for row, col, delta in zip(rows, cols, deltas):
+            changed.setdefault(row, []).append((store.items[col], delta))
+        for row, changes in changed.items():
+            record = by_city.get(normalize_city(store.cities[row]))
+            if record is None:
+                # Gone from the file (replaced by hand): write the hub back whole
+                record = by_city[normalize_city(store.cities[row])] = center_record(AidCenter(store, row))
+                centers.append(record)
+                continue
+            version = record.get("version", 0)
+            merged += version != base.versions[row]
+            inventory = record.setdefault("inventory", {})
+            for item, delta in changes:
+                inventory[item] = inventory.get(item, 0) + delta
+            record["version"] = version + 1
+
+        # 2. Hubs added here; one registered by another writer meanwhile gets both stocks
+        for row in range(base.size, store.size):
+            center = AidCenter(store, row)
+            record = by_city.get(normalize_city(center.city))
+            if record is None:
+                record = by_city[normalize_city(center.city)] = center_record(center)
+                record["version"] = 1
+                centers.append(record)
+                continue
+            merged += 1
+            inventory = record.setdefault("inventory", {})
+            for item, qty in center.inventory.items():
+                inventory[item] = inventory.get(item, 0) + qty
+            record["version"] = record.get("version", 0) + 1
+
+        # 3. Volunteers registered on either side
+        remote_volunteers = volunteers[base.disk_volunteers:]
+        volunteers.extend(self.volunteers[base.local_volunteers:])
+
+        return merged, partial(self._pull, centers, remote_volunteers, len(volunteers))
+
+    def _pull(self, centers, remote_volunteers, disk_volunteers):
+        """
+        Brings the snapshot just written (its hub `centers`, and the
+        volunteers other writers added) into this engine, then makes it the
+        new sync point.
+        """
+        store, base = self.store, self._sync
+        # 4. Pull in hubs other writers added or changed
+        pulled = []
+        known = []
+        for record in centers:
+            row = store.row_of(record["city"])
+            if row is None:
+                row = self.add_center(record["city"], record["country"], record.get("inventory"), record.get("lat"), record.get("lon"))
+            elif row >= base.size or record.get("version", 0) != base.versions[row]:
+                local = store.inventory(row)
+                for item, qty in record.get("inventory", {}).items():
+                    if local.get(item) != qty:
+                        pulled.append((row, store.item_id(item, create=True), qty - local.get(item, 0)))
+            known.append((row, record.get("version", 0)))
+        if pulled:
+            self.apply_updates(*zip(*pulled))
+        for v in remote_volunteers:
+            self.register_volunteer(v["name"], v["spec"], v["contact"])
+
+        versions = np.zeros(store.size, dtype=np.int64)
+        if known:
+            rows, values = zip(*known)
+            versions[list(rows)] = values
+        self._sync = SyncPoint(versions, store.size, len(self.volunteers), disk_volunteers)
+
+    @timed
     def get_inventory(self, country):
         """Generates professional mock inventory data for a country."""
-        random.seed(country) 
-        return {
-            "Potable Water (L)": random.randint(10000, 500000),
-            "Trauma Kits": random.randint(500, 10000),
-            "MREs (Meals)": random.randint(2000, 100000),
-            "Field Tents": random.randint(100, 5000),
-            "Power Generators": random.randint(10, 500)
-        }
+        return self.synthetic_inventory.get(canonical_country(country))
+
+    @timed
+    def get_inventories(self, countries=None):
+        """Bulk form of get_inventory; defaults to every country in world_data."""
+        if countries is None:
+            countries = all_countries()
+        names = {country: canonical_country(country) for country in countries}
+        inventories = self.synthetic_inventory.get_many(names.values())
+        # Keyed by the names asked for, with the same values get_inventory returns
+        return {country: inventories[name] for country, name in names.items()}
+
+    @property
+    def synthetic_inventory(self):
+        if self._synthetic is None:
+            self._synthetic = SyntheticInventory()
+            self._synthetic.prime(all_countries())
+        return self._synthetic
 
+    @timed
     def get_disaster_zones(self):
         """
         Generates lat/lon coordinates for the map to simulate 
@@ -88,11 +519,126 @@ class UnityGridEngine:
         # Simulate Earthquake Zones (Red) - Ring of Fire, Turkey, etc.
         eq_coords = [(36.2, 36.1), (35.6, 139.6), (-6.2, 106.8), (34.0, -118.2), (-33.4, -70.6), (27.7, 85.3)]
         for lat, lon in eq_coords:
-            zones.append({"lat": lat, "lon": lon, "type": "Earthquake Risk", "color": "red", "radius": 15})
+            zones.append({"lat": lat, "lon": lon, "type": "Earthquake Risk", "risk": "High", "color": "red", "radius": 15})
             
         # Simulate Tsunami/Flood Zones (Green) - Coastal Areas
         ts_coords = [(6.9, 79.8), (14.5, 120.9), (-18.1, 178.4), (13.7, 100.5), (25.7, -80.1)]
         for lat, lon in ts_coords:
-            zones.append({"lat": lat, "lon": lon, "type": "Tsunami/Flood Risk", "color": "#00FF00", "radius": 12})
+            zones.append({"lat": lat, "lon": lon, "type": "Tsunami/Flood Risk", "risk": "Moderate", "color": "#00FF00", "radius": 12})
             
         return zones
+
+    # ------------------------------------------------------------------
+    # Spatial queries (hubs and disaster zones)
+    # ------------------------------------------------------------------
+    def hub_index(self):
+        """Grid index over geolocated hubs, rebuilt when centers are added."""
+        if self._hub_index is None or self._hub_index.size != self.store.size:
+            n = self.store.size
+            self._hub_index = GeoGridIndex(self.store.lats[:n], self.store.lons[:n])
+        return self._hub_index
+
+    def zone_index(self):
+        zones = self.get_disaster_zones()
+        if self._zone_index is None or self._zone_index[0] != zones:
+            index = GeoGridIndex([z["lat"] for z in zones], [z["lon"] for z in zones])
+            self._zone_index = (zones, index)
+        return self._zone_index
+
+    def _stocked_mask(self, item, min_qty):
+        n = self.store.size
+        if item is None:
+            return (self.store.quantities[:n, :len(self.store.items)] >= min_qty).any(axis=1)
+        col = self.store.item_id(item)
+        if col is None:
+            return np.zeros(n, dtype=bool)
+        return self.store.quantities[:n, col] >= min_qty
+
+    @timed
+    def nearest_hubs(self, lat, lon, k=3, item=None, min_qty=1):
+        """[(AidCenter, km)] for the k closest hubs holding at least `min_qty` of `item` (or of anything)."""
+        rows, dists = self.hub_index().nearest(lat, lon, k, mask=self._stocked_mask(item, min_qty))
+        return [(AidCenter(self.store, int(r)), float(d)) for r, d in zip(rows, dists)]
+
+    @timed
+    def hubs_within(self, lat, lon, radius_km):
+        rows, dists = self.hub_index().within(lat, lon, radius_km)
+        return [(AidCenter(self.store, int(r)), float(d)) for r, d in zip(rows, dists)]
+
+    @timed
+    def zones_near(self, lat, lon, radius_km):
+        """[(zone, km)] for disaster zones within `radius_km` of a point, e.g. a hub or new incident."""
+        zones, index = self.zone_index()
+        ids, dists = index.within(lat, lon, radius_km)
+        return [(zones[i], float(d)) for i, d in zip(ids, dists)]
+
+    @timed
+    def contacts_within(self, lat, lon, radius_km=ZONE_CONTACT_RADIUS_KM):
+        """
+        Emergency numbers for every hub within `radius_km` of a point (e.g. a
+        disaster zone), nearest first, as [{hub, km, numbers}]. One gather
+        over the hubs' country IDs; hubs whose country lists none are left out.
+        """
+        rows, dists = self.hub_index().within(lat, lon, radius_km)
+        numbers, listed = self.emergency.gather(self.store.country_ids[rows])
+        services = self.emergency.services
+        return [
+            {"hub": AidCenter(self.store, int(r)), "km": float(d),
+             "numbers": {s: n for s, n in zip(services, row) if n}}
+            for r, d, row, ok in zip(rows, dists, numbers.tolist(), listed.tolist()) if ok
+        ]
+
+    # ------------------------------------------------------------------
+    # Supply allocation
+    # ------------------------------------------------------------------
+    @timed
+    def plan_allocation(self, demand=None):
+        """
+        Ships geolocated hub stock to disaster zones at minimum total unit-km.
+        `demand` is a (zones x items) array in store item order; by default
+        each zone asks for ZONE_DEMAND_PER_RADIUS units per radius of every item.
+        Items added after `demand` was drawn up get no demand. Later
+        update_inventory calls re-solve the plan incrementally.
+        """
+        zones = self.get_disaster_zones()
+        n = self.store.size
+        rows = np.flatnonzero(~np.isnan(self.store.lats[:n]) & ~np.isnan(self.store.lons[:n]))
+        items = list(self.store.items)
+        self._allocation_demand = demand
+        if demand is None:
+            radius = np.array([z["radius"] for z in zones])
+            demand = np.repeat(radius[:, None] * ZONE_DEMAND_PER_RADIUS, len(items), axis=1)
+        else:
+            demand = np.asarray(demand, dtype=np.int64)
+            if demand.shape[1] < len(items):
+                demand = np.pad(demand, ((0, 0), (0, len(items) - demand.shape[1])))
+        planner = AllocationPlanner(
+            self.store.lats[rows], self.store.lons[rows],
+            [z["lat"] for z in zones], [z["lon"] for z in zones],
+            self.store.quantities[rows, :len(items)], demand, items,
+        )
+        self._allocation = (planner, rows, {int(r): i for i, r in enumerate(rows)}, zones)
+        return self.allocation_plan()
+
+    def _reallocate(self, row, item):
+        planner, _, positions, _ = self._allocation
+        # Hubs without coordinates and items added since planning wait for the next full plan
+        if row in positions and item in planner.items:
+            planner.update_supply(positions[row], item, self.store.quantities[row, self.store.item_id(item)])
+
+    def allocation_plan(self):
+        """{"shipments": [...], "shortfall": [...], "unit_km": float} for the current plan."""
+        if self._allocation is None:
+            return None
+        planner, rows, _, zones = self._allocation
+        shipments = [
+            {"hub": AidCenter(self.store, int(rows[h])), "zone": zones[z], "item": item, "qty": qty, "km": km}
+            for h, z, item, qty, km in planner.shipments()
+        ]
+        unmet = planner.shortfall()
+        shortfall = [
+            {"zone": zones[z], "item": planner.items[i], "qty": int(unmet[z, i])}
+            for z, i in zip(*np.nonzero(unmet))
+        ]
+        unit_km = sum(s["qty"] * s["km"] for s in shipments)
+        return {"shipments": shipments, "shortfall": shortfall, "unit_km": unit_km}
@@ -0,0 +1,272 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+from instrumentation import observe
+
+QUEUED, DUPLICATE, INVALID = "queued", "duplicate", "invalid"
+
+
+def normalize_email(contact):
+    """Dedup key for a contact: surrounding and inner whitespace dropped, case folded."""
+    return "".join(contact.split()).casefold()
+
+
+def queue_path(data_file, owner):
+    """
+    The queue one entry point ("app", "cli") keeps in front of a snapshot.
+    Each process owns its queue file; they only meet in storage.
+    """
+    return f"{os.path.splitext(data_file)[0]}.{owner}.registrations"
+
+
+class BloomFilter:
+    """
+    Fixed-size bit array answering "definitely not seen" or "maybe seen".
+    k probe positions come from one blake2b digest by double hashing.
+    """
+
+    def __init__(self, capacity=1 << 16, error_rate=0.001):
+        self.capacity = capacity
+        self.n_bits = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.n_bits for i in range(self.k)]
+
+    def add(self, key):
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[p >> 3] >> (p & 7) & 1 for p in self._positions(key))
+
+    @property
+    def full(self):
+        return self.count > self.capacity
+
+
+class RegistrationQueue:
+    """
+    Durable, deduplicating front door for volunteer registrations, shared
+    by the app's "Join the Grid" form and the CLI.
+
+    1. submit() normalizes the email and rejects repeats in O(1): a Bloom
+       filter answers the common case (a new address) from a fixed-size bit
+       array, and only possible repeats probe the exact hash index of every
+       stored and queued address.
+    2. Accepted registrations are appended to the owner's own queue file,
+       `<data>.<owner>.registrations` (see queue_path: the app and the CLI
+       never share one), one JSON line each, and fsynced before submit()
+       returns, so the form's latency does not depend on the snapshot's
+       size or how busy storage is. Concurrent submitters share fsyncs
+       (group commit).
+    3. A committer drains the queue into the engine in batches: one write
+       lock, one register_volunteers() and one engine.commit() per batch.
+       The commit merges the batch into the shared snapshot, and pulls in
+       what the other owners' queues committed there, which then joins
+       this queue's duplicate index. The committed byte offset goes to
+       `<queue>.offset` afterwards; on restart everything past it is
+       replayed, skipping registrations storage already holds, so a crash
+       never loses or doubles one.
+
+    `grid` is a SharedEngine. With background=False (the CLI) nothing runs
+    until drain() is called.
+    """
+
+    def __init__(self, grid, path, batch_size=4096, interval=1.0, fsync=True, background=True):
+        self.grid = grid
+        self.path = path
+        self.offset_path = path + ".offset"
+        self.batch_size = batch_size
+        self.interval = interval
+        self.fsync = fsync
+        self.stats = {QUEUED: 0, DUPLICATE: 0, INVALID: 0, "committed": 0, "batches": 0}
+        self._lock = threading.Lock()         # submissions, the pending list and the file
+        self._sync_lock = threading.Lock()    # one fsync at a time, covering every append before it
+        self._drain_lock = threading.Lock()   # one batch commit at a time
+        self._pending = []                    # (record, end offset in the queue file)
+        self._registered = 0                  # leading pending records already registered, commit failed
+        self._appended = 0                    # appends so far, and how many of them are fsynced
+        self._synced = 0
+        self._stop = threading.Event()
+
+        with grid.read() as engine:
+            stored = {normalize_email(v["contact"]) for v in engine.volunteers}
+            self._seen = len(engine.volunteers)
+        self._index = set(stored)
+        self._bloom = BloomFilter(max(1 << 16, 2 * len(stored)))
+        for key in stored:
+            self._bloom.add(key)
+        self._committed = self._recover(stored)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "ab")
+
+        self._committer = None
+        if background:
+            self._committer = threading.Thread(target=self._run_committer, name="unitygrid-registrations", daemon=True)
+            self._committer.start()
+
+    def _recover(self, stored):
+        """Re-queues registrations past the committed offset that storage does not hold yet."""
+        committed = 0
+        if os.path.exists(self.offset_path):
+            with open(self.offset_path) as f:
+                committed = int(f.read() or 0)
+        if not os.path.exists(self.path):
+            return 0
+        if committed > os.path.getsize(self.path):
+            committed = 0
+        with open(self.path, "rb") as f:
+            f.seek(committed)
+            end = committed
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break     # torn final line: that submission was never acknowledged
+                end += len(line)
+                key = normalize_email(record["contact"])
+                if key in stored or key in self._index:
+                    continue
+                self._index.add(key)
+                self._bloom.add(key)
+                self._pending.append((record, end))
+        # Drop a torn tail so new appends start on a clean line
+        if end < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+        return committed
+
+    # ------------------------------------------------------------------
+    # Submission (the form's hot path)
+    # ------------------------------------------------------------------
+    def submit(self, name, spec, contact):
+        """Returns QUEUED, DUPLICATE (address already registered or queued) or INVALID."""
+        start = time.perf_counter()
+        name, spec, key = name.strip(), spec.strip(), normalize_email(contact)
+        if not (name and spec and key):
+            status = INVALID
+        else:
+            record = {"name": name, "spec": spec, "contact": contact.strip()}
+            line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            with self._lock:
+                if key in self._bloom and key in self._index:
+                    status = DUPLICATE
+                else:
+                    self._file.write(line)
+                    self._file.flush()
+                    self._appended += 1
+                    ticket = self._appended
+                    self._index.add(key)
+                    self._bloom.add(key)
+                    if self._bloom.full:
+                        self._regrow_bloom()
+                    self._pending.append((record, self._file.tell()))
+                    status = QUEUED
+            if status == QUEUED and self.fsync:
+                self._sync(ticket)
+        with self._lock:
+            self.stats[status] += 1
+        observe("registration.submit", time.perf_counter() - start)
+        return status
+
+    def _sync(self, ticket):
+        """Returns once append number `ticket` is on disk; one fsync covers all appends made before it."""
+        with self._sync_lock:
+            if self._synced >= ticket:
+                return
+            with self._lock:
+                target = self._appended
+            os.fsync(self._file.fileno())
+            self._synced = target
+
+    def _regrow_bloom(self):
+        bloom = BloomFilter(2 * self._bloom.capacity)
+        for key in self._index:
+            bloom.add(key)
+        self._bloom = bloom
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Batch committer
+    # ------------------------------------------------------------------
+    def drain(self, max_batches=None):
+        """Commits queued registrations in batches; returns how many were committed."""
+        committed = 0
+        batches = 0
+        with self._drain_lock:
+            while self._pending and (max_batches is None or batches < max_batches):
+                with self._lock:
+                    batch = self._pending[:self.batch_size]
+                with self.grid.write() as engine:
+                    # After a failed commit the batch's head is already in the roster: only retry the commit
+                    engine.register_volunteers([record for record, _ in batch[self._registered:]])
+                    self._registered = max(self._registered, len(batch))
+                    engine.commit()
+                    # Includes registrations other processes committed, pulled in by the merge
+                    arrived = engine.volunteers[self._seen:]
+                    self._seen = len(engine.volunteers)
+                with self._lock:
+                    for volunteer in arrived:
+                        key = normalize_email(volunteer["contact"])
+                        if key not in self._index:
+                            self._index.add(key)
+                            self._bloom.add(key)
+                    del self._pending[:len(batch)]
+                    self._registered -= len(batch)
+                    self._mark_committed(batch[-1][1])
+                    self.stats["committed"] += len(batch)
+                    self.stats["batches"] += 1
+                committed += len(batch)
+                batches += 1
+        return committed
+
+    def _mark_committed(self, offset):
+        """
+        Records the committed offset. A fully drained queue file is truncated
+        after its offset is reset, so a crash in between only replays
+        registrations that recovery finds already stored.
+        """
+        drained = not self._pending
+        tmp_path = self.offset_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(str(0 if drained else offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.offset_path)
+        if drained:
+            self._file.truncate(0)
+            self._file.seek(0)
+        self._committed = 0 if drained else offset
+
+    def _run_committer(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.drain()
+            except OSError as e:
+                # Storage unavailable: the batch stays queued and is retried next round
+                print(f"[Registrations] Commit failed, will retry: {e}")
+
+    def close(self):
+        """Stops the committer and commits whatever is still queued."""
+        self._stop.set()
+        if self._committer is not None:
+            self._committer.join()
+        self.drain()
+        with self._lock:
+            self._file.close()
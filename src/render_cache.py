@@ -0,0 +1,112 @@
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+# Figure attributes holding one value per point; the rest of a figure is small
+POINT_ARRAYS = ("x", "y", "z", "lat", "lon", "text", "hovertext", "customdata", "ids", "labels", "values", "locations")
+MARKER_ARRAYS = ("size", "color")
+FIGURE_OVERHEAD = 16 * 1024
+
+
+def _array_bytes(values):
+    """Retained bytes of a per-point array, sized from its length and first element."""
+    if values is None or isinstance(values, (str, int, float)):
+        return 0
+    if hasattr(values, "nbytes"):
+        return int(values.nbytes)
+    if not len(values):
+        return 0
+    # A pointer per slot plus the element objects, all assumed as large as the first
+    return len(values) * (8 + sys.getsizeof(values[0]))
+
+
+def figure_size(fig):
+    """Approximate retained bytes of a Plotly figure, from its traces' data lengths (no serialization)."""
+    size = FIGURE_OVERHEAD
+    for trace in fig.data:
+        size += sum(_array_bytes(getattr(trace, name, None)) for name in POINT_ARRAYS)
+        marker = getattr(trace, "marker", None)
+        size += sum(_array_bytes(getattr(marker, name, None)) for name in MARKER_ARRAYS)
+    return size
+
+
+def estimate_size(value):
+    """Approximate retained bytes of a cached Plotly figure, DataFrame or plain value."""
+    if hasattr(value, "to_plotly_json"):
+        return figure_size(value)
+    if hasattr(value, "memory_usage"):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    try:
+        return len(json.dumps(value, default=str))
+    except TypeError:
+        return 1024
+
+
+class RenderCache:
+    """
+    Byte-bounded LRU cache for rendered figures and tables.
+
+    Entries are keyed on (name, data version, render parameters), so a
+    rerun that changes nothing the chart depends on (switching language,
+    navigating back to a page) reuses the built object instead of
+    recomputing it. When the underlying data changes its version moves on,
+    and the stale entry simply ages out.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(name, version, params=None):
+        return (name, version, tuple(sorted((params or {}).items())))
+
+    def get_or_build(self, name, version, build, params=None):
+        key = self.make_key(name, version, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Build outside the lock; concurrent misses on one key are harmless
+        value = build()
+        size = estimate_size(value)
+        with self._lock:
+            if size <= self.max_bytes:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self.bytes -= previous[1]
+                self._entries[key] = (value, size)
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self.bytes -= evicted
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,219 @@
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from country_catalog import CONTINENTS, continent_id
+
+# Smaller shards cost more in task overhead than they save in parallel work
+MIN_SHARD_ROWS = 20_000
+# Grids below this many hubs are reduced in-process, however many continents they span
+MIN_POOL_ROWS = 2 * MIN_SHARD_ROWS
+NO_STOCK = np.iinfo(np.int64).max
+
+
+def _reduce_shard(quantities, stocked, run_offsets, thresholds):
+    """
+    Partial rollups of one shard (a contiguous block of whole countries):
+    per-item totals, the smallest stocked hub, stocked hubs below
+    threshold, and one totals row per country run.
+    """
+    totals = quantities.sum(axis=0)
+    minimums = np.min(quantities, axis=0, where=stocked, initial=NO_STOCK)
+    hubs_below = np.count_nonzero(stocked & (quantities < thresholds), axis=0)
+    country_totals = np.add.reduceat(quantities, run_offsets, axis=0)
+    return totals, minimums, hubs_below, country_totals
+
+
+def _aggregate_shard(name, shape, start, end, run_offsets, thresholds):
+    """Pool entry point: attaches to the shared block and reduces rows [start, end)."""
+    shm = shared_memory.SharedMemory(name=name)
+    quantities = stocked = None
+    try:
+        quantities = np.ndarray(shape, dtype=np.int64, buffer=shm.buf)[start:end]
+        stocked = np.ndarray(shape, dtype=bool, buffer=shm.buf, offset=8 * shape[0] * shape[1])[start:end]
+        return _reduce_shard(quantities, stocked, run_offsets, thresholds)
+    finally:
+        # Views must be gone before the mapping can close
+        del quantities, stocked
+        shm.close()
+
+
+class ShardedAggregator:
+    """
+    Grid-wide rollups sharded by continent across a process pool.
+
+    1. load() copies the inventory into one shared-memory block with rows
+       ordered by continent, then country, so every shard is a contiguous
+       slice and every country sits in exactly one shard. report() only
+       reloads when the store's version has moved on, and only re-sorts
+       when hubs or items were added; otherwise the copy is two gathers.
+    2. aggregate() hands each shard (a continent, or a run of its countries
+       when a continent is large) to a worker, which maps the block and
+       returns small partial sums, minimums and threshold counts.
+    3. The partials are merged here; per-country totals need no merging
+       because countries never straddle shards.
+
+    With workers=1, or a grid under MIN_POOL_ROWS hubs (even one spread over
+    several continents), the shards are reduced in this process and no
+    pool is started.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._shm = None
+        self._shape = (0, 0)
+        self.items = []
+        self.countries = []
+        self.tasks = []             # (continent, first row, end row, first run, end run)
+        self.run_starts = None      # first row of each country run
+        self.run_countries = None   # country id of each run
+        self._order = None          # store row of each shared row
+        self._loaded = None         # (store, version) the shared block holds
+        self._layout = None         # (store, layout_version) the row order was planned for
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    # ------------------------------------------------------------------
+    # Shared layout
+    # ------------------------------------------------------------------
+    def _views(self):
+        quantities = np.ndarray(self._shape, dtype=np.int64, buffer=self._shm.buf)
+        stocked = np.ndarray(self._shape, dtype=bool, buffer=self._shm.buf, offset=quantities.nbytes)
+        return quantities, stocked
+
+    def load(self, store):
+        """Snapshots `store` into shared memory in continent/country order."""
+        version = store.version     # read first: a change made during the copy forces the next reload
+        if self._layout != (store, store.layout_version):
+            self._plan_layout(store)
+        n, n_items = store.size, len(store.items)
+        self._ensure_block(n, n_items)
+        quantities, stocked = self._views()
+        np.take(store.quantities[:n, :n_items], self._order, axis=0, out=quantities)
+        np.take(store.stocked[:n, :n_items], self._order, axis=0, out=stocked)
+        del quantities, stocked
+        self._loaded = (store, version)
+
+    def _plan_layout(self, store):
+        """Row order, country runs and shard tasks; only changes when hubs or items are added."""
+        n = store.size
+        self.items, self.countries = list(store.items), list(store.countries)
+        continent_ids = np.array([continent_id(c) for c in self.countries], dtype=np.int64)
+        country_ids = np.asarray(store.country_ids[:n], dtype=np.int64)
+        keys = continent_ids[country_ids] * max(len(self.countries), 1) + country_ids if n else country_ids
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        self.run_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]) if n else np.zeros(0, dtype=np.intp)
+        self.run_countries = country_ids[order[self.run_starts]]
+        self._order = order
+        self.tasks = self._plan_tasks(continent_ids[self.run_countries], n)
+        self._layout = (store, store.layout_version)
+
+    def _ensure_block(self, n, n_items):
+        nbytes = max(n * n_items * 9, 1)
+        if self._shm is None or self._shm.size < nbytes:
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._shape = (n, n_items)
+
+    def _plan_tasks(self, run_continents, n):
+        """Cuts each continent's country runs into shards of roughly n / (2 * workers) rows."""
+        target = max(MIN_SHARD_ROWS, -(-n // (2 * self.workers)))
+        bounds = np.r_[self.run_starts, n]
+        tasks = []
+        first = 0
+        for run in range(len(self.run_starts)):
+            last_of_continent = run + 1 == len(self.run_starts) or run_continents[run + 1] != run_continents[run]
+            if last_of_continent or bounds[run + 1] - bounds[first] >= target:
+                tasks.append((CONTINENTS[run_continents[run]], int(bounds[first]), int(bounds[run + 1]), first, run + 1))
+                first = run + 1
+        return tasks
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+    def _thresholds(self, threshold):
+        """A per-item threshold array from a number or an {item: qty} mapping."""
+        if isinstance(threshold, dict):
+            return np.array([threshold.get(item, 0) for item in self.items], dtype=np.int64)
+        return np.full(len(self.items), threshold, dtype=np.int64)
+
+    def _partials(self, thresholds):
+        jobs = [
+            (start, end, self.run_starts[run0:run1] - start)
+            for _, start, end, run0, run1 in self.tasks
+        ]
+        if self.workers <= 1 or len(jobs) <= 1 or self._shape[0] < MIN_POOL_ROWS:
+            quantities, stocked = self._views()
+            try:
+                return [_reduce_shard(quantities[s:e], stocked[s:e], offsets, thresholds) for s, e, offsets in jobs]
+            finally:
+                del quantities, stocked
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        futures = [
+            self._pool.submit(_aggregate_shard, self._shm.name, self._shape, s, e, offsets, thresholds)
+            for s, e, offsets in jobs
+        ]
+        return [f.result() for f in futures]
+
+    def aggregate(self, threshold=0):
+        """
+        Rollups of the loaded snapshot: totals per item and per continent,
+        the smallest stocked hub per item, and which hubs and countries sit
+        below `threshold` (a number, or {item: qty}).
+        """
+        thresholds = self._thresholds(threshold)
+        n_items = len(self.items)
+        partials = self._partials(thresholds)
+
+        totals = np.zeros(n_items, dtype=np.int64)
+        minimums = np.full(n_items, NO_STOCK, dtype=np.int64)
+        hubs_below = np.zeros(n_items, dtype=np.int64)
+        continents = {}
+        country_rows = []
+        for (continent, *_), (part_totals, part_minimums, part_below, part_countries) in zip(self.tasks, partials):
+            totals += part_totals
+            np.minimum(minimums, part_minimums, out=minimums)
+            hubs_below += part_below
+            continents[continent] = continents.get(continent, 0) + part_totals
+            country_rows.append(part_countries)
+
+        country_totals = np.concatenate(country_rows) if country_rows else np.zeros((0, n_items), dtype=np.int64)
+        below = country_totals < thresholds
+        names = [self.countries[cid] for cid in self.run_countries.tolist()]
+        return {
+            "totals": dict(zip(self.items, totals.tolist())),
+            "continents": {c: dict(zip(self.items, t.tolist())) for c, t in continents.items()},
+            "minimums": {item: (None if m == NO_STOCK else m) for item, m in zip(self.items, minimums.tolist())},
+            "hubs_below": dict(zip(self.items, hubs_below.tolist())),
+            "countries_below": {
+                item: [names[r] for r in np.flatnonzero(below[:, col]).tolist()]
+                for col, item in enumerate(self.items)
+            },
+        }
+
+    def report(self, store, threshold=0):
+        if self._loaded != (store, store.version):
+            self.load(store)
+        return self.aggregate(threshold)
@@ -0,0 +1,95 @@
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    Many concurrent readers or one writer. Waiting writers block new
+    readers, so a steady stream of dashboard reruns cannot starve updates.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class SharedEngine:
+    """
+    One engine per process, shared by every Streamlit session.
+
+    Reads run concurrently under the read lock; every write bumps `version`,
+    so a session can tell whether anything changed since its last rerun by
+    comparing one integer instead of diffing state.
+
+    Supply updates to existing hubs and items skip the exclusive lock: they
+    share the read side and only serialize on the hub's lock stripe inside
+    the engine, so updates to different hubs run side by side.
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._lock = ReadWriteLock()
+        self._version_lock = threading.Lock()
+        self.version = 0
+
+    @contextmanager
+    def read(self):
+        with self._lock.read():
+            yield self._engine
+
+    @contextmanager
+    def write(self):
+        with self._lock.write():
+            try:
+                yield self._engine
+            finally:
+                self._bump()
+
+    def _bump(self):
+        with self._version_lock:
+            self.version += 1
+
+    def update_inventory(self, city, item, qty):
+        """engine.update_inventory() under the hub's stripe; new items take the exclusive lock."""
+        with self._lock.read():
+            if self._engine.can_update_concurrently(item):
+                updated = self._engine.update_inventory(city, item, qty)
+                if updated:
+                    self._bump()
+                return updated
+        with self.write() as engine:
+            return engine.update_inventory(city, item, qty)
+
+    def changed_since(self, version):
+        return version != self.version
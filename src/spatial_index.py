@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; every argument broadcasts (degrees)."""
+    lat1, lon1, lat2, lon2 = (np.radians(x) for x in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GeoGridIndex:
+    """
+    Fixed lat/lon grid over a set of points (hubs or disaster zones).
+
+    Points are sorted by cell, and each cell is a contiguous slice of the
+    sorted arrays, so a query gathers one slice per latitude row of its
+    bounding box and filters the candidates with a vectorized haversine.
+    Points with NaN coordinates are left out of the index.
+    """
+
+    def __init__(self, lats, lons, cell_deg=1.0):
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        self.cell_deg = cell_deg
+        self.n_lat = math.ceil(180 / cell_deg)
+        self.n_lon = math.ceil(360 / cell_deg)
+        self.size = len(lats)
+
+        ids = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+        cells = self._lat_cell(lats[ids]) * self.n_lon + self._lon_cell(lons[ids])
+        order = np.argsort(cells, kind="stable")
+        self.ids = ids[order]
+        self.lats = lats[self.ids]
+        self.lons = lons[self.ids]
+        self._starts = np.searchsorted(cells[order], np.arange(self.n_lat * self.n_lon + 1))
+
+    def _lat_cell(self, lat):
+        return np.clip(np.floor((np.asarray(lat) + 90) / self.cell_deg), 0, self.n_lat - 1).astype(np.int64)
+
+    def _lon_cell(self, lon):
+        return (np.floor((np.asarray(lon) + 180) / self.cell_deg).astype(np.int64)) % self.n_lon
+
+    def _candidates(self, lat, lon, radius_km):
+        """Positions (into the sorted arrays) of every point inside the query's bounding box."""
+        angular = radius_km / EARTH_RADIUS_KM
+        dlat = math.degrees(angular)
+        lat_lo, lat_hi = lat - dlat, lat + dlat
+        full_ring = lat_lo <= -90 or lat_hi >= 90 or math.sin(angular) >= math.cos(math.radians(lat))
+        if full_ring:
+            lon_spans = [(0, self.n_lon - 1)]
+        else:
+            dlon = math.degrees(math.asin(math.sin(angular) / math.cos(math.radians(lat))))
+            j0, j1 = int(self._lon_cell(lon - dlon)), int(self._lon_cell(lon + dlon))
+            lon_spans = [(j0, j1)] if j0 <= j1 else [(j0, self.n_lon - 1), (0, j1)]
+
+        slices = []
+        for i in range(int(self._lat_cell(lat_lo)), int(self._lat_cell(lat_hi)) + 1):
+            base = i * self.n_lon
+            for j0, j1 in lon_spans:
+                start, end = self._starts[base + j0], self._starts[base + j1 + 1]
+                if end > start:
+                    slices.append(np.arange(start, end))
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def within(self, lat, lon, radius_km, mask=None):
+        """(ids, km) of points within `radius_km`, nearest first. `mask` filters ids."""
+        pos = self._candidates(lat, lon, radius_km)
+        if mask is not None:
+            pos = pos[mask[self.ids[pos]]]
+        dist = haversine_km(lat, lon, self.lats[pos], self.lons[pos])
+        keep = dist <= radius_km
+        pos, dist = pos[keep], dist[keep]
+        order = np.argsort(dist, kind="stable")
+        return self.ids[pos[order]], dist[order]
+
+    def nearest(self, lat, lon, k=1, mask=None):
+        """(ids, km) of the k nearest points, growing the search radius until the answer is exact."""
+        radius = self.cell_deg * KM_PER_DEGREE
+        while True:
+            pos = self._candidates(lat, lon, radius)
+            if mask is not None:
+                pos = pos[mask[self.ids[pos]]]
+            dist = haversine_km(lat, lon, self.lats[pos], self.lons[pos])
+            exhaustive = radius >= math.pi * EARTH_RADIUS_KM
+            if len(pos) >= k or exhaustive:
+                if len(pos) > k:
+                    top = np.argpartition(dist, k - 1)[:k]
+                    pos, dist = pos[top], dist[top]
+                order = np.argsort(dist, kind="stable")
+                pos, dist = pos[order], dist[order]
+                # Anything beyond `radius` may have closer unseen neighbours
+                if exhaustive or not len(dist) or dist[-1] <= radius:
+                    return self.ids[pos], dist
+            radius *= 2
@@ -0,0 +1,259 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from country_catalog import canonical_country
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS centers (
+    id      INTEGER PRIMARY KEY,
+    city    TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    country TEXT NOT NULL,
+    lat     REAL,
+    lon     REAL
+);
+CREATE TABLE IF NOT EXISTS items (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS inventory (
+    center_id INTEGER NOT NULL REFERENCES centers(id),
+    item_id   INTEGER NOT NULL REFERENCES items(id),
+    qty       INTEGER NOT NULL,
+    PRIMARY KEY (center_id, item_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS volunteers (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL,
+    spec    TEXT NOT NULL,
+    contact TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_centers_country ON centers(country);
+CREATE INDEX IF NOT EXISTS idx_inventory_item_qty ON inventory(item_id, qty);
+CREATE INDEX IF NOT EXISTS idx_volunteers_spec ON volunteers(spec COLLATE NOCASE);
+"""
+
+
+class ConnectionPool:
+    """A fixed-size pool of SQLite connections shared across threads."""
+
+    def __init__(self, db_path, size=4):
+        self._idle = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._idle.put(conn)
+        self.size = size
+
+    @contextmanager
+    def connection(self):
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        for _ in range(self.size):
+            self._idle.get().close()
+
+
+class SQLiteBackend:
+    """
+    SQLite storage engine for DatabaseHelper.
+
+    Centers, inventory rows and volunteers live in indexed tables, so callers
+    can ask targeted questions ("all Medical volunteers", "hubs below 500
+    Medical Kits") without materializing the whole grid. Writes are queued
+    and committed in batches of `batch_size` per transaction.
+    """
+
+    def __init__(self, db_path="data/relief_data.db", pool_size=4, batch_size=500):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.pool = ConnectionPool(db_path, pool_size)
+        self._pending_updates = []
+        self._pending_volunteers = []
+        self._pending_lock = threading.Lock()
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(centers)")}
+            for column in ("lat", "lon"):
+                if column not in columns:
+                    # Databases created before hubs were geolocated
+                    conn.execute(f"ALTER TABLE centers ADD COLUMN {column} REAL")
+
+    @contextmanager
+    def transaction(self):
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Full-state save / load (the JSON-compatible interface)
+    # ------------------------------------------------------------------
+    def save_state(self, centers, volunteers):
+        """Replaces the stored grid with `centers` (AidCenter-like objects) and `volunteers`."""
+        records = ({"city": c.city, "country": c.country, "inventory": c.inventory,
+                    "lat": getattr(c, "lat", None), "lon": getattr(c, "lon", None)} for c in centers)
+        self.import_records(records, volunteers)
+
+    def import_records(self, centers, volunteers):
+        """Replaces the stored grid with center dicts in the relief_data.json layout."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM inventory")
+            conn.execute("DELETE FROM centers")
+            conn.execute("DELETE FROM volunteers")
+            for c in centers:
+                self._insert_center(conn, c["city"], c["country"], c.get("inventory"), c.get("lat"), c.get("lon"))
+            conn.executemany(
+                "INSERT INTO volunteers (name, spec, contact) VALUES (?, ?, ?)",
+                ((v["name"], v["spec"], v["contact"]) for v in volunteers),
+            )
+
+    def load_state(self):
+        """Returns the grid in the same shape as DatabaseHelper.load_from_json."""
+        with self.pool.connection() as conn:
+            centers = {}
+            for center_id, city, country, lat, lon in conn.execute(
+                "SELECT id, city, country, lat, lon FROM centers ORDER BY id"
+            ):
+                centers[center_id] = {"city": city, "country": country, "inventory": {}}
+                if lat is not None:
+                    centers[center_id]["lat"], centers[center_id]["lon"] = lat, lon
+            rows = conn.execute(
+                "SELECT i.center_id, it.name, i.qty FROM inventory i JOIN items it ON it.id = i.item_id "
+                "ORDER BY i.center_id, i.item_id"
+            )
+            for center_id, item, qty in rows:
+                centers[center_id]["inventory"][item] = qty
+            volunteers = [
+                {"name": name, "spec": spec, "contact": contact}
+                for name, spec, contact in conn.execute("SELECT name, spec, contact FROM volunteers ORDER BY id")
+            ]
+        return {"centers": list(centers.values()), "volunteers": volunteers}
+
+    def _item_id(self, conn, item):
+        conn.execute("INSERT OR IGNORE INTO items (name) VALUES (?)", (item,))
+        return conn.execute("SELECT id FROM items WHERE name = ?", (item,)).fetchone()[0]
+
+    def _insert_center(self, conn, city, country, inventory, lat=None, lon=None):
+        center_id = conn.execute(
+            "INSERT INTO centers (city, country, lat, lon) VALUES (?, ?, ?, ?)",
+            (city, canonical_country(country), lat, lon),
+        ).lastrowid
+        conn.executemany(
+            "INSERT INTO inventory (center_id, item_id, qty) VALUES (?, ?, ?)",
+            ((center_id, self._item_id(conn, item), qty) for item, qty in (inventory or {}).items()),
+        )
+        return center_id
+
+    def add_center(self, city, country, inventory=None, lat=None, lon=None):
+        with self.transaction() as conn:
+            return self._insert_center(conn, city, country, inventory, lat, lon)
+
+    # ------------------------------------------------------------------
+    # Batched writes
+    # ------------------------------------------------------------------
+    def queue_update(self, city, item, qty):
+        """Buffers an inventory delta; committed with the next batch."""
+        with self._pending_lock:
+            self._pending_updates.append((city, item, qty))
+            full = len(self._pending_updates) >= self.batch_size
+        if full:
+            self.flush()
+
+    def queue_volunteer(self, volunteer):
+        with self._pending_lock:
+            self._pending_volunteers.append(volunteer)
+            full = len(self._pending_volunteers) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Commits every queued write in a single transaction."""
+        with self._pending_lock:
+            updates, self._pending_updates = self._pending_updates, []
+            volunteers, self._pending_volunteers = self._pending_volunteers, []
+        if updates or volunteers:
+            with self.transaction() as conn:
+                self._apply_updates(conn, updates)
+                conn.executemany(
+                    "INSERT INTO volunteers (name, spec, contact) VALUES (?, ?, ?)",
+                    ((v["name"], v["spec"], v["contact"]) for v in volunteers),
+                )
+        return len(updates) + len(volunteers)
+
+    def apply_inventory_updates(self, updates):
+        """Applies an iterable of (city, item, qty) deltas in one transaction."""
+        with self.transaction() as conn:
+            return self._apply_updates(conn, updates)
+
+    def _apply_updates(self, conn, updates):
+        item_ids = {}
+        rows = []
+        for city, item, qty in updates:
+            if item not in item_ids:
+                item_ids[item] = self._item_id(conn, item)
+            rows.append((city, item_ids[item], qty))
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT INTO inventory (center_id, item_id, qty) "
+            "SELECT id, ?2, ?3 FROM centers WHERE city = ?1 "
+            "ON CONFLICT (center_id, item_id) DO UPDATE SET qty = qty + excluded.qty",
+            rows,
+        )
+        return conn.total_changes - before
+
+    # ------------------------------------------------------------------
+    # Indexed queries
+    # ------------------------------------------------------------------
+    def volunteers_by_specialty(self, *specs):
+        """Volunteers whose specialty is any of `specs` (case-insensitive), in registration order."""
+        if not specs:
+            return []
+        placeholders = ", ".join("?" * len(specs))
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT name, spec, contact FROM volunteers WHERE spec COLLATE NOCASE IN ({placeholders}) ORDER BY id",
+                specs,
+            ).fetchall()
+        return [{"name": name, "spec": s, "contact": contact} for name, s, contact in rows]
+
+    def centers_below(self, item, threshold):
+        """Hubs holding less than `threshold` of `item`, as (city, country, qty) tuples."""
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "SELECT c.city, c.country, i.qty FROM inventory i "
+                "JOIN items it ON it.id = i.item_id JOIN centers c ON c.id = i.center_id "
+                "WHERE it.name = ? AND i.qty < ? ORDER BY i.qty",
+                (item, threshold),
+            ).fetchall()
+
+    def centers_in(self, country):
+        with self.pool.connection() as conn:
+            return [city for (city,) in conn.execute(
+                "SELECT city FROM centers WHERE country = ? ORDER BY id", (canonical_country(country),)
+            )]
+
+    def item_totals(self, country=None):
+        sql = ("SELECT it.name, SUM(i.qty) FROM inventory i JOIN items it ON it.id = i.item_id "
+               "JOIN centers c ON c.id = i.center_id")
+        params = ()
+        if country is not None:
+            sql += " WHERE c.country = ?"
+            params = (canonical_country(country),)
+        with self.pool.connection() as conn:
+            return dict(conn.execute(sql + " GROUP BY it.id ORDER BY it.id", params).fetchall())
+
+    def close(self):
+        self.flush()
+        self.pool.close()
@@ -0,0 +1,229 @@
+import os
+import threading
+import time
+
+import numpy as np
+
+# (name, bucket width in seconds, buckets kept): the last hour by minute,
+# the last week by hour and the last year by day
+TIERS = (("minute", 60, 60), ("hour", 3600, 168), ("day", 86400, 366))
+SAMPLE_INTERVAL = 60.0
+INT32 = np.iinfo(np.int32)
+
+
+def _padded(array, shape, fill=0):
+    grown = np.full(shape, fill, dtype=array.dtype)
+    grown[tuple(slice(0, n) for n in array.shape)] = array
+    return grown
+
+
+class HistoryTier:
+    """
+    One resolution of the history: a ring of `slots` buckets, each holding
+    the hub x item stock levels last recorded in that bucket. A new bucket
+    reuses the slot of the oldest, so memory never grows with run time.
+    """
+
+    def __init__(self, name, width, slots, hubs=64, items=0):
+        self.name = name
+        self.width = width
+        self.slots = slots
+        # Time-major, so recording a sample is one contiguous slab write
+        self.levels = np.zeros((slots, hubs, items), dtype=np.int32)
+        self.buckets = np.full(slots, -1, dtype=np.int64)   # bucket held by each slot; -1 when empty
+        self.times = np.zeros(slots)                         # when that bucket was last recorded
+
+    def reserve(self, hubs, items):
+        shape = (self.slots, max(hubs, self.levels.shape[1]), max(items, self.levels.shape[2]))
+        if shape != self.levels.shape:
+            self.levels = _padded(self.levels, shape)
+
+    def record(self, now, levels):
+        bucket = int(now // self.width)
+        slot = bucket % self.slots
+        n, k = levels.shape
+        if self.buckets[slot] != bucket:
+            self.levels[slot] = 0
+        self.levels[slot, :n, :k] = levels
+        self.buckets[slot] = bucket
+        self.times[slot] = now
+
+    def order(self, since=None):
+        """
+        Slots of the tier's current span in time order, optionally only those
+        recorded at or after `since`. Buckets left over from before an idle
+        gap longer than the span are skipped.
+        """
+        slots = np.flatnonzero(self.buckets > self.buckets.max() - self.slots)
+        if since is not None:
+            slots = slots[self.times[slots] >= since]
+        return slots[np.argsort(self.buckets[slots])]
+
+
+class StockHistory:
+    """
+    Bounded history of every hub's per-item stock levels, downsampled into
+    minute / hour / day tiers (see TIERS). Each record() writes the current
+    inventory matrix into the open bucket of every tier, so a tier keeps
+    the last level seen in each of its buckets.
+
+    Memory is fixed per hub: 4 bytes per item per bucket across all tiers,
+    plus the time each hub first appeared (earlier buckets predate it and
+    are left out of its trend).
+    """
+
+    def __init__(self, tiers=TIERS):
+        self.tiers = {name: HistoryTier(name, width, slots) for name, width, slots in tiers}
+        self.items = []
+        self.first_seen = np.full(64, np.inf)
+        self.size = 0          # hubs covered by the latest sample
+        self.samples = 0
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self, hubs, items):
+        if hubs > len(self.first_seen):
+            self.first_seen = _padded(self.first_seen, (max(hubs, 2 * len(self.first_seen)),), np.inf)
+        for tier in self.tiers.values():
+            tier.reserve(len(self.first_seen), items)
+
+    def record(self, store, now=None):
+        """Samples the store's current levels into every tier."""
+        now = time.time() if now is None else now
+        n, n_items = store.size, len(store.items)
+        levels = np.clip(store.quantities[:n, :n_items], INT32.min, INT32.max).astype(np.int32)
+        with self._lock:
+            self._reserve(n, n_items)
+            new = self.first_seen[:n] == np.inf
+            self.first_seen[:n][new] = now
+            for tier in self.tiers.values():
+                tier.record(now, levels)
+            self.items = list(store.items)
+            self.size = max(self.size, n)
+            self.samples += 1
+            self.version += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def series(self, tier, rows=None, since=None):
+        """
+        (times, levels) of one tier in time order. `levels` is
+        samples x hubs x items, or samples x items when `rows` is one row.
+        """
+        with self._lock:
+            history = self.tiers[tier]
+            slots = history.order(since)
+            hubs = slice(0, self.size) if rows is None else rows
+            return history.times[slots], history.levels[:, hubs, :len(self.items)][slots]
+
+    def trends(self, tier, since=None):
+        """
+        Least-squares stock trend of every hub and item over one tier, all
+        hubs at once: (slopes in units per hour, latest levels), each
+        hubs x items. Hubs with fewer than two samples get a slope of 0.
+        """
+        times, levels = self.series(tier, since=since)
+        n = levels.shape[1]
+        if len(times) == 0:
+            return np.zeros((n, len(self.items))), np.zeros((n, len(self.items)), dtype=np.int64)
+        hours = (times - times[-1]) / 3600.0
+        # Samples taken before a hub was added are masked out of its fit
+        present = (times[:, None] >= self.first_seen[None, :n]).astype(np.float64)
+        latest = levels[-1].astype(np.int64)
+        levels = levels.astype(np.float64)
+        if not present.all():
+            levels *= present[:, :, None]
+        sw = present.sum(axis=0)
+        st = hours @ present
+        stt = (hours * hours) @ present
+        sy = levels.sum(axis=0)
+        sty = (hours @ levels.reshape(len(times), -1)).reshape(sy.shape)
+        denominator = sw * stt - st * st
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slopes = (sw[:, None] * sty - st[:, None] * sy) / denominator[:, None]
+        slopes[~np.isfinite(slopes) | (sw < 2)[:, None]] = 0.0
+        return slopes, latest
+
+    def depletion(self, tier="hour", since=None):
+        """
+        Estimated hours until each hub x item runs out at its current
+        trend: 0 when already out, inf when the trend is flat or rising.
+        Returns (hours_left, slopes, levels).
+        """
+        slopes, levels = self.trends(tier, since)
+        hours_left = np.full(slopes.shape, np.inf)
+        falling = slopes < 0
+        hours_left[falling] = levels[falling] / -slopes[falling]
+        hours_left[levels <= 0] = 0.0
+        return hours_left, slopes, levels
+
+    @property
+    def nbytes(self):
+        arrays = [self.first_seen] + [a for t in self.tiers.values() for a in (t.levels, t.buckets, t.times)]
+        return sum(a.nbytes for a in arrays)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path, cities):
+        """Writes the history to an .npz file; hubs are stored by city so rows can be re-mapped on load."""
+        with self._lock:
+            arrays = {
+                "items": np.array(self.items, dtype=str),
+                "cities": np.array(list(cities[:self.size]), dtype=str),
+                "first_seen": self.first_seen[:self.size],
+            }
+            for name, tier in self.tiers.items():
+                arrays[f"{name}_levels"] = tier.levels[:, :self.size, :len(self.items)]
+                arrays[f"{name}_buckets"] = tier.buckets
+                arrays[f"{name}_times"] = tier.times
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, store, tiers=TIERS):
+        """History from save(), re-mapped onto `store`'s rows and item columns; unknown hubs are dropped."""
+        history = cls(tiers)
+        if not os.path.exists(path):
+            return history
+        with np.load(path) as saved:
+            rows = np.array([store.row_of(c) for c in saved["cities"].tolist()], dtype=float)
+            cols = np.array([store.item_id(i) for i in saved["items"].tolist()], dtype=float)
+            rows, cols = np.nan_to_num(rows, nan=-1).astype(np.intp), np.nan_to_num(cols, nan=-1).astype(np.intp)
+            keep_rows, keep_cols = np.flatnonzero(rows >= 0), np.flatnonzero(cols >= 0)
+            history.items = list(store.items)
+            history.size = store.size
+            history._reserve(store.size, len(store.items))
+            history.first_seen[rows[keep_rows]] = saved["first_seen"][keep_rows]
+            for name, tier in history.tiers.items():
+                if f"{name}_levels" not in saved or len(saved[f"{name}_buckets"]) != tier.slots:
+                    continue
+                levels = saved[f"{name}_levels"][:, keep_rows][:, :, keep_cols]
+                tier.levels[:, rows[keep_rows][:, None], cols[keep_cols]] = levels
+                tier.buckets[:] = saved[f"{name}_buckets"]
+                tier.times[:] = saved[f"{name}_times"]
+                history.samples = max(history.samples, int(np.count_nonzero(tier.buckets >= 0)))
+        return history
+
+
+def start_sampler(shared, interval=SAMPLE_INTERVAL, save_every=60):
+    """
+    Records a history sample from a SharedEngine every `interval` seconds
+    on a daemon thread, saving the history file every `save_every` samples.
+    """
+    def run():
+        samples = 0
+        while True:
+            with shared.read() as engine:
+                engine.record_history()
+                samples += 1
+                if samples % save_every == 0:
+                    engine.save_history()
+            time.sleep(interval)
+
+    sampler = threading.Thread(target=run, name="unitygrid-history", daemon=True)
+    sampler.start()
+    return sampler
@@ -0,0 +1,78 @@
+import random
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from country_catalog import LEGACY_NAMES
+
+# (item, low, high) ranges of the mock national stockpiles
+SYNTHETIC_ITEMS = (
+    ("Potable Water (L)", 10000, 500000),
+    ("Trauma Kits", 500, 10000),
+    ("MREs (Meals)", 2000, 100000),
+    ("Field Tents", 100, 5000),
+    ("Power Generators", 10, 500),
+)
+
+
+def generate(countries):
+    """
+    Mock stock levels for many countries in one pass, as a (countries x items)
+    int64 matrix. Each country draws from its own private random.Random seeded
+    with its name (its pre-rename name for renamed catalog entries), so the
+    numbers match every earlier release and the process-global RNG is never
+    touched.
+    """
+    matrix = np.empty((len(countries), len(SYNTHETIC_ITEMS)), dtype=np.int64)
+    for row, country in enumerate(countries):
+        rng = random.Random(LEGACY_NAMES.get(country, country))
+        matrix[row] = [rng.randint(low, high) for _, low, high in SYNTHETIC_ITEMS]
+    return matrix
+
+
+class SyntheticInventory:
+    """
+    LRU-memoized synthetic inventories. `prime` fills the cache for a whole
+    catalog at once; misses are generated in a single batch.
+    """
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.items = [item for item, _, _ in SYNTHETIC_ITEMS]
+        self._cache = OrderedDict()  # country -> tuple of quantities
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def prime(self, countries):
+        self.get_many(countries)
+
+    def get_many(self, countries):
+        """Returns {country: {item: qty}} for every requested country."""
+        countries = list(countries)
+        with self._lock:
+            missing = [c for c in dict.fromkeys(countries) if c not in self._cache]
+            self.misses += len(missing)
+            self.hits += len(countries) - len(missing)
+            if missing:
+                for country, row in zip(missing, generate(missing).tolist()):
+                    self._cache[country] = tuple(row)
+            rows = {}
+            for country in countries:
+                self._cache.move_to_end(country)
+                rows[country] = self._cache[country]
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return {country: dict(zip(self.items, row)) for country, row in rows.items()}
+
+    def get(self, country):
+        return self.get_many((country,))[country]
+
+    def invalidate(self, country=None):
+        """Drops one country (or everything) so the next read regenerates it."""
+        with self._lock:
+            if country is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(country, None)
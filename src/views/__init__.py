@@ -0,0 +1,71 @@
+"""
+Page modules for app.py. Each page lives in its own module with a
+`render()` function and is imported the first time it is visited, so a
+session that only opens Home never loads plotly, pandas or the engine.
+"""
+import importlib
+
+import streamlit as st
+
+import instrumentation
+from render_cache import RenderCache
+
+# Page name (st.session_state.page) -> module under views/
+PAGES = {
+    "Home": "home",
+    "Awareness": "awareness",
+    "Dashboard": "dashboard",
+    "Precautionary": "precautionary",
+    "Contacts": "contacts",
+    "Volunteer": "volunteer",
+    "Diagnostics": "diagnostics",
+}
+
+
+def render(page):
+    importlib.import_module(f"views.{PAGES.get(page, 'home')}").render()
+
+
+@st.cache_resource
+def get_shared_engine():
+    # One engine for the whole server process; sessions only keep view state.
+    # Imported here so the engine (and numpy) load on the first page that needs them.
+    from models import UnityGridEngine
+    from shared_engine import SharedEngine
+    from stock_history import start_sampler
+    engine = UnityGridEngine()
+    # Built before sessions share the engine, so readers never write to it
+    engine.live
+    engine.history
+    shared = SharedEngine(engine)
+    start_sampler(shared)
+    return shared
+
+
+def shared_engine():
+    """The process-wide engine, plus this session's staleness check. Call once per rerun."""
+    engine = get_shared_engine()
+    if 'engine_version' not in st.session_state:
+        st.session_state.engine_version = engine.version
+    # Sessions hold only view state; one integer compare says whether another session changed the grid
+    st.session_state.engine_stale = engine.changed_since(st.session_state.engine_version)
+    st.session_state.engine_version = engine.version
+    return engine
+
+
+@st.cache_resource
+def get_registration_queue():
+    # One durable queue per server process; its committer drains into the shared engine
+    from registration_queue import RegistrationQueue, queue_path
+    grid = get_shared_engine()
+    with grid.read() as engine:
+        path = queue_path(engine.data_file, "app")
+    return RegistrationQueue(grid, path)
+
+
+@st.cache_resource
+def get_render_cache():
+    # Figures and tables survive reruns and are shared by every session
+    cache = RenderCache()
+    instrumentation.REGISTRY.register_collector("render_cache", cache.stats)
+    return cache
@@ -0,0 +1,95 @@
+import os
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from event_ingest import DEFAULT_AGGREGATES, load_aggregates
+from views import get_render_cache
+
+
+# Cached figure builders: each runs only on a render-cache miss
+def awareness_data_version():
+    # Rollups from src/event_ingest.py replace the mock series once they exist
+    return os.path.getmtime(DEFAULT_AGGREGATES) if os.path.exists(DEFAULT_AGGREGATES) else 0
+
+
+def build_trend_chart():
+    aggregates = load_aggregates(DEFAULT_AGGREGATES)
+    if aggregates is not None and aggregates.rows:
+        trends = aggregates.trends()
+        df_trends = pd.DataFrame({
+            "Year": [y for y, _, _ in trends],
+            "Count": [n for _, _, n in trends],
+            "Type": [t for _, t, _ in trends],
+        })
+    else:
+        # Advanced Mock Data Generation
+        years = [2020, 2021, 2022, 2023, 2024, 2025]
+        df_trends = pd.DataFrame({
+            "Year": years * 3,
+            "Count": [
+                45, 48, 52, 60, 75, 82,   # Floods
+                30, 35, 33, 40, 55, 65,   # Storms
+                12, 10, 15, 14, 22, 18    # Wildfires
+            ],
+            "Type": ["Floods"]*6 + ["Storms"]*6 + ["Wildfires"]*6
+        })
+
+    fig_area = px.area(df_trends, x="Year", y="Count", color="Type", 
+                      color_discrete_sequence=['#263E3A', '#945031', '#D4AC0D'],
+                      labels={"Count": "Recorded Events"},
+                      title="Global Disaster Frequency Trend")
+    fig_area.update_layout(hovermode="x unified", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)")
+    return fig_area
+
+
+def build_region_chart():
+    # Donut Chart for Impact
+    aggregates = load_aggregates(DEFAULT_AGGREGATES)
+    if aggregates is not None and aggregates.rows:
+        impact = aggregates.regional_impact()
+        df_pie = pd.DataFrame({
+            "Region": list(impact),
+            "Affected (M)": [n / 1_000_000 for n in impact.values()]
+        })
+    else:
+        df_pie = pd.DataFrame({
+            "Region": ["Asia Pacific", "Africa", "Americas", "Europe", "Middle East"],
+            "Affected (M)": [45, 25, 15, 5, 10]
+        })
+    fig_donut = px.pie(df_pie, values="Affected (M)", names="Region", hole=0.5,
+                       color_discrete_sequence=px.colors.sequential.RdBu,
+                       title="Human Impact Distribution (%)")
+    fig_donut.update_traces(textinfo='percent+label')
+    return fig_donut
+
+
+def render():
+    # ----------------- AWARENESS PAGE (UPDATED) -----------------
+    render_cache = get_render_cache()
+    st.title("📊 Global Awareness Monitor")
+    st.markdown("Data-driven insights into the frequency, cost, and human impact of natural disasters (2020-2025).")
+    
+    # TOP KPIs
+    k1, k2, k3, k4 = st.columns(4)
+    k1.metric("Global Events (2024)", "421", "+12% YoY", help="Recorded natural disasters causing >$1M damage")
+    k2.metric("Economic Cost", "$310B", "Critical", delta_color="inverse", help="Total adjusted economic loss")
+    k3.metric("Displaced Persons", "8.4M", "High", delta_color="inverse")
+    k4.metric("Climate Anomalies", "19", "Record High")
+    
+    st.markdown("---")
+
+    col_a1, col_a2 = st.columns([1.5, 1])
+    
+    with col_a1:
+        st.subheader("📈 Rising Frequency by Disaster Type")
+        fig_area = render_cache.get_or_build("awareness_trends", awareness_data_version(), build_trend_chart)
+        st.plotly_chart(fig_area, use_container_width=True)
+        
+    with col_a2:
+        st.subheader("🌍 Impact by Region")
+        fig_donut = render_cache.get_or_build("awareness_regions", awareness_data_version(), build_region_chart)
+        st.plotly_chart(fig_donut, use_container_width=True)
+
+    st.info("💡 **Insight:** While frequency is rising globally, effective Early Warning Systems (EWS) in Asia have reduced mortality rates by 40% despite higher event counts.")
@@ -0,0 +1,23 @@
+import pandas as pd
+import streamlit as st
+
+from emergency_registry import CONTACTS, EmergencyRegistry
+from views import get_render_cache
+
+
+def build_contacts_table():
+    contact_list = []
+    for country, numbers in EmergencyRegistry().contacts.items():
+        row = {"Country": country}
+        row.update(numbers)
+        contact_list.append(row)
+    return pd.DataFrame(contact_list).set_index("Country")
+
+
+def render():
+    # ----------------- CONTACTS -----------------
+    render_cache = get_render_cache()
+    st.title("☎️ Emergency Hotlines")
+    
+    contacts_df = render_cache.get_or_build("contacts_table", len(CONTACTS), build_contacts_table)
+    st.dataframe(contacts_df, use_container_width=True)
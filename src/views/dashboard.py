@@ -0,0 +1,103 @@
+from datetime import datetime
+from itertools import islice
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from views import get_render_cache, shared_engine
+
+
+def build_threat_map(zones):
+    fig = go.Figure(go.Scattergeo(
+        lat=[z['lat'] for z in zones], lon=[z['lon'] for z in zones],
+        text=[f"{z['type']} ({z['risk']})" for z in zones],
+        mode='markers', 
+        marker=dict(size=[z['radius']*1.5 for z in zones], color=[z['color'] for z in zones], opacity=0.8)
+    ))
+    fig.update_geos(projection_type="natural earth", showland=True, landcolor="#1B263B", showocean=True, oceancolor="#0D131E", showcountries=True, countrycolor="#555")
+    fig.update_layout(height=500, margin={"r":0,"t":0,"l":0,"b":0}, paper_bgcolor="rgba(0,0,0,0)")
+    return fig
+
+
+def build_trend_chart(times, series):
+    stamps = [datetime.fromtimestamp(t) for t in times]
+    fig = go.Figure([go.Scatter(x=stamps, y=levels, mode="lines+markers", name=item) for item, levels in series.items()])
+    fig.update_layout(height=320, margin={"r":0,"t":10,"l":0,"b":0}, paper_bgcolor="rgba(0,0,0,0)", legend=dict(orientation="h"))
+    return fig
+
+
+def build_forecast_table(forecast):
+    return [
+        {"Hub": f"{f['city']}, {f['country']}", "Item": f["item"], "Left": f["level"],
+         "Per Hour": round(f["per_hour"], 1), "Empty In (h)": round(f["hours_left"], 1)}
+        for f in forecast
+    ]
+
+
+def render():
+    # ----------------- DASHBOARD (Global Ops) -----------------
+    render_cache = get_render_cache()
+    grid = shared_engine()
+    st.title("🌍 Global Operations System")
+    
+    # Live aggregates: constant-time reads however many hubs and volunteers there are
+    with grid.read() as engine:
+        kpis = engine.live_snapshot(detail=False)
+        zones = engine.get_disaster_zones()
+    low_stock = sum(kpis["low_stock"].values())
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Active Regions", f"{kpis['active_countries']:,}", f"{kpis['hubs']:,} Hubs", delta_color="off")
+    m2.metric("Disaster Zones", f"{len(zones):,}", f"{low_stock:,} Low-Stock Lines", delta_color="inverse")
+    m3.metric("Relief Teams", f"{kpis['volunteers']:,}", f"{len(kpis['specialties']):,} Specialties", delta_color="off")
+    m4.metric("Aid in Stock", f"{kpis['total_units']:,} units", f"+{kpis['received']:,} Received")
+    
+    st.markdown("---")
+
+    col_map, col_inv = st.columns([2, 1])
+    
+    with col_map:
+        st.subheader("📍 Live Threat Map")
+        # The map only shows the zones: supply updates must not rebuild it
+        zone_key = tuple(tuple(sorted(z.items())) for z in zones)
+        fig = render_cache.get_or_build("threat_map", zone_key, lambda: build_threat_map(zones))
+        st.plotly_chart(fig, use_container_width=True)
+        
+    with col_inv:
+        st.subheader("📦 Inventory Database")
+        with grid.read() as engine:
+            c_cont = st.selectbox("Select Continent", list(engine.world_data.keys()))
+            c_coun = st.selectbox("Select Country", engine.world_data[c_cont])
+            inv = engine.get_inventory(c_coun)
+        st.success(f"Logistics Hub: **{c_coun}**")
+        for item, count in inv.items():
+            st.progress(min(count/100000, 1.0), text=f"{item}: {count:,}")
+
+    st.markdown("---")
+    st.subheader("📈 Stock Trends & Depletion Forecast")
+    tier = st.radio("Resolution", ["minute", "hour", "day"], index=1, horizontal=True, format_func=str.title)
+    with grid.read() as engine:
+        history_version = engine.history.version
+        forecast = render_cache.get_or_build(
+            "depletion_forecast", history_version, lambda: engine.depletion_forecast(tier, limit=10), {"tier": tier}
+        )
+        # Hubs about to run out first, then the rest of the grid (capped for the picker)
+        hubs = list(dict.fromkeys([f["city"] for f in forecast] + list(islice(engine.store.cities, 200))))
+
+    col_trend, col_forecast = st.columns([2, 1])
+    with col_trend:
+        hub = st.selectbox("Select Hub", hubs) if hubs else None
+        with grid.read() as engine:
+            times, series = engine.stock_series(hub, tier) if hub else ([], {})
+        if len(times) < 2:
+            st.info("Trends appear once a hub has two samples at this resolution (one is recorded every minute).")
+        else:
+            fig = render_cache.get_or_build(
+                "stock_trend", history_version, lambda: build_trend_chart(times, series), {"hub": hub, "tier": tier}
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    with col_forecast:
+        st.caption("Projected to run out soonest")
+        if forecast:
+            st.dataframe(build_forecast_table(forecast), hide_index=True, use_container_width=True)
+        else:
+            st.success("No hub is trending towards empty.")
@@ -0,0 +1,34 @@
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from views import get_render_cache
+
+
+def render():
+    # ----------------- DIAGNOSTICS -----------------
+    render_cache = get_render_cache()
+    st.title("🩺 Diagnostics")
+    if not instrumentation.ENABLED:
+        st.info("Instrumentation is off. Start the app with UNITYGRID_METRICS=1 to record latencies.")
+
+    operations = instrumentation.REGISTRY.operations()
+    st.subheader("Operations")
+    if operations:
+        st.dataframe(pd.DataFrame(operations).round(3), use_container_width=True, hide_index=True)
+    else:
+        st.caption("No instrumented calls recorded yet.")
+
+    c1, c2 = st.columns(2)
+    with c1:
+        st.subheader("Bytes Written")
+        written = dict(instrumentation.REGISTRY.bytes_written)
+        st.dataframe(pd.DataFrame({"Target": list(written), "Bytes": list(written.values())}),
+                     use_container_width=True, hide_index=True)
+    with c2:
+        st.subheader("Render Cache")
+        st.json(render_cache.stats())
+
+    if st.button("Write Prometheus Dump"):
+        path = instrumentation.REGISTRY.write_prometheus()
+        st.success(f"Metrics written to {path}")
@@ -0,0 +1,37 @@
+import streamlit as st
+
+
+def render():
+    # ----------------- HOME PAGE -----------------
+    col_img, col_txt = st.columns([1, 1.2])
+    
+    with col_img:
+        st.image("https://images.unsplash.com/photo-1593113598332-cd288d649433?ixlib=rb-4.0.3&auto=format&fit=crop&w=1170&q=80", 
+                 caption="UnityGrid: Connecting Resources to Needs", use_container_width=True)
+        
+    with col_txt:
+        st.markdown(f"<div class='hero-quote'>HUMANITY WITHOUT BORDERS</div>", unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class='hero-text'>
+        A global humanitarian logistics system designed to optimize disaster relief and volunteer deployment 
+        across international hubs, including <b>Türkiye</b>.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button(" ABOUT PROJECT"):
+             with st.expander("UnityGrid: Global Crisis Response & Resource Optimizer", expanded=True):
+                st.markdown("""
+                ### 🏮 The Vision
+                Disasters do not respect borders. **UnityGrid** was built on the principle of "Global Solidarity," providing a standardized platform for tracking life-saving supplies and specialized human capital. This project serves as a prototype for how Management Information Systems (MIS) can be leveraged to minimize human suffering during environmental crises.
+
+                ### 🚀 Impactful Capabilities
+                * **Cross-Border Logistics:** Pre-configured with international hubs, including high-priority zones in **Türkiye** (Antakya, Istanbul) and global cities (Tokyo, Beirut).
+                * **Specialist Deployment:** A rapid-search algorithm to filter volunteers by mission-critical skills like "Medical" or "Rescue."
+                * **Inventory Resilience:** Object-Oriented architecture allows for real-time scaling of aid centers as new crisis zones emerge.
+
+                ### 🛠️ Technical Profile
+                * **Architecture:** Object-Oriented Programming (OOP) using Python.
+                * **Naming Standards:** Strict adherence to **PascalCase** for classes (`AidCenter`, `UnityGridEngine`) to ensure enterprise-level readability.
+                * **Data Logic:** Implements dictionary-based inventory mapping for **O(1)** efficiency in resource updates.
+                """)
@@ -0,0 +1,87 @@
+import streamlit as st
+
+
+def render():
+    # ----------------- PRECAUTIONARY (UPDATED) -----------------
+    st.title("🛡️ Frontline Safety Protocols")
+    st.markdown("Comprehensive survival guides structured by event phase: **Prepare, Survive, Recover**.")
+    
+    # 1. EARTHQUAKE
+    with st.expander("🔴 Earthquake (Seismic Activity)", expanded=True):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.markdown("#### 1. Prepare")
+            st.markdown("""
+            * **Secure Heavy Items:** Anchor bookshelves and TVs to walls.
+            * **Go-Bag:** Pack water, flashlight, and first aid.
+            * **Identify Safe Spots:** Under sturdy tables or interior walls.
+            """)
+        with c2:
+            st.markdown("#### 2. Survive (During)")
+            st.markdown("""
+            * **DROP** to your hands and knees.
+            * **COVER** your head and neck. Crawl under shelter.
+            * **HOLD ON** until the shaking stops completely.
+            * **DO NOT** run outside during shaking.
+            """)
+        with c3:
+            st.markdown("#### 3. Recover (After)")
+            st.markdown("""
+            * **Check for Gas Leaks:** Smell gas? Leave immediately.
+            * **Aftershocks:** Expect smaller tremors.
+            * **Tsunami Risk:** If near coast, move to high ground.
+            """)
+
+    # 2. FLOOD
+    with st.expander("🌊 Flash Floods & Storm Surge"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.markdown("#### 1. Prepare")
+            st.markdown("""
+            * **Know Your Zone:** Are you in a low-lying area?
+            * **Elevate Utilities:** Move critical electronics to higher floors.
+            * **Waterproof Documents:** Seal ID and insurance papers.
+            """)
+        with c2:
+            st.markdown("#### 2. Survive (During)")
+            st.markdown("""
+            * **Turn Around, Don't Drown:** 6 inches of water can stall a car.
+            * **Evacuate:** Follow official orders immediately.
+            * **High Ground:** Move to the roof only if trapped (signal for help).
+            """)
+        with c3:
+            st.markdown("#### 3. Recover (After)")
+            st.markdown("""
+            * **Avoid Floodwater:** It may contain sewage or live wires.
+            * **Dry Out:** Mold grows within 24-48 hours.
+            * **Disinfect:** Clean everything touched by floodwater.
+            """)
+
+    # 3. WILDFIRE
+    with st.expander("🔥 Wildfires"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.markdown("#### 1. Prepare")
+            st.markdown("""
+            * **Defensible Space:** Clear 30ft of brush around home.
+            * **N95 Masks:** Stock up for smoke protection.
+            * **Evacuation Route:** Plan 2 ways out of your neighborhood.
+            """)
+        with c2:
+            st.markdown("#### 2. Survive (During)")
+            st.markdown("""
+            * **Leave Early:** Don't wait for flames to be visible.
+            * **Close Windows:** Shut vents to keep sparks out.
+            * **Low Visibility:** Drive slowly with headlights on.
+            """)
+        with c3:
+            st.markdown("#### 3. Recover (After)")
+            st.markdown("""
+            * **Hot Spots:** Watch for ground that is still smoking.
+            * **Check Air Quality:** Wait for official 'Safe' levels before returning.
+            * **Ash Safety:** Wear gloves/masks when cleaning.
+            """)
+    
+    # 4. EXTREME HEAT
+    with st.expander("☀️ Extreme Heat Wave"):
+        st.markdown("**Core Rule:** Hydrate before you feel thirsty. Check on elderly neighbors/relatives. Keep blinds closed during the day.")
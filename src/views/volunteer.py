@@ -0,0 +1,34 @@
+import re
+
+import streamlit as st
+
+from registration_queue import DUPLICATE
+from views import get_registration_queue
+
+EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def render():
+    # ----------------- VOLUNTEER -----------------
+    st.title("🤝 Join the Grid")
+    
+    with st.form("volunteer_form"):
+        c1, c2 = st.columns(2)
+        with c1:
+            name = st.text_input("Full Name")
+            email = st.text_input("Email Address")
+        with c2:
+            skill = st.selectbox("Primary Skill", ["Medical", "Search & Rescue", "Logistics", "IT Support"])
+            
+        submitted = st.form_submit_button("Submit Application")
+        if submitted:
+            if not name.strip() or not EMAIL.match(email.strip()):
+                st.error("Please enter your full name and a valid email address.")
+                return
+            # Durably queued and deduplicated here; the roster itself is updated in batches
+            status = get_registration_queue().submit(name, skill, email)
+            if status == DUPLICATE:
+                st.warning(f"{email.strip()} is already registered with the Grid.")
+            else:
+                st.balloons()
+                st.success(f"Thank you, {name.strip()}. You have been added to the {skill} roster.")
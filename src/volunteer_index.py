@@ -0,0 +1,126 @@
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from itertools import chain
+
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_specialty(spec):
+    """'Search & Rescue ' -> 'search rescue' (accent, case and punctuation insensitive)."""
+    folded = unicodedata.normalize("NFKD", spec.casefold())
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return " ".join(_SEPARATORS.split(folded)).strip()
+
+
+def bounded_edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class VolunteerIndex:
+    """
+    Inverted index from normalized specialties to volunteer positions.
+
+    Query cost depends on the (small) specialty vocabulary, never on the
+    number of registered volunteers:
+      - exact:  'medical'         -> Medical
+      - tokens: 'rescue'          -> Rescue, Search & Rescue
+      - prefix: 'rescu', 'log'    -> Rescue, Logistics
+      - typos:  'medcal', 'resque' -> Medical, Rescue
+    """
+
+    def __init__(self, volunteers=()):
+        self._postings = {}     # normalized specialty -> [volunteer positions]
+        self._token_specs = {}  # token -> {normalized specialties}
+        self._tokens = []       # sorted token vocabulary for prefix search
+        self.size = 0
+        for volunteer in volunteers:
+            self.add(volunteer)
+
+    def add(self, volunteer, position=None):
+        """Indexes one volunteer record; `position` defaults to the next slot."""
+        if position is None:
+            position = self.size
+        key = self.add_specialty(volunteer.get("spec", ""))
+        self._postings[key].append(position)
+        self.size = max(self.size, position + 1)
+
+    def add_specialty(self, spec):
+        """Adds `spec` to the searchable vocabulary (no postings) and returns its normalized key."""
+        key = normalize_specialty(spec)
+        if key not in self._postings:
+            self._postings[key] = []
+            for token in key.split():
+                specs = self._token_specs.get(token)
+                if specs is None:
+                    specs = self._token_specs[token] = set()
+                    insort(self._tokens, token)
+                specs.add(key)
+        return key
+
+    def rebuild(self, volunteers):
+        self.__init__(volunteers)
+
+    def specialties(self):
+        return list(self._postings)
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+    def _prefixed(self, prefix):
+        start = bisect_left(self._tokens, prefix)
+        matches = []
+        for token in self._tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            matches.append(token)
+        return matches
+
+    def _fuzzy(self, token):
+        limit = 1 if len(token) <= 5 else 2
+        return [t for t in self._tokens if bounded_edit_distance(token, t, limit) <= limit]
+
+    def _specs_for_token(self, token, fuzzy):
+        specs = set(self._token_specs.get(token, ()))
+        for t in self._prefixed(token):
+            specs |= self._token_specs[t]
+        if not specs and fuzzy:
+            for t in self._fuzzy(token):
+                specs |= self._token_specs[t]
+        return specs
+
+    def match(self, query, fuzzy=True):
+        """Returns the normalized specialties that satisfy `query`."""
+        key = normalize_specialty(query)
+        if not key:
+            return []
+        if key in self._postings:
+            matched = {key}
+        else:
+            matched = set()
+
+        per_token = [self._specs_for_token(token, fuzzy) for token in key.split()]
+        # 1. Specialties containing every query token ('rescue' -> 'search rescue')
+        matched |= set.intersection(*per_token)
+        # 2. Otherwise any overlapping token ('search rescue' -> 'rescue')
+        if not matched:
+            matched = set.union(*per_token)
+        return sorted(matched)
+
+    def search(self, query, fuzzy=True):
+        """Volunteer positions matching `query`, in registration order per specialty."""
+        specs = self.match(query, fuzzy)
+        if len(specs) == 1:
+            return list(self._postings[specs[0]])
+        return sorted(chain.from_iterable(self._postings[s] for s in specs))
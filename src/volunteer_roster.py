@@ -0,0 +1,171 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from volunteer_index import normalize_specialty
+
+
+class PackedStrings(Sequence):
+    """
+    Append-only strings packed into one UTF-8 buffer. String i is
+    heap[offsets[i]:offsets[i + 1]], the layout of a binary-snapshot string
+    column, so a snapshot can write the buffers out as they are.
+    """
+
+    def __init__(self, capacity=64):
+        self.heap = bytearray()
+        # 32-bit offsets until the buffer outgrows 4 GiB
+        self.offsets = np.zeros(capacity + 1, dtype=np.uint32)
+        self.size = 0
+
+    def _reserve(self, size, heap_bytes):
+        if heap_bytes > np.iinfo(self.offsets.dtype).max:
+            self.offsets = self.offsets.astype(np.int64)
+        if size + 1 > len(self.offsets):
+            grown = np.zeros(max(size + 1, 2 * len(self.offsets)), dtype=self.offsets.dtype)
+            grown[:self.size + 1] = self.offsets[:self.size + 1]
+            self.offsets = grown
+
+    def append(self, text):
+        data = text.encode("utf-8")
+        self._reserve(self.size + 1, len(self.heap) + len(data))
+        self.heap += data
+        self.size += 1
+        self.offsets[self.size] = len(self.heap)
+
+    def extend(self, texts):
+        encoded = [text.encode("utf-8") for text in texts]
+        n = len(encoded)
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=n)
+        self._reserve(self.size + n, len(self.heap) + int(lengths.sum()))
+        ends = self.offsets[self.size + 1:self.size + 1 + n]
+        ends[:] = np.cumsum(lengths) + len(self.heap)
+        self.heap += b"".join(encoded)
+        self.size += n
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.size))]
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError(i)
+        return self.heap[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+    def __iter__(self):
+        bounds = self.offsets[:self.size + 1].tolist()
+        heap = bytes(self.heap)
+        for start, end in zip(bounds, bounds[1:]):
+            yield heap[start:end].decode("utf-8")
+
+    def column(self):
+        """(offsets, heap) bytes in the binary snapshot's string-column format."""
+        return self.offsets[:self.size + 1].astype("<u8").tobytes(), bytes(self.heap)
+
+    @property
+    def nbytes(self):
+        return len(self.heap) + self.offsets.nbytes
+
+
+class VolunteerRoster(Sequence):
+    """
+    Struct-of-arrays volunteer roster: the UTF-8 text plus 10 bytes per
+    volunteer, instead of a dict and three str objects each.
+
+    - Specialties are interned: one small integer code per volunteer, and
+      every distinct specialty string is stored once.
+    - Names and contacts live in PackedStrings buffers.
+    - It still behaves like the old list of dicts: len(), indexing,
+      iteration and append() all speak {"name", "spec", "contact"} records
+      (built on access, so editing one does not change the roster).
+    """
+
+    def __init__(self, volunteers=()):
+        self.names = PackedStrings()
+        self.contacts = PackedStrings()
+        self.specialties = []       # interned specialty strings; index = code
+        self._codes_by_spec = {}
+        self._normalized = []       # normalize_specialty() of each code
+        self.codes = np.zeros(64, dtype=np.uint16)
+        self.size = 0
+        self.extend(volunteers)
+
+    def spec_code(self, spec, create=True):
+        code = self._codes_by_spec.get(spec)
+        if code is None and create:
+            code = self._codes_by_spec[spec] = len(self.specialties)
+            self.specialties.append(spec)
+            self._normalized.append(normalize_specialty(spec))
+            if code > np.iinfo(self.codes.dtype).max:
+                self.codes = self.codes.astype(np.uint32)
+        return code
+
+    def _reserve(self, size):
+        if size > len(self.codes):
+            grown = np.zeros(max(size, 2 * len(self.codes)), dtype=self.codes.dtype)
+            grown[:self.size] = self.codes[:self.size]
+            self.codes = grown
+
+    # ------------------------------------------------------------------
+    # List-like API
+    # ------------------------------------------------------------------
+    def append(self, volunteer):
+        code = self.spec_code(volunteer["spec"])
+        self._reserve(self.size + 1)
+        self.codes[self.size] = code
+        self.names.append(volunteer["name"])
+        self.contacts.append(volunteer["contact"])
+        self.size += 1
+
+    def extend(self, volunteers):
+        volunteers = list(volunteers)
+        if not volunteers:
+            return
+        codes = [self.spec_code(v["spec"]) for v in volunteers]
+        self._reserve(self.size + len(volunteers))
+        self.codes[self.size:self.size + len(volunteers)] = codes
+        self.names.extend(v["name"] for v in volunteers)
+        self.contacts.extend(v["contact"] for v in volunteers)
+        self.size += len(volunteers)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.size))]
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError(i)
+        return {"name": self.names[i], "spec": self.specialties[self.codes[i]], "contact": self.contacts[i]}
+
+    def __iter__(self):
+        specialties = self.specialties
+        for name, code, contact in zip(self.names, self.codes[:self.size].tolist(), self.contacts):
+            yield {"name": name, "spec": specialties[code], "contact": contact}
+
+    # ------------------------------------------------------------------
+    # Vectorized specialty filters
+    # ------------------------------------------------------------------
+    def specialty_mask(self, normalized_specs):
+        """Boolean mask of volunteers whose normalized specialty is in `normalized_specs`."""
+        wanted = set(normalized_specs)
+        codes = [code for code, key in enumerate(self._normalized) if key in wanted]
+        return np.isin(self.codes[:self.size], codes)
+
+    def specialties_for(self, normalized_specs):
+        """The interned spellings of `normalized_specs` ('search rescue' -> 'Search & Rescue', 'search-rescue')."""
+        wanted = set(normalized_specs)
+        return [spec for spec, key in zip(self.specialties, self._normalized) if key in wanted]
+
+    def with_specialties(self, normalized_specs):
+        """Positions matching `normalized_specs`, in registration order."""
+        return np.flatnonzero(self.specialty_mask(normalized_specs)).tolist()
+
+    @property
+    def nbytes(self):
+        return self.names.nbytes + self.contacts.nbytes + self.codes.nbytes